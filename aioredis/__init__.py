@@ -1,27 +1,478 @@
 # Author: Roopesh Kumar Reddy Kaipa
 # Date: 24/11/2025
 import asyncio
-from typing import Optional
+import fnmatch
+import heapq
+import random
+import sys
+import time
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
 
+# How often the background sweeper removes expired keys, and how many it
+# removes per pass before yielding back to the event loop.
+SWEEP_INTERVAL_SECONDS = 1.0
+SWEEP_BATCH_SIZE = 1000
+
+EVICTION_POLICIES = ("noeviction", "volatile-ttl", "allkeys-lru", "allkeys-lfu")
+# Keys the app relies on to reject revoked tokens. They are never evicted:
+# when no other key can make room, the write fails instead (fail closed).
+PROTECTED_PREFIXES = ("blacklist:", "revoked_before:")
+# Rough per-key bookkeeping cost added to the key and value sizes
+ENTRY_OVERHEAD = 64
+# Redis' logarithmic LFU counter: new keys start at LFU_INIT_VAL, and the
+# counter decays by one for every LFU_DECAY_SECONDS without an access.
+LFU_INIT_VAL = 5
+LFU_LOG_FACTOR = 10
+LFU_DECAY_SECONDS = 60.0
+
+
+class RedisError(Exception):
+    pass
+
+
+class ResponseError(RedisError):
+    pass
+
+
+class _KeySet:
+    """Set of keys with O(1) add, discard and uniform random sampling."""
 
-class _InMemoryRedis:
     def __init__(self):
-        self._store = {}
+        self._keys: List[str] = []
+        self._index: Dict[str, int] = {}
+
+    def add(self, key: str) -> None:
+        if key not in self._index:
+            self._index[key] = len(self._keys)
+            self._keys.append(key)
+
+    def discard(self, key: str) -> None:
+        index = self._index.pop(key, None)
+        if index is None:
+            return
+        last = self._keys.pop()
+        if index < len(self._keys):
+            self._keys[index] = last
+            self._index[last] = index
+
+    def sample(self, count: int) -> List[str]:
+        if not self._keys:
+            return []
+        return [random.choice(self._keys) for _ in range(count)]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._index
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+
+class _InMemoryRedis:
+    """
+    Minimal in-process stand-in for the Redis commands the app uses.
+
+    Key expiry follows Redis: expired keys are removed lazily when they are
+    read, and a periodic sweeper removes the ones nobody reads. Deadlines
+    live in a min-heap, so scheduling costs O(log n) and memory stays
+    proportional to the keys that carry a TTL; no task is parked per key.
+
+    ``maxmemory`` (bytes, 0 for unlimited) caps the estimated size of the
+    data set. Writes that would exceed it first evict keys chosen by
+    ``maxmemory_policy``, picking the best of ``maxmemory_samples`` random
+    keys like Redis' approximated LRU/LFU. When nothing can be evicted the
+    write raises ``ResponseError`` (OOM).
+    """
+
+    def __init__(
+        self,
+        clock: Callable[[], float] = time.monotonic,
+        sweep_interval: float = SWEEP_INTERVAL_SECONDS,
+        maxmemory: int = 0,
+        maxmemory_policy: str = "noeviction",
+        maxmemory_samples: int = 5,
+    ):
+        self._store: Dict[str, Any] = {}
         self._locks = {}
+        self._clock = clock
+        self._sweep_interval = sweep_interval
+        self._expires: Dict[str, float] = {}
+        self._heap: List[Tuple[float, str]] = []
+        self._sweeper: Optional[asyncio.Task] = None
+        self._sizes: Dict[str, int] = {}
+        # key -> [last access time, LFU counter]
+        self._access: Dict[str, List[float]] = {}
+        self._evictable = _KeySet()
+        self._volatile = _KeySet()
+        self._config = {
+            "maxmemory": 0,
+            "maxmemory-policy": "noeviction",
+            "maxmemory-samples": 5,
+        }
+        self.used_memory = 0
+        self.evicted_keys = 0
+        self.expired_keys = 0
+        self.rejected_writes = 0
+        self._set_config("maxmemory", maxmemory)
+        self._set_config("maxmemory-policy", maxmemory_policy)
+        self._set_config("maxmemory-samples", maxmemory_samples)
+
+    def _set_config(self, name: str, value: Any) -> None:
+        if name == "maxmemory-policy":
+            if value not in EVICTION_POLICIES:
+                raise ResponseError(f"Invalid maxmemory-policy {value!r}")
+        elif name in ("maxmemory", "maxmemory-samples"):
+            value = int(value)
+            if value < 0 or (name == "maxmemory-samples" and value == 0):
+                raise ResponseError(f"Invalid {name} {value!r}")
+        else:
+            raise ResponseError(f"Unsupported CONFIG parameter: {name}")
+        self._config[name] = value
+
+    async def config_set(self, name: str, value: Any) -> bool:
+        self._set_config(name, value)
+        return True
+
+    async def config_get(self, pattern: str = "*") -> Dict[str, Any]:
+        return {k: v for k, v in self._config.items() if pattern in ("*", k)}
+
+    def _expired(self, key: str) -> bool:
+        deadline = self._expires.get(key)
+        if deadline is not None and deadline <= self._clock():
+            self._delete(key)
+            self.expired_keys += 1
+            return True
+        return False
+
+    def _delete(self, key: str) -> bool:
+        self._expires.pop(key, None)
+        self._access.pop(key, None)
+        self._evictable.discard(key)
+        self._volatile.discard(key)
+        self.used_memory -= self._sizes.pop(key, 0)
+        return self._store.pop(key, None) is not None
+
+    def _touch(self, key: str) -> None:
+        """Update the LRU clock and the LFU counter of a key that was accessed."""
+        entry = self._access.get(key)
+        if entry is None:
+            return
+        now = self._clock()
+        decay = int((now - entry[0]) / LFU_DECAY_SECONDS)
+        counter = max(0, entry[1] - decay)
+        if counter < 255 and random.random() < 1.0 / ((max(0, counter - LFU_INIT_VAL)) * LFU_LOG_FACTOR + 1):
+            counter += 1
+        entry[0], entry[1] = now, counter
 
-    async def set(self, key: str, value: str, ex: Optional[int] = None):
+    @staticmethod
+    def _sizeof(key: str, value: Any) -> int:
+        return sys.getsizeof(key) + sys.getsizeof(value) + ENTRY_OVERHEAD
+
+    def _schedule(self, key: str, seconds: Optional[float]) -> None:
+        if seconds is None:
+            self._expires.pop(key, None)
+            self._volatile.discard(key)
+            return
+        deadline = self._clock() + seconds
+        self._expires[key] = deadline
+        if key in self._evictable:
+            self._volatile.add(key)
+        heapq.heappush(self._heap, (deadline, key))
+        # Overwritten deadlines leave stale heap entries behind; rebuild the
+        # heap once they outnumber the live ones so it cannot grow unbounded.
+        if len(self._heap) > 2 * len(self._expires) + 64:
+            self._heap = [(d, k) for k, d in self._expires.items()]
+            heapq.heapify(self._heap)
+        self._ensure_sweeper()
+
+    def _pick_victim(self, exclude: str) -> Optional[str]:
+        policy = self._config["maxmemory-policy"]
+        pool = self._volatile if policy == "volatile-ttl" else self._evictable
+        if policy == "noeviction" or not pool or (len(pool) == 1 and exclude in pool):
+            return None
+        candidates: List[str] = []
+        while not candidates:
+            candidates = [k for k in pool.sample(self._config["maxmemory-samples"]) if k != exclude]
+        if policy == "volatile-ttl":
+            return min(candidates, key=lambda k: self._expires[k])
+        if policy == "allkeys-lfu":
+            return min(candidates, key=lambda k: (self._access[k][1], self._access[k][0]))
+        return min(candidates, key=lambda k: self._access[k][0])
+
+    def _make_room(self, key: str, size: int) -> None:
+        maxmemory = self._config["maxmemory"]
+        if not maxmemory:
+            return
+
+        def over() -> bool:
+            return self.used_memory - self._sizes.get(key, 0) + size > maxmemory
+
+        if over():
+            self.sweep()
+        while over():
+            victim = self._pick_victim(exclude=key)
+            if victim is None:
+                self.rejected_writes += 1
+                raise ResponseError("OOM command not allowed when used memory > 'maxmemory'.")
+            self._delete(victim)
+            self.evicted_keys += 1
+
+    def _write(self, key: str, value: Any, ex: Optional[float]) -> None:
+        size = self._sizeof(key, value)
+        self._make_room(key, size)
+        self.used_memory += size - self._sizes.get(key, 0)
+        self._sizes[key] = size
         self._store[key] = value
-        if ex is not None:
-            async def expire_key(k, delay):
-                await asyncio.sleep(delay)
-                try:
-                    del self._store[k]
-                except KeyError:
-                    pass
-            asyncio.create_task(expire_key(key, ex))
-
-    async def exists(self, key: str) -> int:
-        return 1 if key in self._store else 0
+        self._access[key] = [self._clock(), LFU_INIT_VAL]
+        if not key.startswith(PROTECTED_PREFIXES):
+            self._evictable.add(key)
+        self._schedule(key, ex)
+
+    def sweep(self, limit: int = SWEEP_BATCH_SIZE) -> int:
+        """Remove up to ``limit`` expired keys; returns how many were removed."""
+        now = self._clock()
+        removed = 0
+        while self._heap and removed < limit and self._heap[0][0] <= now:
+            deadline, key = heapq.heappop(self._heap)
+            if self._expires.get(key) == deadline:
+                self._delete(key)
+                self.expired_keys += 1
+                removed += 1
+        return removed
+
+    def _ensure_sweeper(self) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        # A finished task or one bound to a closed loop is simply replaced.
+        if self._sweeper is None or self._sweeper.done() or self._sweeper.get_loop() is not loop:
+            self._sweeper = loop.create_task(self._sweep_forever())
+
+    async def _sweep_forever(self) -> None:
+        while self._expires:
+            await asyncio.sleep(self._sweep_interval)
+            while self.sweep() == SWEEP_BATCH_SIZE:
+                await asyncio.sleep(0)
+
+    async def set(self, key: str, value: str, ex: Optional[int] = None, nx: bool = False):
+        """Store ``value``; with ``nx`` only if the key does not exist (returns None otherwise)."""
+        if nx and not self._expired(key) and key in self._store:
+            return None
+        self._write(key, value, ex)
+        return True
+
+    async def get(self, key: str):
+        if self._expired(key):
+            return None
+        if isinstance(self._store.get(key), dict):
+            raise ResponseError("WRONGTYPE Operation against a key holding the wrong kind of value")
+        self._touch(key)
+        return self._store.get(key)
+
+    async def delete(self, *keys: str) -> int:
+        return sum(1 for key in keys if not self._expired(key) and self._delete(key))
+
+    async def exists(self, *keys: str) -> int:
+        """Number of the given keys that exist (repeated keys count repeatedly)."""
+        found = 0
+        for key in keys:
+            if self._expired(key) or key not in self._store:
+                continue
+            self._touch(key)
+            found += 1
+        return found
+
+    async def mget(self, keys, *args: str) -> List[Any]:
+        keys = [keys, *args] if isinstance(keys, str) else [*keys, *args]
+        # like Redis, keys holding another type read as missing
+        return [None if isinstance(self._store.get(key), dict) else await self.get(key) for key in keys]
+
+    async def mset(self, mapping: Dict[str, Any]) -> bool:
+        """Set several keys without expiry. Like Redis, nothing is written if memory runs out."""
+        needed = sum(self._sizeof(k, v) - self._sizes.get(k, 0) for k, v in mapping.items())
+        self._make_room("", needed)
+        for key, value in mapping.items():
+            self._write(key, value, None)
+        return True
+
+    async def scan_iter(self, match: Optional[str] = None, count: Optional[int] = None) -> AsyncIterator[str]:
+        """Iterate over live keys, optionally filtered by a glob pattern."""
+        for key in list(self._store):
+            if match is not None and not fnmatch.fnmatchcase(key, match):
+                continue
+            if not self._expired(key) and key in self._store:
+                yield key
+
+    def pipeline(self, transaction: bool = True) -> "_Pipeline":
+        return _Pipeline(self, transaction)
+
+    async def ttl(self, key: str) -> int:
+        if self._expired(key) or key not in self._store:
+            return -2
+        deadline = self._expires.get(key)
+        if deadline is None:
+            return -1
+        return max(0, round(deadline - self._clock()))
+
+    async def expire(self, key: str, seconds: float) -> int:
+        if self._expired(key) or key not in self._store:
+            return 0
+        self._schedule(key, seconds)
+        return 1
+
+    def _resize(self, key: str, delta: int) -> None:
+        self.used_memory += delta
+        self._sizes[key] = self._sizes.get(key, 0) + delta
+
+    async def incr(self, key: str, amount: int = 1) -> int:
+        """Increment an integer value, creating it at 0; the TTL is kept."""
+        current = None if self._expired(key) else self._store.get(key)
+        try:
+            value = int(current or 0) + amount
+        except (TypeError, ValueError):
+            raise ResponseError("value is not an integer or out of range")
+        if current is None:
+            self._write(key, str(value), None)
+        else:
+            self._make_room(key, self._sizeof(key, str(value)))
+            self._resize(key, self._sizeof(key, str(value)) - self._sizes[key])
+            self._store[key] = str(value)
+            self._touch(key)
+        return value
+
+    def _zset(self, key: str) -> Optional[Dict[str, float]]:
+        if self._expired(key):
+            return None
+        value = self._store.get(key)
+        if value is not None and not isinstance(value, dict):
+            raise ResponseError("WRONGTYPE Operation against a key holding the wrong kind of value")
+        return value
+
+    @staticmethod
+    def _member_size(member: str, score: float) -> int:
+        return sys.getsizeof(member) + sys.getsizeof(score)
+
+    @staticmethod
+    def _score(bound: Any) -> float:
+        return float(bound)  # accepts "-inf" / "+inf" like Redis
+
+    async def zadd(self, key: str, mapping: Dict[str, float]) -> int:
+        """Add or update scored members; returns how many were new."""
+        zset = self._zset(key)
+        new = {m: float(s) for m, s in mapping.items() if zset is None or m not in zset}
+        growth = sum(self._member_size(m, s) for m, s in new.items())
+        if zset is None:
+            self._make_room(key, self._sizeof(key, {}) + growth)
+            self._write(key, {}, None)
+            zset = self._store[key]
+        else:
+            self._make_room(key, self._sizes[key] + growth)
+            self._touch(key)
+        for member, score in mapping.items():
+            zset[member] = float(score)
+        self._resize(key, growth)
+        return len(new)
+
+    def _zremove(self, key: str, zset: Dict[str, float], members) -> int:
+        removed = 0
+        for member in members:
+            score = zset.pop(member, None)
+            if score is not None:
+                self._resize(key, -self._member_size(member, score))
+                removed += 1
+        if not zset:
+            self._delete(key)
+        return removed
+
+    async def zrem(self, key: str, *members: str) -> int:
+        zset = self._zset(key)
+        return self._zremove(key, zset, members) if zset else 0
+
+    async def zremrangebyscore(self, key: str, min: Any, max: Any) -> int:
+        zset = self._zset(key)
+        if not zset:
+            return 0
+        low, high = self._score(min), self._score(max)
+        return self._zremove(key, zset, [m for m, s in zset.items() if low <= s <= high])
+
+    async def zcard(self, key: str) -> int:
+        zset = self._zset(key)
+        return len(zset) if zset else 0
+
+    async def zrange(self, key: str, start: int, end: int, withscores: bool = False) -> List[Any]:
+        """Members ordered by score, with Redis' inclusive (and negative) indexes."""
+        zset = self._zset(key)
+        if not zset:
+            return []
+        ordered = sorted(zset.items(), key=lambda item: (item[1], item[0]))
+        stop = len(ordered) if end == -1 else end + 1
+        selected = ordered[start:stop]
+        return selected if withscores else [member for member, _ in selected]
+
+    async def info(self, section: Optional[str] = None) -> Dict[str, Any]:
+        """Memory and eviction counters, named as in Redis' INFO output."""
+        return {
+            "used_memory": self.used_memory,
+            "maxmemory": self._config["maxmemory"],
+            "maxmemory_policy": self._config["maxmemory-policy"],
+            "keys": len(self._store),
+            "expires": len(self._expires),
+            "evicted_keys": self.evicted_keys,
+            "expired_keys": self.expired_keys,
+            "rejected_writes": self.rejected_writes,
+        }
+
+
+class _Pipeline:
+    """
+    Buffers commands and sends them to the client in one ``execute()``.
+
+    Commands return the pipeline so they can be chained. The stand-in runs
+    the whole batch without yielding to the event loop, so it is applied
+    atomically, as MULTI/EXEC would be, whether or not ``transaction`` is set.
+    """
+
+    def __init__(self, client: _InMemoryRedis, transaction: bool = True):
+        self._client = client
+        self.transaction = transaction
+        self._commands: List[Tuple[str, tuple, dict]] = []
+
+    def __getattr__(self, name: str):
+        if name.startswith("_") or not callable(getattr(self._client, name, None)):
+            raise AttributeError(name)
+
+        def queue(*args, **kwargs):
+            self._commands.append((name, args, kwargs))
+            return self
+
+        return queue
+
+    def __len__(self) -> int:
+        return len(self._commands)
+
+    async def __aenter__(self) -> "_Pipeline":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.reset()
+
+    async def reset(self) -> None:
+        self._commands = []
+
+    async def execute(self, raise_on_error: bool = True) -> List[Any]:
+        """Run the queued commands in order and return their results."""
+        commands, self._commands = self._commands, []
+        results: List[Any] = []
+        for name, args, kwargs in commands:
+            try:
+                results.append(await getattr(self._client, name)(*args, **kwargs))
+            except RedisError as exc:
+                results.append(exc)
+        if raise_on_error:
+            for result in results:
+                if isinstance(result, RedisError):
+                    raise result
+        return results
 
 
 async def from_url(url: str):
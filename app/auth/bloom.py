@@ -0,0 +1,132 @@
+# Author: Roopesh Kumar Reddy Kaipa
+# Date: 18/10/2026
+import hashlib
+import math
+import time
+from typing import Any, AsyncIterable, Callable, Dict, List, Optional
+
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter over strings.
+
+    Sized for ``capacity`` items at a false-positive rate of ``error_rate``;
+    it never gives false negatives, and items cannot be removed.
+    """
+
+    def __init__(self, capacity: int, error_rate: float):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate must be between 0 and 1")
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.size = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, item: str):
+        # Kirsch-Mitzenmacher double hashing from one 128-bit digest
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.hash_count):
+            yield (h1 + i * h2) % self.size
+
+    def add(self, item: str) -> None:
+        for pos in self._positions(item):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        return all(self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
+
+
+class BlacklistFilter:
+    """
+    Periodically rebuilt Bloom filter of revoked JTIs.
+
+    A negative answer means the JTI was not revoked when the filter was
+    last rebuilt and has not been revoked by this process since; a
+    positive answer must be confirmed against Redis. Revocations made by
+    other processes are only seen after the next rebuild, so
+    ``rebuild_seconds`` bounds how long they can go unnoticed here.
+
+    Rebuilds are driven from outside (a background task calling rebuild()
+    every ``rebuild_seconds``); lookups never rebuild. A filter that has
+    gone two periods without a rebuild is no longer trusted.
+    """
+
+    def __init__(
+        self,
+        enabled: bool,
+        capacity: int,
+        error_rate: float,
+        rebuild_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.enabled = enabled
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.rebuild_seconds = rebuild_seconds
+        self._clock = clock
+        self._filter: Optional[BloomFilter] = None
+        self._built_at = 0.0
+        # JTIs added while a rebuild is scanning, replayed into the new filter
+        self._pending: Optional[List[str]] = None
+        self.negatives = 0
+        self.positives = 0
+        self.false_positives = 0
+        self.rebuilds = 0
+
+    @property
+    def ready(self) -> bool:
+        return self._filter is not None
+
+    def add(self, jti: str) -> None:
+        if self._filter is not None:
+            self._filter.add(jti)
+        if self._pending is not None:
+            self._pending.append(jti)
+
+    def might_contain(self, jti: str) -> Optional[bool]:
+        """
+        False if ``jti`` is surely not revoked, True if it may be, None when
+        there is no filter to trust (not built yet, or rebuilds have stalled).
+        """
+        if not self.enabled or self._filter is None:
+            return None
+        if self._clock() - self._built_at >= 2 * self.rebuild_seconds:
+            return None
+        if jti in self._filter:
+            self.positives += 1
+            return True
+        self.negatives += 1
+        return False
+
+    async def rebuild(self, jtis: AsyncIterable[str]) -> None:
+        """Build a new filter from every currently revoked JTI and swap it in."""
+        self._pending = []
+        try:
+            items = [jti async for jti in jtis]
+            bloom = BloomFilter(max(self.capacity, 2 * len(items)), self.error_rate)
+            for jti in items + self._pending:
+                bloom.add(jti)
+            self._filter = bloom
+            self._built_at = self._clock()
+            self.rebuilds += 1
+        finally:
+            self._pending = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "items": self._filter.count if self._filter else 0,
+            "size_bits": self._filter.size if self._filter else 0,
+            "hash_count": self._filter.hash_count if self._filter else 0,
+            "negatives": self.negatives,
+            "positives": self.positives,
+            "false_positives": self.false_positives,
+            "rebuilds": self.rebuilds,
+        }
@@ -0,0 +1,115 @@
+# Author: Roopesh Kumar Reddy Kaipa
+# Date: 18/10/2026
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from app.core.config import get_settings
+
+settings = get_settings()
+
+
+class TTLCache:
+    """
+    Thread-safe, size-bounded LRU cache whose entries expire after a TTL.
+
+    Entries are evicted least-recently-used first once ``maxsize`` is
+    reached, and expired entries are dropped lazily when they are read.
+    The cache is per process: other workers only see a change once their
+    own entry expires, so keep the TTL short for data that can change.
+    """
+
+    def __init__(self, maxsize: int, ttl: float, clock: Callable[[], float] = time.monotonic):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._clock = clock
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            value, expires_at = entry
+            if expires_at <= self._clock():
+                del self._data[key]
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Store ``value``; ``ttl`` overrides the default lifetime for this entry."""
+        if self.maxsize <= 0:
+            return
+        lifetime = self.ttl if ttl is None else min(ttl, self.ttl)
+        if lifetime <= 0:
+            return
+        with self._lock:
+            self._data[key] = (value, self._clock() + lifetime)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key: Hashable) -> Any:
+        with self._lock:
+            entry = self._data.pop(key, None)
+        return entry[0] if entry is not None else None
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+# Authenticated users by id, as column snapshots (see app.auth.jwt.get_current_user)
+user_cache = TTLCache(settings.USER_CACHE_MAX_SIZE, settings.USER_CACHE_TTL_SECONDS)
+
+# Revoke-all marks (milliseconds, 0 when unset) by user id; see app.auth.redis
+revocation_cache = TTLCache(settings.USER_CACHE_MAX_SIZE, settings.REVOCATION_CACHE_TTL_SECONDS)
+
+# Verified JWT claims by (token type, sha256 of the token); see get_token_claims
+token_cache = TTLCache(settings.TOKEN_CACHE_MAX_SIZE, settings.TOKEN_CACHE_TTL_SECONDS)
+# jti -> token_cache key, so blacklisting a token can drop its cached claims
+_token_keys = TTLCache(settings.TOKEN_CACHE_MAX_SIZE, settings.TOKEN_CACHE_TTL_SECONDS)
+
+
+def _token_key(token: str, token_type: str) -> tuple:
+    return token_type, hashlib.sha256(token.encode()).hexdigest()
+
+
+def get_token_claims(token: str, token_type: str) -> Optional[Dict[str, Any]]:
+    """Claims of a token that already passed signature and expiry checks, if cached."""
+    claims = token_cache.get(_token_key(token, token_type))
+    return dict(claims) if claims is not None else None
+
+
+def cache_token_claims(token: str, token_type: str, claims: Dict[str, Any]) -> None:
+    """
+    Remember verified claims until the token expires (or the cache TTL,
+    whichever comes first). Tokens without ``exp`` are not cached.
+    """
+    exp = claims.get("exp")
+    if not isinstance(exp, (int, float)):
+        return
+    remaining = exp - time.time()
+    key = _token_key(token, token_type)
+    token_cache.set(key, dict(claims), ttl=remaining)
+    if claims.get("jti"):
+        _token_keys.set(claims["jti"], key, ttl=remaining)
+
+
+def forget_token(jti: str) -> None:
+    """Drop the cached claims of a revoked token."""
+    key = _token_keys.pop(jti)
+    if key is not None:
+        token_cache.pop(key)
@@ -0,0 +1,84 @@
+# Author: Roopesh Kumar Reddy Kaipa
+# Date: 18/10/2026
+"""
+Recommend a BCRYPT_ROUNDS value for this machine.
+
+    python -m app.auth.calibrate --target-ms 250
+
+Each extra round doubles bcrypt's cost, so the tool times a cheap cost,
+extrapolates to the target, and then confirms the estimate by timing the
+candidate cost itself. Existing hashes move to the new cost on their
+owners' next login (see User.verify_and_update_password).
+"""
+import argparse
+import math
+import statistics
+import time
+from typing import Callable, Dict
+
+from app.auth.hashing import build_context
+
+MIN_ROUNDS = 4
+MAX_ROUNDS = 31
+
+
+def measure(rounds: int, samples: int = 3) -> float:
+    """Median seconds to hash a password at ``rounds`` on this machine."""
+    context = build_context(rounds)
+    timings = []
+    for _ in range(samples):
+        start = time.perf_counter()
+        context.hash("calibration-password")
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def recommend_rounds(
+    target_seconds: float,
+    base_rounds: int = 8,
+    measure: Callable[[int], float] = measure,
+) -> Dict[int, float]:
+    """
+    Time bcrypt around the cost that best fits ``target_seconds``.
+
+    Returns the measured seconds by rounds; the recommendation is the
+    highest measured cost within the target, or the lowest one measured
+    if even that is too slow.
+    """
+    if target_seconds <= 0:
+        raise ValueError("target must be positive")
+    timings = {base_rounds: measure(base_rounds)}
+    estimate = base_rounds + math.floor(math.log2(target_seconds / timings[base_rounds]))
+    rounds = min(MAX_ROUNDS, max(MIN_ROUNDS, estimate))
+    # The extrapolation is usually right; correct it by one round at a time.
+    while rounds not in timings:
+        timings[rounds] = measure(rounds)
+        if timings[rounds] > target_seconds and rounds > MIN_ROUNDS:
+            rounds -= 1
+        elif timings[rounds] <= target_seconds and rounds < MAX_ROUNDS:
+            rounds += 1
+    return timings
+
+
+def best_rounds(timings: Dict[int, float], target_seconds: float) -> int:
+    within = [rounds for rounds, seconds in timings.items() if seconds <= target_seconds]
+    return max(within) if within else min(timings)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--target-ms", type=float, default=250.0, help="acceptable time per hash")
+    parser.add_argument("--base-rounds", type=int, default=8, help="cheap cost used for the first estimate")
+    parser.add_argument("--samples", type=int, default=3, help="hashes timed per cost")
+    args = parser.parse_args(argv)
+
+    target = args.target_ms / 1000
+    timings = recommend_rounds(target, args.base_rounds, lambda rounds: measure(rounds, args.samples))
+    for rounds, seconds in sorted(timings.items()):
+        print(f"rounds={rounds:<3} {seconds * 1000:9.1f} ms")
+    print(f"BCRYPT_ROUNDS={best_rounds(timings, target)}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())  # pragma: no cover
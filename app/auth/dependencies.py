@@ -2,17 +2,23 @@ from datetime import datetime
 from uuid import UUID
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
+from app.auth.identity import decode_identity
+from app.auth.jwt import is_token_revoked
 from app.schemas.user import UserResponse
 from app.models.user import User
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/token")
 
-def get_current_user(
+async def get_current_user(
     token: str = Depends(oauth2_scheme)
 ) -> UserResponse:
     """
     Dependency to get the current user from the JWT token without a database lookup.
-    This function supports two types of payloads:
+    Verified tokens are first checked against the blacklist and the user's
+    revoke-all mark, like decode_token does. Access tokens carrying identity
+    claims (see app.auth.identity) are then turned into the user's real
+    profile, as it was when the token was issued.
+    Otherwise this function supports two types of payloads:
       - A full payload as a dict containing user info.
       - A minimal payload, either as a dict with only a 'sub' key or directly as a UUID.
     """
@@ -22,6 +28,20 @@ def get_current_user(
         headers={"WWW-Authenticate": "Bearer"},
     )
 
+    claims = User.verify_token_claims(token)
+    if isinstance(claims, dict) and await is_token_revoked(claims):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Token has been revoked",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    identity = decode_identity(claims) if isinstance(claims, dict) else None
+    if identity is not None:
+        try:
+            return UserResponse(**identity)
+        except Exception:
+            raise credentials_exception
+
     token_data = User.verify_token(token)
     if token_data is None:
         raise credentials_exception
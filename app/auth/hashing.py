@@ -0,0 +1,211 @@
+# Author: Roopesh Kumar Reddy Kaipa
+# Date: 18/10/2026
+import asyncio
+import multiprocessing
+import secrets
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from fastapi import HTTPException, status
+from passlib.context import CryptContext
+
+from app.core.config import get_settings
+
+settings = get_settings()
+
+
+def build_context(rounds: int) -> CryptContext:
+    """
+    bcrypt CryptContext hashing at ``rounds``. Hashes made at any other
+    cost report ``needs_update``, so verify_and_update() rehashes them at
+    the configured cost on the next successful login.
+    """
+    return CryptContext(
+        schemes=["bcrypt"],
+        deprecated="auto",
+        bcrypt__rounds=rounds,
+        bcrypt__min_rounds=rounds,
+        bcrypt__max_rounds=rounds,
+    )
+
+
+@lru_cache()
+def _context(rounds: int) -> CryptContext:
+    """CryptContext used inside pool workers, built once per process."""
+    return build_context(rounds)
+
+
+def _hash(password: str, rounds: int) -> str:
+    return _context(rounds).hash(password)
+
+
+def _verify(plain_password: str, hashed_password: str, rounds: int) -> bool:
+    return _context(rounds).verify(plain_password, hashed_password)
+
+
+def _verify_and_update(plain_password: str, hashed_password: str, rounds: int) -> Tuple[bool, Optional[str]]:
+    return _context(rounds).verify_and_update(plain_password, hashed_password)
+
+
+def _timed(fn: Callable[..., Any], *args: Any) -> Tuple[Any, float]:
+    """Run ``fn`` in a worker and also return how long it took there."""
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+
+class LatencyEstimator:
+    """Exponentially weighted moving average of observed durations."""
+
+    def __init__(self, alpha: float = 0.2):
+        self.alpha = alpha
+        self.estimate: Optional[float] = None
+        self.samples = 0
+        self._lock = threading.Lock()
+
+    def observe(self, seconds: float) -> None:
+        with self._lock:
+            if self.estimate is None:
+                self.estimate = seconds
+            else:
+                self.estimate += self.alpha * (seconds - self.estimate)
+            self.samples += 1
+
+
+class PasswordHashPool:
+    """
+    Bounded process pool for bcrypt work.
+
+    At most ``workers`` hashes run at once and at most ``max_queue`` more wait
+    for a worker. Calls beyond that are rejected immediately, and calls that
+    do not finish within ``timeout`` seconds are abandoned; both surface as a
+    503 with ``Retry-After`` so clients back off instead of piling up.
+    With ``workers=0`` the work runs on a small thread pool instead, which is
+    handy for tests and single-process development servers.
+    """
+
+    def __init__(self, workers: int, max_queue: int, timeout: float):
+        self.workers = workers
+        self.max_queue = max_queue
+        self.timeout = timeout
+        self._executor: Optional[Executor] = None
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self.completed = 0
+        self.rejected = 0
+        self.timeouts = 0
+        # bcrypt verify time in the workers, excluding time spent queued
+        self.latency = LatencyEstimator()
+        self._dummy_hashes: Dict[int, str] = {}
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of calls waiting for a free worker."""
+        return max(0, self._in_flight - max(self.workers, 1))
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.workers > 0:
+                # spawn keeps workers free of the parent's threads and event loop
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="password-hash")
+        return self._executor
+
+    def _busy(self, detail: str) -> HTTPException:
+        return HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=detail,
+            headers={"Retry-After": str(max(1, int(self.timeout)))},
+        )
+
+    def _release(self, future: Any = None) -> None:
+        with self._lock:
+            self._in_flight -= 1
+
+    async def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """Run ``fn(*args)`` on the pool, applying backpressure and the timeout."""
+        with self._lock:
+            if self._in_flight >= max(self.workers, 1) + self.max_queue:
+                self.rejected += 1
+                raise self._busy("Password hashing is saturated, retry later")
+            self._in_flight += 1
+            executor = self._get_executor()
+        try:
+            future = executor.submit(fn, *args)
+        except BaseException:
+            self._release()
+            raise
+        # Released when the call actually ends: a timed-out call that has
+        # already started keeps its worker busy, so it still counts against
+        # the admission bound until it finishes.
+        future.add_done_callback(self._release)
+        try:
+            result = await asyncio.wait_for(asyncio.wrap_future(future), self.timeout)
+        except asyncio.TimeoutError:
+            future.cancel()
+            with self._lock:
+                self.timeouts += 1
+            raise self._busy("Password hashing timed out, retry later")
+        with self._lock:
+            self.completed += 1
+        return result
+
+    async def hash(self, password: str) -> str:
+        return await self.run(_hash, password, settings.BCRYPT_ROUNDS)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return await self.run(_verify, plain_password, hashed_password, settings.BCRYPT_ROUNDS)
+
+    async def verify_and_update(self, plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+        """Verify, returning a replacement hash when the stored cost is outdated."""
+        result, elapsed = await self.run(
+            _timed, _verify_and_update, plain_password, hashed_password, settings.BCRYPT_ROUNDS
+        )
+        self.latency.observe(elapsed)
+        return result
+
+    async def dummy_hash(self) -> str:
+        """
+        Hash of a random password at the configured cost, made once per
+        process (at startup, by prepare_dummy_hashes()). Verifying against
+        it costs the same as a real verify and never succeeds, which hides
+        whether a login name exists.
+        """
+        rounds = settings.BCRYPT_ROUNDS
+        if rounds not in self._dummy_hashes:
+            self._dummy_hashes[rounds] = await self.hash(secrets.token_urlsafe(16))
+        return self._dummy_hashes[rounds]
+
+    def stats(self) -> Dict[str, Any]:
+        """Snapshot of pool saturation for the health endpoint."""
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "max_queue": self.max_queue,
+                "in_flight": self._in_flight,
+                "queue_depth": self.queue_depth,
+                "completed": self.completed,
+                "rejected": self.rejected,
+                "timeouts": self.timeouts,
+                "verify_seconds_estimate": self.latency.estimate,
+            }
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+password_pool = PasswordHashPool(
+    workers=settings.PASSWORD_HASH_WORKERS,
+    max_queue=settings.PASSWORD_HASH_MAX_QUEUE,
+    timeout=settings.PASSWORD_HASH_TIMEOUT_SECONDS,
+)
@@ -0,0 +1,57 @@
+# Author: Roopesh Kumar Reddy Kaipa
+# Date: 18/10/2026
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+# Bump when the short keys below change meaning; tokens carrying another
+# version are treated as having no identity claims.
+IDENTITY_CLAIMS_VERSION = 1
+
+# UserResponse field -> short claim key
+_KEYS = {
+    "username": "u",
+    "email": "e",
+    "first_name": "f",
+    "last_name": "l",
+    "is_active": "a",
+    "is_verified": "vf",
+}
+_TIMESTAMPS = {"created_at": "c", "updated_at": "m"}
+
+
+def _epoch(value: datetime) -> int:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return int(value.timestamp())
+
+
+def encode_identity(user: Any) -> Dict[str, Any]:
+    """
+    Compact ``idn`` claim with the UserResponse fields of ``user``, so a
+    token holder's profile can be rebuilt without reading the users table.
+    """
+    claims: Dict[str, Any] = {"v": IDENTITY_CLAIMS_VERSION}
+    for field, key in _KEYS.items():
+        claims[key] = getattr(user, field)
+    for field, key in _TIMESTAMPS.items():
+        claims[key] = _epoch(getattr(user, field) or datetime.now(timezone.utc))
+    return claims
+
+
+def decode_identity(payload: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    UserResponse fields from a token payload's ``idn`` claim, or None when
+    the claim is missing, malformed or of another version.
+    """
+    claims = payload.get("idn")
+    if not isinstance(claims, dict) or claims.get("v") != IDENTITY_CLAIMS_VERSION or "sub" not in payload:
+        return None
+    try:
+        fields: Dict[str, Any] = {"id": payload["sub"]}
+        for field, key in _KEYS.items():
+            fields[field] = claims[key]
+        for field, key in _TIMESTAMPS.items():
+            fields[field] = datetime.fromtimestamp(claims[key], timezone.utc)
+    except (KeyError, TypeError, ValueError, OverflowError):
+        return None
+    return fields
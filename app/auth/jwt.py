@@ -1,29 +1,31 @@
 # Author: Roopesh Kumar Reddy Kaipa
 # Date: 24/11/2025
+import asyncio
+import time
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import Any, Optional, Union
 from jose import jwt, JWTError
-from passlib.context import CryptContext
 from fastapi import HTTPException, status, Depends
 from fastapi.security import OAuth2PasswordBearer
 from uuid import UUID
 import secrets
 
 from app.core.config import get_settings
-from app.auth.redis import add_to_blacklist, is_blacklisted
+from app.auth.redis import add_to_blacklist, get_revoked_before, is_blacklisted
+from app.auth.hashing import build_context, password_pool
+from app.auth.keys import signing_params, verification_params
+from app.auth.cache import cache_token_claims, get_token_claims, user_cache
 from app.schemas.token import TokenType
-from app.database import get_db
-from sqlalchemy.orm import Session
+from app.database import get_async_db
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.models.user import User
 
 settings = get_settings()
 
 # Password hashing
-pwd_context = CryptContext(
-    schemes=["bcrypt"],
-    deprecated="auto",
-    bcrypt__rounds=settings.BCRYPT_ROUNDS
-)
+pwd_context = build_context(settings.BCRYPT_ROUNDS)
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/login")
 
@@ -35,13 +37,76 @@ def get_password_hash(password: str) -> str:
     """Hash a password using bcrypt."""
     return pwd_context.hash(password)
 
+def verify_and_update_password(plain_password: str, hashed_password: str) -> tuple[bool, Optional[str]]:
+    """
+    Verify a password; also return a new hash if the stored one was made
+    with a different bcrypt cost than BCRYPT_ROUNDS, else None.
+    """
+    return pwd_context.verify_and_update(plain_password, hashed_password)
+
+@lru_cache(maxsize=4)
+def _dummy_hash(context) -> str:
+    return context.hash(secrets.token_urlsafe(16))
+
+def verify_dummy_password(plain_password: str) -> bool:
+    """
+    Spend one bcrypt verify, as for a real user, against a per-process
+    dummy hash; used when the login name does not exist. Always False.
+    """
+    pwd_context.verify(plain_password, _dummy_hash(pwd_context))
+    return False
+
+async def prepare_dummy_hashes() -> None:
+    """
+    Build the dummy hashes of both login paths; called from the app's
+    lifespan so that no login pays for them and concurrent first logins of
+    unknown users do not each build their own.
+    """
+    await password_pool.dummy_hash()
+    await asyncio.to_thread(_dummy_hash, pwd_context)
+
+async def verify_dummy_password_async(plain_password: str) -> bool:
+    """verify_dummy_password() on the bounded hashing pool."""
+    await password_pool.verify_and_update(plain_password, await password_pool.dummy_hash())
+    return False
+
+async def pad_login_latency(started_at: float) -> None:
+    """
+    With LOGIN_LATENCY_PADDING, sleep until a login that began at
+    ``started_at`` (time.perf_counter()) has taken LOGIN_LATENCY_PADDING_FACTOR
+    times the measured bcrypt verify time, so fast and slow outcomes look
+    alike. Sleeping costs no CPU.
+    """
+    estimate = password_pool.latency.estimate
+    if not settings.LOGIN_LATENCY_PADDING or estimate is None:
+        return
+    remaining = estimate * settings.LOGIN_LATENCY_PADDING_FACTOR - (time.perf_counter() - started_at)
+    if remaining > 0:
+        await asyncio.sleep(remaining)
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password on the bounded hashing pool without blocking the caller."""
+    return await password_pool.verify(plain_password, hashed_password)
+
+async def verify_and_update_password_async(plain_password: str, hashed_password: str) -> tuple[bool, Optional[str]]:
+    """verify_and_update_password() on the bounded hashing pool."""
+    return await password_pool.verify_and_update(plain_password, hashed_password)
+
+async def get_password_hash_async(password: str) -> str:
+    """Hash a password on the bounded hashing pool without blocking the caller."""
+    return await password_pool.hash(password)
+
 def create_token(
     user_id: Union[str, UUID],
     token_type: TokenType,
-    expires_delta: Optional[timedelta] = None
+    expires_delta: Optional[timedelta] = None,
+    identity: Optional[dict] = None
 ) -> str:
     """
     Create a JWT token (access or refresh).
+
+    ``identity`` (see app.auth.identity.encode_identity) is embedded as the
+    ``idn`` claim of access tokens when TOKEN_IDENTITY_CLAIMS is enabled.
     """
     if expires_delta:
         expire = datetime.now(timezone.utc) + expires_delta
@@ -58,58 +123,82 @@ def create_token(
     if isinstance(user_id, UUID):
         user_id = str(user_id)
 
+    issued_at = datetime.now(timezone.utc)
     to_encode = {
         "sub": user_id,
         "type": token_type.value,
         "exp": expire,
-        "iat": datetime.now(timezone.utc),
+        "iat": issued_at,
+        # millisecond issue time, compared with the user's revoke-all mark
+        "iat_ms": int(issued_at.timestamp() * 1000),
         "jti": secrets.token_hex(16)
     }
-
-    secret = (
-        settings.JWT_SECRET_KEY 
-        if token_type == TokenType.ACCESS 
-        else settings.JWT_REFRESH_SECRET_KEY
-    )
+    if identity and token_type == TokenType.ACCESS and settings.TOKEN_IDENTITY_CLAIMS:
+        to_encode["idn"] = identity
 
     try:
-        return jwt.encode(to_encode, secret, algorithm=settings.ALGORITHM)
+        key, algorithm, headers = signing_params(token_type)
+        return jwt.encode(to_encode, key, algorithm=algorithm, headers=headers)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Could not create token: {str(e)}"
         )
 
+async def _issued_before_revoke_all(payload: dict) -> bool:
+    """True if the token predates the last "log out everywhere" of its user."""
+    if "sub" not in payload:
+        return False
+    revoked_before = await get_revoked_before(payload["sub"])
+    if not revoked_before:
+        return False
+    issued_ms = payload.get("iat_ms")
+    if issued_ms is None:
+        issued_ms = int(payload.get("iat", 0)) * 1000
+    return issued_ms <= revoked_before
+
+async def is_token_revoked(payload: dict, check_blacklist: bool = True) -> bool:
+    """True if the token's jti is blacklisted or it predates its user's revoke-all mark."""
+    return (
+        (check_blacklist and "jti" in payload and await is_blacklisted(payload["jti"]))
+        or await _issued_before_revoke_all(payload)
+    )
+
 async def decode_token(
     token: str,
     token_type: TokenType,
-    verify_exp: bool = True
+    verify_exp: bool = True,
+    check_blacklist: bool = True
 ) -> dict[str, Any]:
     """
     Decode and verify a JWT token.
+
+    Verified claims are cached by token digest until the token expires, so
+    a token seen before skips signature checks and parsing. The blacklist
+    (unless ``check_blacklist`` is False, for callers that consult it
+    themselves) and the user's revoke-all mark are still consulted on
+    every call.
     """
     try:
-        secret = (
-            settings.JWT_SECRET_KEY 
-            if token_type == TokenType.ACCESS 
-            else settings.JWT_REFRESH_SECRET_KEY
-        )
-        
-        payload = jwt.decode(
-            token,
-            secret,
-            algorithms=[settings.ALGORITHM],
-            options={"verify_exp": verify_exp}
-        )
-        
-        if payload.get("type") != token_type.value:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid token type",
-                headers={"WWW-Authenticate": "Bearer"},
+        payload = get_token_claims(token, token_type.value)
+        if payload is None:
+            key, algorithms = verification_params(token, token_type)
+            payload = jwt.decode(
+                token,
+                key,
+                algorithms=algorithms,
+                options={"verify_exp": verify_exp}
             )
             
-        if await is_blacklisted(payload["jti"]):
+            if payload.get("type") != token_type.value:
+                raise HTTPException(
+                    status_code=status.HTTP_401_UNAUTHORIZED,
+                    detail="Invalid token type",
+                    headers={"WWW-Authenticate": "Bearer"},
+                )
+            cache_token_claims(token, token_type.value, payload)
+            
+        if await is_token_revoked(payload, check_blacklist):
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Token has been revoked",
@@ -131,43 +220,60 @@ async def decode_token(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+async def load_active_user(user_id: Union[str, UUID], db) -> User:
+    """
+    Fetch an active user by id, from the per-process cache when possible.
+
+    The lookup is awaited on an AsyncSession; a sync Session is still
+    accepted for callers outside the request path. A cached user is a
+    detached instance whose relationships are not loaded.
+    """
+    try:
+        user_lookup = UUID(user_id) if isinstance(user_id, str) else user_id
+    except Exception:
+        user_lookup = user_id
+
+    cached = user_cache.get(user_lookup)
+    if cached is not None:
+        return User.from_snapshot(cached)
+
+    if isinstance(db, AsyncSession):
+        user = (await db.scalars(select(User).where(User.id == user_lookup))).first()
+    else:
+        user = db.query(User).filter(User.id == user_lookup).first()
+    if user is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="User not found"
+        )
+        
+    if not user.is_active:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Inactive user"
+        )
+
+    # Only active users are cached, so a hit needs no further checks.
+    user_cache.set(user_lookup, user.snapshot())
+    return user
+
 async def get_current_user(
     token: str = Depends(oauth2_scheme),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> User:
     """
     Dependency to get current user from access token.
     Returns the actual User model instance.
+
+    Users are served from a short-lived per-process cache, so the common
+    case runs no SQL (see load_active_user).
     """
     try:
         payload = await decode_token(token, TokenType.ACCESS)
-        user_id = payload["sub"]
-        try:
-            if isinstance(user_id, str):
-                user_lookup = UUID(user_id)
-            else:
-                user_lookup = user_id
-        except Exception:
-            user_lookup = user_id
-
-        user = db.query(User).filter(User.id == user_lookup).first()
-        if user is None:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="User not found"
-            )
-            
-        if not user.is_active:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Inactive user"
-            )
-            
-        return user
-        
+        return await load_active_user(payload["sub"], db)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail=str(e),
             headers={"WWW-Authenticate": "Bearer"},
-        )
\ No newline at end of file
+        )
@@ -0,0 +1,169 @@
+# Author: Roopesh Kumar Reddy Kaipa
+# Date: 18/10/2026
+import base64
+import hashlib
+import json
+import logging
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec, rsa
+from jose import JWTError, jwk, jwt
+
+from app.core.config import get_settings
+from app.schemas.token import TokenType
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+# Algorithms signed with a private key and verified with a published JWK.
+# EdDSA is not supported by python-jose.
+ASYMMETRIC_ALGORITHMS = ("RS256", "RS384", "RS512", "ES256", "ES384", "ES512")
+EC_CURVES = {"ES256": ec.SECP256R1, "ES384": ec.SECP384R1, "ES512": ec.SECP521R1}
+
+
+def is_asymmetric(algorithm: str) -> bool:
+    return algorithm in ASYMMETRIC_ALGORITHMS
+
+
+def _thumbprint(public_jwk: Dict[str, Any]) -> str:
+    """RFC 7638 JWK thumbprint, used as the kid of generated keys."""
+    required = ("crv", "kty", "x", "y") if public_jwk["kty"] == "EC" else ("e", "kty", "n")
+    canonical = json.dumps({k: public_jwk[k] for k in required}, separators=(",", ":"), sort_keys=True)
+    digest = hashlib.sha256(canonical.encode()).digest()
+    return base64.urlsafe_b64encode(digest).rstrip(b"=").decode()
+
+
+def generate_private_key(algorithm: str) -> str:
+    """New PEM private key suitable for ``algorithm``."""
+    if algorithm.startswith("ES"):
+        key = ec.generate_private_key(EC_CURVES[algorithm]())
+    else:
+        key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    return key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    ).decode()
+
+
+class KeySet:
+    """
+    Private keys for signing access tokens, by kid, and their public JWKS.
+
+    The ``active_kid`` key signs new tokens; every key verifies tokens, so a
+    rotated-out key should stay in the set until its tokens have expired.
+    """
+
+    def __init__(self, algorithm: str, private_keys: Dict[str, str], active_kid: str):
+        if not is_asymmetric(algorithm):
+            raise ValueError(f"{algorithm} is not an asymmetric signing algorithm")
+        if active_kid not in private_keys:
+            raise ValueError(f"No key with kid {active_kid!r}")
+        self.algorithm = algorithm
+        self.active_kid = active_kid
+        self._private = dict(private_keys)
+        self._public: Dict[str, str] = {}
+        public_jwks: List[Dict[str, Any]] = []
+        for kid, pem in sorted(self._private.items()):
+            public = jwk.construct(pem, algorithm).public_key()
+            self._public[kid] = public.to_pem().decode()
+            public_jwks.append({**public.to_dict(), "kid": kid, "use": "sig", "alg": algorithm})
+        self.jwks = {"keys": public_jwks}
+        self.jwks_body = json.dumps(self.jwks, separators=(",", ":"), sort_keys=True).encode()
+        self.etag = '"' + hashlib.sha256(self.jwks_body).hexdigest()[:32] + '"'
+
+    @classmethod
+    def generate(cls, algorithm: str) -> "KeySet":
+        """Key set with a single freshly generated key (kid = its thumbprint)."""
+        pem = generate_private_key(algorithm)
+        kid = _thumbprint(jwk.construct(pem, algorithm).public_key().to_dict())
+        return cls(algorithm, {kid: pem}, kid)
+
+    @classmethod
+    def from_directory(cls, algorithm: str, directory: str, active_kid: Optional[str] = None) -> "KeySet":
+        """
+        Load ``<kid>.pem`` private keys from ``directory``. Without an
+        explicit ``active_kid`` the last kid in sort order signs, so naming
+        keys by date (``2026-10-01.pem``) rotates by adding a file.
+        """
+        paths = sorted(Path(directory).glob("*.pem"))
+        if not paths:
+            raise ValueError(f"No *.pem keys found in {directory}")
+        keys = {path.stem: path.read_text() for path in paths}
+        return cls(algorithm, keys, active_kid or paths[-1].stem)
+
+    def signing_key(self) -> Tuple[str, str]:
+        return self.active_kid, self._private[self.active_kid]
+
+    def public_key(self, kid: Optional[str]) -> str:
+        if kid not in self._public:
+            raise JWTError("Unknown signing key")
+        return self._public[kid]
+
+
+_key_set: Optional[KeySet] = None
+
+
+def get_key_set() -> Optional[KeySet]:
+    """
+    The access-token key set, loaded on first use; None with HS* algorithms.
+
+    Raises ValueError when an asymmetric algorithm has no JWT_KEYS_DIR.
+    Only with JWT_EPHEMERAL_KEYS is a key pair generated for this process
+    instead, which is fine for development but breaks verification across
+    workers.
+    """
+    global _key_set
+    if not is_asymmetric(settings.ALGORITHM):
+        return None
+    if _key_set is None or _key_set.algorithm != settings.ALGORITHM:
+        if settings.JWT_KEYS_DIR:
+            _key_set = KeySet.from_directory(settings.ALGORITHM, settings.JWT_KEYS_DIR, settings.JWT_ACTIVE_KID)
+        elif settings.JWT_EPHEMERAL_KEYS:
+            logger.warning("JWT_EPHEMERAL_KEYS is set; signing access tokens with a key only this process knows")
+            _key_set = KeySet.generate(settings.ALGORITHM)
+        else:
+            raise ValueError(
+                f"ALGORITHM={settings.ALGORITHM} needs JWT_KEYS_DIR "
+                "(or JWT_EPHEMERAL_KEYS for single-process development)"
+            )
+    return _key_set
+
+
+def set_key_set(key_set: Optional[KeySet]) -> None:
+    """Replace the loaded key set (after rotating keys on disk, or in tests)."""
+    global _key_set
+    _key_set = key_set
+
+
+def signing_params(token_type: TokenType) -> Tuple[str, str, Optional[Dict[str, str]]]:
+    """
+    Key, algorithm and extra JOSE headers for signing a token.
+
+    Refresh tokens are only ever verified by this service, so they keep the
+    shared JWT_REFRESH_SECRET_KEY; access tokens use the asymmetric key
+    when one is configured.
+    """
+    key_set = get_key_set() if token_type == TokenType.ACCESS else None
+    if key_set is not None:
+        kid, private_key = key_set.signing_key()
+        return private_key, key_set.algorithm, {"kid": kid}
+    if token_type == TokenType.ACCESS:
+        return settings.JWT_SECRET_KEY, _symmetric_algorithm(), None
+    return settings.JWT_REFRESH_SECRET_KEY, _symmetric_algorithm(), None
+
+
+def verification_params(token: str, token_type: TokenType) -> Tuple[str, List[str]]:
+    """Key and allowed algorithms for verifying ``token``; raises JWTError for unknown kids."""
+    key_set = get_key_set() if token_type == TokenType.ACCESS else None
+    if key_set is not None:
+        kid = jwt.get_unverified_header(token).get("kid")
+        return key_set.public_key(kid), [key_set.algorithm]
+    secret = settings.JWT_SECRET_KEY if token_type == TokenType.ACCESS else settings.JWT_REFRESH_SECRET_KEY
+    return secret, [_symmetric_algorithm()]
+
+
+def _symmetric_algorithm() -> str:
+    return "HS256" if is_asymmetric(settings.ALGORITHM) else settings.ALGORITHM
@@ -0,0 +1,132 @@
+# Author: Roopesh Kumar Reddy Kaipa
+# Date: 18/10/2026
+import logging
+import math
+import secrets
+import time
+from typing import Callable, Optional
+
+import aioredis
+from fastapi import HTTPException, Request, status
+
+from app.auth.redis import get_redis
+from app.core.config import get_settings
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+
+class SlidingWindowLimiter:
+    """
+    Sliding-window log limiter backed by one Redis sorted set per key.
+
+    Each recorded event is a member scored by its timestamp. A key is over
+    its limit while ``limit`` events fall inside the last ``window``
+    seconds; it frees up again as soon as the oldest of them leaves the
+    window, which is also the Retry-After reported to the client.
+    """
+
+    def __init__(self, prefix: str, limit: int, window: float, clock: Callable[[], float] = time.time):
+        self.prefix = prefix
+        self.limit = limit
+        self.window = window
+        self._clock = clock
+
+    def _key(self, identifier: str) -> str:
+        return f"{self.prefix}:{identifier}"
+
+    def _retry_after(self, oldest, now: float) -> int:
+        return max(1, math.ceil(oldest[0][1] + self.window - now)) if oldest else 1
+
+    async def check(self, identifier: str) -> Optional[int]:
+        """Seconds until ``identifier`` may try again, or None if it is under the limit."""
+        now = self._clock()
+        redis = await get_redis()
+        pipe = redis.pipeline(transaction=True)
+        pipe.zremrangebyscore(self._key(identifier), "-inf", now - self.window)
+        pipe.zcard(self._key(identifier))
+        pipe.zrange(self._key(identifier), 0, 0, withscores=True)
+        _, count, oldest = await pipe.execute()
+        if count < self.limit:
+            return None
+        return self._retry_after(oldest, now)
+
+    async def hit(self, identifier: str) -> Optional[int]:
+        """
+        Count one event for ``identifier`` unless that puts it over the
+        limit, in which case return the seconds until it may try again.
+
+        The event is added and the window counted in one MULTI, so
+        concurrent callers see distinct counts and at most ``limit`` of
+        them get through; a refused event is taken back out.
+        """
+        now = self._clock()
+        key = self._key(identifier)
+        member = f"{now:.6f}:{secrets.token_hex(4)}"
+        redis = await get_redis()
+        pipe = redis.pipeline(transaction=True)
+        pipe.zremrangebyscore(key, "-inf", now - self.window)
+        pipe.zadd(key, {member: now})
+        pipe.zcard(key)
+        pipe.zrange(key, 0, 0, withscores=True)
+        pipe.expire(key, math.ceil(self.window))
+        _, _, count, oldest, _ = await pipe.execute()
+        if count <= self.limit:
+            return None
+        await redis.zrem(key, member)
+        return self._retry_after(oldest, now)
+
+    async def reset(self, identifier: str) -> None:
+        redis = await get_redis()
+        await redis.delete(self._key(identifier))
+
+
+# Every login attempt counts against the client address and, from before the
+# password is checked, against the username. A successful login clears the
+# username's window, so only failures and attempts still in flight add up
+# there and a user is not locked out by their own logins.
+ip_limiter = SlidingWindowLimiter("ratelimit:login:ip", settings.LOGIN_IP_MAX_ATTEMPTS, settings.LOGIN_IP_WINDOW_SECONDS)
+user_limiter = SlidingWindowLimiter(
+    "ratelimit:login:user", settings.LOGIN_USER_MAX_FAILURES, settings.LOGIN_USER_WINDOW_SECONDS
+)
+
+
+def _throttled(retry_after: int) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        detail="Too many login attempts, retry later",
+        headers={"Retry-After": str(retry_after)},
+    )
+
+
+async def enforce_login_limits(request: Request, username: str) -> None:
+    """
+    Raise 429 with Retry-After if the client address or the username is
+    throttled; call before verifying the password. Admitted attempts take a
+    slot in both windows straight away, so concurrent guesses at one
+    username are counted before any of them reaches bcrypt; call
+    reset_login_failures() once the password turns out right. The limits
+    fail open: if Redis is unavailable, logins are not throttled.
+    """
+    if not settings.LOGIN_RATE_LIMIT_ENABLED:
+        return
+    try:
+        if request.client is not None:
+            retry_after = await ip_limiter.hit(request.client.host)
+            if retry_after is not None:
+                raise _throttled(retry_after)
+        retry_after = await user_limiter.hit(username.lower())
+    except aioredis.RedisError:
+        logger.warning("Login rate limiting unavailable", exc_info=True)
+        return
+    if retry_after is not None:
+        raise _throttled(retry_after)
+
+
+async def reset_login_failures(username: str) -> None:
+    if not settings.LOGIN_RATE_LIMIT_ENABLED:
+        return
+    try:
+        await user_limiter.reset(username.lower())
+    except aioredis.RedisError:
+        logger.warning("Login rate limiting unavailable", exc_info=True)
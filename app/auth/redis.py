@@ -1,23 +1,173 @@
 # Author: Roopesh Kumar Reddy Kaipa
 # Date: 24/11/2025
+import asyncio
+import logging
+import time
+from typing import Iterable, List, Mapping, Optional, Union
+from uuid import UUID
+
 import aioredis
+from app.auth.bloom import BlacklistFilter
+from app.auth.cache import forget_token, revocation_cache
 from app.core.config import get_settings
 
 settings = get_settings()
+logger = logging.getLogger(__name__)
+
+# Blacklist value of refresh tokens that were exchanged at /auth/refresh
+ROTATED = "rotated"
+
+blacklist_filter = BlacklistFilter(
+    enabled=settings.BLACKLIST_BLOOM_ENABLED,
+    capacity=settings.BLACKLIST_BLOOM_CAPACITY,
+    error_rate=settings.BLACKLIST_BLOOM_ERROR_RATE,
+    rebuild_seconds=settings.BLACKLIST_BLOOM_REBUILD_SECONDS,
+)
 
 async def get_redis():
     if not hasattr(get_redis, "redis"):
-        get_redis.redis = await aioredis.from_url(
+        redis = await aioredis.from_url(
             settings.REDIS_URL or "redis://localhost"
         )
+        if settings.REDIS_MAXMEMORY:
+            await redis.config_set("maxmemory", settings.REDIS_MAXMEMORY)
+            await redis.config_set("maxmemory-policy", settings.REDIS_MAXMEMORY_POLICY)
+            await redis.config_set("maxmemory-samples", settings.REDIS_MAXMEMORY_SAMPLES)
+        get_redis.redis = redis
     return get_redis.redis
 
 async def add_to_blacklist(jti: str, exp: int):
-    """Add a token's JTI to the blacklist"""
+    """
+    Add a token's JTI to the blacklist for ``exp`` seconds; a non-positive
+    ``exp`` keeps the entry without expiry. Raises ``aioredis.RedisError``
+    when the entry cannot be stored (e.g. Redis is out of memory).
+    """
+    redis = await get_redis()
+    await redis.set(f"blacklist:{jti}", "1", ex=exp if exp and exp > 0 else None)
+    blacklist_filter.add(jti)
+    forget_token(jti)
+
+async def mark_rotated(jti: str, exp: int) -> Optional[str]:
+    """
+    Blacklist a refresh token's JTI as rotated, unless it already is
+    blacklisted. Returns None when this call claimed the token, otherwise
+    the existing entry: ROTATED if the token was already exchanged (reuse),
+    anything else if it was logged out.
+    """
+    redis = await get_redis()
+    key = f"blacklist:{jti}"
+    if await redis.set(key, ROTATED, ex=exp if exp and exp > 0 else None, nx=True):
+        blacklist_filter.add(jti)
+        forget_token(jti)
+        return None
+    value = await redis.get(key)
+    if isinstance(value, bytes):
+        value = value.decode()
+    return value if value is not None else "1"
+
+async def add_many_to_blacklist(entries: Mapping[str, int]):
+    """
+    Blacklist several JTIs, each with its own expiry in seconds (see
+    add_to_blacklist), in a single pipelined round-trip.
+    """
+    if not entries:
+        return
     redis = await get_redis()
-    await redis.set(f"blacklist:{jti}", "1", ex=exp)
+    pipe = redis.pipeline(transaction=True)
+    for jti, exp in entries.items():
+        pipe.set(f"blacklist:{jti}", "1", ex=exp if exp and exp > 0 else None)
+    await pipe.execute()
+    for jti in entries:
+        blacklist_filter.add(jti)
+        forget_token(jti)
+
+async def _revoked_jtis(redis):
+    prefix = "blacklist:"
+    async for key in redis.scan_iter(match=f"{prefix}*"):
+        key = key.decode() if isinstance(key, bytes) else key
+        yield key[len(prefix):]
+
+async def refresh_blacklist_filter():
+    """Rebuild the Bloom filter from every ``blacklist:*`` key in Redis."""
+    redis = await get_redis()
+    await blacklist_filter.rebuild(_revoked_jtis(redis))
+
+async def keep_blacklist_filter_fresh():
+    """
+    Rebuild the Bloom filter every ``BLACKLIST_BLOOM_REBUILD_SECONDS`` until
+    cancelled; returns at once when the filter is disabled. Runs as a
+    background task for the life of the worker, so the SCAN behind a
+    rebuild never holds up a request; a failed rebuild leaves the old
+    filter in place and is retried on the next tick.
+    """
+    if not blacklist_filter.enabled:
+        return
+    while True:
+        try:
+            await refresh_blacklist_filter()
+        except aioredis.RedisError:
+            logger.warning("Could not rebuild the blacklist Bloom filter", exc_info=True)
+        await asyncio.sleep(blacklist_filter.rebuild_seconds)
 
 async def is_blacklisted(jti: str) -> bool:
-    """Check if a token's JTI is blacklisted"""
+    """
+    Check if a token's JTI is blacklisted. With the Bloom filter enabled,
+    JTIs it has never seen are answered without a Redis round-trip.
+    """
+    maybe = blacklist_filter.might_contain(jti)
+    if maybe is False:
+        return False
     redis = await get_redis()
-    return await redis.exists(f"blacklist:{jti}")
\ No newline at end of file
+    found = await redis.exists(f"blacklist:{jti}")
+    if maybe and not found:
+        blacklist_filter.false_positives += 1
+    return found
+
+async def are_blacklisted(jtis: Iterable[str]) -> List[bool]:
+    """Check several JTIs in one round-trip; results follow the input order."""
+    jtis = list(jtis)
+    if not jtis:
+        return []
+    results = [False] * len(jtis)
+    maybes = {}
+    for i, jti in enumerate(jtis):
+        maybe = blacklist_filter.might_contain(jti)
+        if maybe is not False:
+            maybes[i] = maybe
+    if maybes:
+        redis = await get_redis()
+        values = await redis.mget([f"blacklist:{jtis[i]}" for i in maybes])
+        for (i, maybe), value in zip(maybes.items(), values):
+            results[i] = value is not None
+            if maybe and value is None:
+                blacklist_filter.false_positives += 1
+    return results
+
+async def revoke_all_for_user(user_id: Union[str, UUID]) -> int:
+    """
+    Revoke every token issued to a user so far with a single write: tokens
+    whose ``iat_ms`` is at or before the stored mark are rejected by
+    decode_token. The mark only needs to outlive the longest-lived token.
+    Returns the mark in milliseconds.
+    """
+    user_id = str(user_id)
+    revoked_before = int(time.time() * 1000)
+    redis = await get_redis()
+    await redis.set(
+        f"revoked_before:{user_id}",
+        str(revoked_before),
+        ex=settings.REFRESH_TOKEN_EXPIRE_DAYS * 24 * 60 * 60,
+    )
+    revocation_cache.set(user_id, revoked_before)
+    return revoked_before
+
+async def get_revoked_before(user_id: Union[str, UUID]) -> int:
+    """A user's revoke-all mark in milliseconds, or 0; cached briefly per process."""
+    user_id = str(user_id)
+    revoked_before = revocation_cache.get(user_id)
+    if revoked_before is None:
+        redis = await get_redis()
+        value = await redis.get(f"revoked_before:{user_id}")
+        revoked_before = int(value) if value is not None else 0
+        revocation_cache.set(user_id, revoked_before)
+    return revoked_before
@@ -2,7 +2,7 @@
 # Date: 24/11/2025
 from functools import lru_cache
 from pydantic_settings import BaseSettings
-from typing import Optional, List
+from typing import Literal, Optional, List
 import os
 
 default_db = os.getenv("DATABASE_URL")
@@ -14,17 +14,94 @@ if not default_db:
 
 class Settings(BaseSettings):
     DATABASE_URL: str = default_db
+
+    # Connection pool, per engine and per worker process. Each worker has two
+    # engines (sync and async), so size it so that
+    # workers * 2 * (DB_POOL_SIZE + DB_MAX_OVERFLOW) stays below
+    # max_connections: 4 workers * 2 * 10 = 80 of Postgres' default 100.
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 5
+    DB_POOL_TIMEOUT: float = 30.0
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
     
     JWT_SECRET_KEY: str = "your-super-secret-key-change-this-in-production"
     JWT_REFRESH_SECRET_KEY: str = "your-refresh-secret-key-change-this-in-production"
+    # HS256/384/512 sign with the secrets above. RS*/ES* sign access tokens
+    # with the private keys in JWT_KEYS_DIR (<kid>.pem) and publish them at
+    # /.well-known/jwks.json; refresh tokens then use HS256.
     ALGORITHM: str = "HS256"
+    JWT_KEYS_DIR: Optional[str] = None
+    JWT_ACTIVE_KID: Optional[str] = None
+    # Development only: with RS*/ES* and no JWT_KEYS_DIR, sign with a key
+    # generated per process. Tokens then only verify in the worker that
+    # issued them, so without this flag a missing JWT_KEYS_DIR fails startup.
+    JWT_EPHEMERAL_KEYS: bool = False
+    JWKS_MAX_AGE_SECONDS: int = 300
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
+    # Embed the user's profile (idn claim) in access tokens so requests can
+    # be served without reading the users table; changes to the profile,
+    # including deactivation, show up when the access token is renewed.
+    TOKEN_IDENTITY_CLAIMS: bool = True
     
     BCRYPT_ROUNDS: int = 12
+    # bcrypt runs in a bounded process pool; 0 workers uses a thread instead
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_MAX_QUEUE: int = 32
+    PASSWORD_HASH_TIMEOUT_SECONDS: float = 5.0
+    # Pad every login to this multiple of the measured bcrypt verify time
+    LOGIN_LATENCY_PADDING: bool = False
+    LOGIN_LATENCY_PADDING_FACTOR: float = 1.2
     CORS_ORIGINS: List[str] = ["*"]
+
+    # Login throttling, checked before any bcrypt work: all attempts count
+    # per client address; per username, failed and in-flight attempts count.
+    LOGIN_RATE_LIMIT_ENABLED: bool = True
+    LOGIN_IP_MAX_ATTEMPTS: int = 100
+    LOGIN_IP_WINDOW_SECONDS: float = 60.0
+    LOGIN_USER_MAX_FAILURES: int = 10
+    LOGIN_USER_WINDOW_SECONDS: float = 300.0
     
     REDIS_URL: Optional[str] = "redis://localhost:6379/0"
+    # Applied with CONFIG SET when REDIS_MAXMEMORY (bytes) is non-zero.
+    # Revoked-token entries must survive eviction, so prefer noeviction or
+    # volatile-ttl on a real server; the bundled stand-in never evicts them.
+    REDIS_MAXMEMORY: int = 0
+    REDIS_MAXMEMORY_POLICY: Literal["noeviction", "volatile-ttl", "allkeys-lru", "allkeys-lfu"] = "noeviction"
+    REDIS_MAXMEMORY_SAMPLES: int = 5
+
+    # In-process Bloom filter of revoked JTIs checked before Redis. Other
+    # workers' revocations are picked up on the next rebuild, so this only
+    # suits deployments that accept that delay.
+    BLACKLIST_BLOOM_ENABLED: bool = False
+    BLACKLIST_BLOOM_CAPACITY: int = 100000
+    BLACKLIST_BLOOM_ERROR_RATE: float = 0.001
+    BLACKLIST_BLOOM_REBUILD_SECONDS: float = 30.0
+
+    # Per-process cache of authenticated users used by get_current_user
+    USER_CACHE_MAX_SIZE: int = 10000
+    USER_CACHE_TTL_SECONDS: float = 30.0
+    # Per-process cache of verified JWT claims; entries never outlive the token
+    TOKEN_CACHE_MAX_SIZE: int = 10000
+    TOKEN_CACHE_TTL_SECONDS: float = 300.0
+    # How long a user's revoke-all mark is cached; bounds how late other
+    # workers notice a "log out everywhere"
+    REVOCATION_CACHE_TTL_SECONDS: float = 5.0
+
+    CALCULATIONS_PAGE_SIZE: int = 100
+    CALCULATIONS_MAX_PAGE_SIZE: int = 1000
+    EXPORT_BATCH_SIZE: int = 1000
+    CALCULATION_BATCH_MAX_ITEMS: int = 5000
+    # Bulk deletes run in the background as DELETE statements of at most
+    # CALCULATION_DELETE_CHUNK_SIZE rows, each in its own transaction
+    CALCULATION_DELETE_CHUNK_SIZE: int = 1000
+    CALCULATION_DELETE_MAX_IDS: int = 10000
+    CALCULATION_DELETE_JOB_TTL_SECONDS: int = 3600
+
+    # "numpy" evaluates calculations as array reductions when numpy is installed
+    CALCULATION_ENGINE: Literal["python", "numpy"] = "python"
+    NUMPY_ENGINE_MIN_INPUTS: int = 64
     
     class Config:
         env_file = ".env"
@@ -1,14 +1,121 @@
 # Author: Roopesh Kumar Reddy Kaipa
 # Date: 24/11/2025
+import threading
+import time
+from typing import Any, Dict
+
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 from app.core.config import settings
 
 SQLALCHEMY_DATABASE_URL = settings.DATABASE_URL
 
-engine = create_engine(SQLALCHEMY_DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Async drivers used for each sync backend
+ASYNC_DRIVERS = {
+    "postgresql": "asyncpg",
+    "sqlite": "aiosqlite",
+}
+
+def get_async_database_url(database_url: str = SQLALCHEMY_DATABASE_URL) -> str:
+    """Rewrite a sync database URL to use the matching async driver."""
+    url = make_url(database_url)
+    driver = ASYNC_DRIVERS.get(url.get_backend_name())
+    if driver is None:
+        raise ValueError(f"No async driver configured for {url.get_backend_name()}")
+    return url.set(drivername=f"{url.get_backend_name()}+{driver}").render_as_string(hide_password=False)
+
+class _WaitTimingMixin:
+    """Records how long checkouts wait for a connection, and how often they time out."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._stats_lock = threading.Lock()
+        self.waits = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+        self.timeouts = 0
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            with self._stats_lock:
+                self.timeouts += 1
+            raise
+        finally:
+            waited = time.perf_counter() - start
+            with self._stats_lock:
+                self.waits += 1
+                self.wait_seconds_total += waited
+                self.wait_seconds_max = max(self.wait_seconds_max, waited)
+
+class InstrumentedQueuePool(_WaitTimingMixin, QueuePool):
+    """QueuePool for the sync engine with checkout wait metrics."""
+
+class InstrumentedAsyncQueuePool(_WaitTimingMixin, AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool for the async engine with checkout wait metrics."""
+
+def get_pool_options(database_url: str, asynchronous: bool = False) -> Dict[str, Any]:
+    """
+    Engine keyword arguments for the connection pool, taken from Settings.
+
+    In-memory SQLite keeps SQLAlchemy's default pool, since every new
+    connection there would be a different, empty database.
+    """
+    url = make_url(database_url)
+    if url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:"):
+        return {}
+    return {
+        "poolclass": InstrumentedAsyncQueuePool if asynchronous else InstrumentedQueuePool,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+
+def get_pool_status(engine) -> Dict[str, Any]:
+    """
+    Snapshot of an engine's pool: capacity, connections in use, overflow,
+    and checkout wait times. Accepts sync engines and AsyncEngines.
+    """
+    pool = getattr(engine, "sync_engine", engine).pool
+    status = {"pool": type(pool).__name__}
+    if not isinstance(pool, QueuePool):
+        return status
+    status.update({
+        "size": pool.size(),
+        "max_overflow": pool._max_overflow,
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": max(0, pool.overflow()),
+    })
+    if isinstance(pool, _WaitTimingMixin):
+        with pool._stats_lock:
+            status.update({
+                "waits": pool.waits,
+                "wait_seconds_total": round(pool.wait_seconds_total, 6),
+                "wait_seconds_max": round(pool.wait_seconds_max, 6),
+                "timeouts": pool.timeouts,
+            })
+    return status
+
+engine = create_engine(SQLALCHEMY_DATABASE_URL, **get_pool_options(SQLALCHEMY_DATABASE_URL))
+# Every column default is computed in Python, so objects are complete after a
+# flush; not expiring them on commit saves the SELECT a refresh would cost.
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
+
+async_engine = create_async_engine(
+    get_async_database_url(SQLALCHEMY_DATABASE_URL),
+    **get_pool_options(SQLALCHEMY_DATABASE_URL, asynchronous=True),
+)
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
 
 Base = declarative_base()
 
@@ -19,10 +126,25 @@ def get_db():
     finally:
         db.close()
 
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
 def get_engine(database_url: str = SQLALCHEMY_DATABASE_URL):
     """Factory function to create a new SQLAlchemy engine."""
-    return create_engine(database_url)
+    return create_engine(database_url, **get_pool_options(database_url))
 
 def get_sessionmaker(engine):
     """Factory function to create a new sessionmaker bound to the given engine."""
-    return sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    return sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
+
+def get_async_engine(database_url: str = SQLALCHEMY_DATABASE_URL):
+    """Factory function to create a new async engine for the given sync-style URL."""
+    return create_async_engine(
+        get_async_database_url(database_url),
+        **get_pool_options(database_url, asynchronous=True),
+    )
+
+def get_async_sessionmaker(engine):
+    """Factory function to create a new async sessionmaker bound to the given engine."""
+    return async_sessionmaker(engine, autoflush=False, expire_on_commit=False)
@@ -0,0 +1,105 @@
+# Author: Roopesh Kumar Reddy Kaipa
+# Date: 18/10/2026
+import logging
+from datetime import datetime, timezone
+from typing import Optional, Union
+from uuid import UUID, uuid4
+
+import aioredis
+
+from app.auth.redis import get_redis
+from app.core.config import settings
+from app.database import AsyncSessionLocal
+from app.models.calculation import Calculation
+from app.schemas.calculation import CalculationDeleteJob, CalculationDeleteJobStatus, CalculationDeleteRequest
+
+logger = logging.getLogger(__name__)
+
+
+def _job_key(user_id: Union[str, UUID], job_id: str) -> str:
+    # Keyed by owner, so a job id alone does not reveal another user's job.
+    return f"calculation-delete:{user_id}:{job_id}"
+
+
+async def save_delete_job(user_id: Union[str, UUID], job: CalculationDeleteJob) -> None:
+    redis = await get_redis()
+    await redis.set(_job_key(user_id, job.id), job.model_dump_json(), ex=settings.CALCULATION_DELETE_JOB_TTL_SECONDS)
+
+
+async def get_delete_job(user_id: Union[str, UUID], job_id: str) -> Optional[CalculationDeleteJob]:
+    """The user's job with ``job_id``, or None if it is unknown or has expired."""
+    redis = await get_redis()
+    raw = await redis.get(_job_key(user_id, job_id))
+    return CalculationDeleteJob.model_validate_json(raw) if raw is not None else None
+
+
+async def create_delete_job(user_id: Union[str, UUID]) -> CalculationDeleteJob:
+    """Record a pending job; raises aioredis.RedisError if it cannot be stored."""
+    job = CalculationDeleteJob(id=uuid4().hex, created_at=datetime.now(timezone.utc))
+    await save_delete_job(user_id, job)
+    return job
+
+
+async def _report(user_id: Union[str, UUID], job: CalculationDeleteJob) -> None:
+    # Progress is best effort; losing an update must not stop the delete.
+    try:
+        await save_delete_job(user_id, job)
+    except aioredis.RedisError:
+        logger.warning("Could not record progress of delete job %s", job.id, exc_info=True)
+
+
+async def _delete_chunk(stmt) -> int:
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(stmt)
+        await db.commit()
+        return result.rowcount
+
+
+async def run_delete_job(
+    job: CalculationDeleteJob,
+    user_id: UUID,
+    selection: Optional[CalculationDeleteRequest] = None,
+    chunk_size: Optional[int] = None,
+) -> None:
+    """
+    Delete the user's calculations matching ``selection`` (all of them when
+    None) in chunks of ``chunk_size`` rows, committing after each chunk and
+    recording the running total on ``job``.
+
+    Meant to run as a background task: every chunk is a short transaction
+    and an await point, so neither row locks nor the event loop are held
+    for the length of the whole purge.
+    """
+    chunk_size = chunk_size or settings.CALCULATION_DELETE_CHUNK_SIZE
+    filters = {}
+    if selection is not None:
+        filters = {
+            "calculation_type": selection.type.value if selection.type else None,
+            "created_after": selection.created_after,
+            "created_before": selection.created_before,
+        }
+
+    job.status = CalculationDeleteJobStatus.RUNNING
+    await _report(user_id, job)
+    try:
+        if selection is not None and selection.ids is not None:
+            for start in range(0, len(selection.ids), chunk_size):
+                ids = selection.ids[start:start + chunk_size]
+                job.deleted += await _delete_chunk(Calculation.delete_chunk(user_id, chunk_size, ids=ids, **filters))
+                await _report(user_id, job)
+        else:
+            while True:
+                deleted = await _delete_chunk(Calculation.delete_chunk(user_id, chunk_size, **filters))
+                if deleted:
+                    job.deleted += deleted
+                    await _report(user_id, job)
+                if deleted < chunk_size:
+                    break
+    except Exception as e:
+        logger.exception("Delete job %s failed after %d rows", job.id, job.deleted)
+        job.status = CalculationDeleteJobStatus.FAILED
+        job.detail = str(e)
+    else:
+        job.status = CalculationDeleteJobStatus.DONE
+    job.finished_at = datetime.now(timezone.utc)
+    await _report(user_id, job)
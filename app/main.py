@@ -1,31 +1,70 @@
 # Author: Roopesh Kumar Reddy Kaipa
 # Date: 24/11/2025
-from contextlib import asynccontextmanager
+import asyncio
+import csv
+import io
+import json
+from collections import defaultdict
+from contextlib import asynccontextmanager, suppress
 from datetime import datetime, timezone, timedelta
-from uuid import UUID
-from typing import List
-from fastapi import Body, FastAPI, Depends, HTTPException, status
+from uuid import UUID, uuid4
+from typing import Any, Dict, List, Optional
+import aioredis
+from fastapi import BackgroundTasks, Body, FastAPI, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+from starlette.concurrency import run_in_threadpool
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
+from pydantic import ValidationError
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, make_transient_to_detached
 
 from app.auth.dependencies import get_current_active_user
-from app.models.calculation import Calculation
+from app.models.calculation import Calculation, is_finite_real
 from app.models.user import User
-from app.schemas.calculation import CalculationBase, CalculationResponse, CalculationUpdate
-from app.schemas.token import TokenResponse
+from app.schemas.calculation import (
+    CalculationBase,
+    CalculationBatchError,
+    CalculationBatchResponse,
+    CalculationCursor,
+    CalculationDeleteJob,
+    CalculationDeleteRequest,
+    CalculationExportFormat,
+    CalculationResponse,
+    CalculationType,
+    CalculationUpdate,
+)
+from app.schemas.token import RefreshRequest, Token, TokenResponse
 from app.schemas.user import UserCreate, UserResponse, UserLogin
-from app.database import Base, get_db, engine
-from app.auth.jwt import decode_token, oauth2_scheme
+from app.database import AsyncSessionLocal, Base, async_engine, get_async_db, get_db, get_pool_status, engine
+from app.auth.identity import encode_identity
+from app.auth.jwt import create_token, decode_token, load_active_user, oauth2_scheme, prepare_dummy_hashes
 from app.schemas.token import TokenType
-from app.auth.redis import add_to_blacklist
+from app.auth.redis import (
+    ROTATED, add_to_blacklist, blacklist_filter, get_redis, keep_blacklist_filter_fresh, mark_rotated, revoke_all_for_user,
+)
+from app.auth.hashing import password_pool
+from app.auth.keys import get_key_set
+from app.jobs import create_delete_job, get_delete_job, run_delete_job
+from app.auth.rate_limit import enforce_login_limits, reset_login_failures
+from app.core.config import settings
 
 # Create tables on startup
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    # Load the signing keys now, so a missing JWT_KEYS_DIR stops the worker
+    # at startup instead of failing its first login.
+    get_key_set()
+    await prepare_dummy_hashes()
     print("Creating tables...")
     Base.metadata.create_all(bind=engine)
     print("Tables created successfully!")
+    refresher = asyncio.create_task(keep_blacklist_filter_fresh())
     yield
+    refresher.cancel()
+    with suppress(asyncio.CancelledError):
+        await refresher
+    password_pool.shutdown()
 
 app = FastAPI(
     title="Calculations API",
@@ -38,28 +77,50 @@ app = FastAPI(
 def read_health():
     return {"status": "ok"}
 
+@app.get("/health/db", tags=["health"])
+def read_db_health():
+    """Connection pool saturation for the sync and async engines of this worker."""
+    return {
+        "sync": get_pool_status(engine),
+        "async": get_pool_status(async_engine),
+    }
+
+@app.get("/health/password-hashing", tags=["health"])
+def read_password_hashing_health():
+    """Saturation of the bcrypt process pool (in-flight calls and queue depth)."""
+    return password_pool.stats()
+
+@app.get("/health/redis", tags=["health"])
+async def read_redis_health():
+    """
+    Redis memory use against maxmemory, eviction and expiry counters, and
+    the hit/miss counters of this worker's blacklist Bloom filter.
+    """
+    redis = await get_redis()
+    return {**await redis.info(), "blacklist_filter": blacklist_filter.stats()}
+
 @app.post(
     "/auth/register", 
     response_model=UserResponse, 
     status_code=status.HTTP_201_CREATED,
     tags=["auth"]
 )
-def register(user_create: UserCreate, db: Session = Depends(get_db)):
+async def register(user_create: UserCreate, db: Session = Depends(get_db)):
     # Exclude confirm_password before passing data to User.register
     user_data = user_create.dict(exclude={"confirm_password"})
     try:
-        user = User.register(db, user_data)
-        db.commit()
-        db.refresh(user)
+        user = await User.register_async(db, user_data)
+        await run_in_threadpool(db.commit)
         return user
     except ValueError as e:
-        db.rollback()
+        await run_in_threadpool(db.rollback)
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 @app.post("/auth/login", response_model=TokenResponse, tags=["auth"])
-def login_json(user_login: UserLogin, db: Session = Depends(get_db)):
+async def login_json(request: Request, user_login: UserLogin, db: Session = Depends(get_db)):
     """Login with JSON payload"""
-    auth_result = User.authenticate(db, user_login.username, user_login.password)
+    await enforce_login_limits(request, user_login.username)
+    auth_result = await User.authenticate_async(db, user_login.username, user_login.password)
     if auth_result is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -68,7 +129,8 @@ def login_json(user_login: UserLogin, db: Session = Depends(get_db)):
         )
 
     user = auth_result["user"]
-    db.commit()  # Commit the last_login update
+    await run_in_threadpool(db.commit)  # Commit the last_login update
+    await reset_login_failures(user_login.username)
 
     # Ensure expires_at is timezone-aware
     expires_at = auth_result.get("expires_at")
@@ -92,9 +154,14 @@ def login_json(user_login: UserLogin, db: Session = Depends(get_db)):
     )
 
 @app.post("/auth/token", tags=["auth"])
-def login_form(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)):
+async def login_form(
+    request: Request,
+    form_data: OAuth2PasswordRequestForm = Depends(),
+    db: Session = Depends(get_db),
+):
     """Login with form data for Swagger UI"""
-    auth_result = User.authenticate(db, form_data.username, form_data.password)
+    await enforce_login_limits(request, form_data.username)
+    auth_result = await User.authenticate_async(db, form_data.username, form_data.password)
     if auth_result is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -102,11 +169,78 @@ def login_form(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = D
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+    await run_in_threadpool(db.commit)  # Commit the last_login update and any rehash
+    await reset_login_failures(form_data.username)
     return {
         "access_token": auth_result["access_token"],
         "token_type": "bearer"
     }
 
+EMPTY_JWKS = b'{"keys":[]}'
+
+@app.get("/.well-known/jwks.json", tags=["auth"])
+def read_jwks(request: Request):
+    """
+    Public keys that verify access tokens, as a JWK Set, so other services
+    can check tokens locally. Empty while tokens are signed with HS*.
+    Clients may cache it for JWKS_MAX_AGE_SECONDS and revalidate with ETag.
+    """
+    key_set = get_key_set()
+    body = key_set.jwks_body if key_set else EMPTY_JWKS
+    etag = key_set.etag if key_set else '"empty"'
+    headers = {
+        "Cache-Control": f"public, max-age={settings.JWKS_MAX_AGE_SECONDS}",
+        "ETag": etag,
+    }
+    if_none_match = request.headers.get("if-none-match", "")
+    if etag in (tag.strip().removeprefix("W/") for tag in if_none_match.split(",")):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+@app.post("/auth/refresh", response_model=Token, tags=["auth"])
+async def refresh_tokens(body: RefreshRequest, db: AsyncSession = Depends(get_async_db)):
+    """
+    Exchange a refresh token for a new access/refresh pair without
+    re-entering credentials. Each refresh token can be exchanged once: it
+    is blacklisted as it is rotated, and presenting it again revokes every
+    token of the user, since one of the two parties holding it is not the
+    legitimate client.
+    """
+    payload = await decode_token(body.refresh_token, TokenType.REFRESH, check_blacklist=False)
+    try:
+        user = await load_active_user(payload["sub"], db)
+    except HTTPException as e:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail=e.detail,
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    ttl = int(payload["exp"] - datetime.now(timezone.utc).timestamp())
+    try:
+        previous = await mark_rotated(payload["jti"], max(ttl, 1))
+        if previous == ROTATED:
+            await revoke_all_for_user(user.id)
+    except aioredis.RedisError:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Could not rotate token, retry later",
+            headers={"Retry-After": "1"},
+        )
+    if previous is not None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Refresh token reuse detected" if previous == ROTATED else "Token has been revoked",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    return Token(
+        access_token=create_token(user.id, TokenType.ACCESS, identity=encode_identity(user)),
+        refresh_token=create_token(user.id, TokenType.REFRESH),
+        token_type="bearer",
+        expires_at=datetime.now(timezone.utc) + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES),
+    )
+
 @app.post("/auth/logout", status_code=status.HTTP_204_NO_CONTENT, tags=["auth"])
 async def logout(token: str = Depends(oauth2_scheme)):
     """
@@ -134,13 +268,38 @@ async def logout(token: str = Depends(oauth2_scheme)):
     except Exception:
         ttl = None
 
-    # Add to blacklist with expiry if known
-    if ttl and ttl > 0:
-        await add_to_blacklist(jti, ttl)
-    else:
-        # Add without expiry to be safe
-        await add_to_blacklist(jti, 0)
+    # Add to blacklist with expiry if known. If Redis cannot store the entry
+    # the token is still valid, so report failure rather than a logout.
+    try:
+        if ttl and ttl > 0:
+            await add_to_blacklist(jti, ttl)
+        else:
+            # Add without expiry to be safe
+            await add_to_blacklist(jti, 0)
+    except aioredis.RedisError:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Could not revoke token, retry later",
+            headers={"Retry-After": "1"},
+        )
+
+    return None
 
+@app.post("/auth/logout-all", status_code=status.HTTP_204_NO_CONTENT, tags=["auth"])
+async def logout_all(token: str = Depends(oauth2_scheme)):
+    """
+    Revoke every access and refresh token issued to the caller so far,
+    including the one used for this request, with a single Redis write.
+    """
+    payload = await decode_token(token, TokenType.ACCESS)
+    try:
+        await revoke_all_for_user(payload["sub"])
+    except aioredis.RedisError:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Could not revoke tokens, retry later",
+            headers={"Retry-After": "1"},
+        )
     return None
 
 # Create (Add) Calculation – using CalculationBase so that 'user_id' from the client is ignored.
@@ -150,10 +309,10 @@ async def logout(token: str = Depends(oauth2_scheme)):
     status_code=status.HTTP_201_CREATED,
     tags=["calculations"],
 )
-def create_calculation(
+async def create_calculation(
     calculation_data: CalculationBase,
     current_user = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Compute and persist a calculation.
@@ -169,124 +328,431 @@ def create_calculation(
             inputs=calculation_data.inputs,
         )
         new_calculation.result = new_calculation.get_result()
-
-        # Persist the calculation to the database.
-        db.add(new_calculation)
-        db.commit()
-        db.refresh(new_calculation)
-        return new_calculation
-
     except ValueError as e:
-        db.rollback()
+        # Nothing has been added to the session yet, so there is nothing to roll back.
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
 
+    # Persist the calculation to the database.
+    db.add(new_calculation)
+    await db.commit()
+    return new_calculation
+
+# Create many calculations in a single round-trip
+@app.post(
+    "/calculations/batch",
+    response_model=CalculationBatchResponse,
+    status_code=status.HTTP_201_CREATED,
+    tags=["calculations"],
+)
+async def create_calculations_batch(
+    items: List[Dict[str, Any]] = Body(
+        ...,
+        min_length=1,
+        max_length=settings.CALCULATION_BATCH_MAX_ITEMS,
+        examples=[[{"type": "addition", "inputs": [1, 2]}, {"type": "division", "inputs": [8, 0]}]],
+    ),
+    current_user = Depends(get_current_active_user),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Validate, compute and persist a list of calculations.
+
+    Every item is validated as a CalculationBase on its own, so one bad item
+    is reported in ``errors`` instead of rejecting the whole batch. Results
+    are computed per calculation type, and valid items are written with a
+    single multi-row INSERT and a single commit.
+    """
+    errors = []
+    by_type: Dict[str, list] = defaultdict(list)
+    for index, item in enumerate(items):
+        try:
+            calculation_data = CalculationBase.model_validate(item)
+        except ValidationError as e:
+            errors.append(CalculationBatchError(index=index, detail=e.errors()[0]["msg"]))
+            continue
+        by_type[calculation_data.type.value].append((index, calculation_data))
+
+    # Evaluate each type as one group so the NumPy engine can vectorize it.
+    computed = []
+    for calculation_type, group in by_type.items():
+        try:
+            results = Calculation.evaluate_many(calculation_type, [data.inputs for _, data in group])
+        except ValueError:
+            # Re-evaluate one by one to find out which items failed.
+            results = []
+            for index, data in group:
+                try:
+                    results.append(Calculation.evaluate_many(calculation_type, [data.inputs])[0])
+                except ValueError as e:
+                    errors.append(CalculationBatchError(index=index, detail=str(e)))
+                    results.append(None)
+        for (index, data), result in zip(group, results):
+            if result is None:
+                continue
+            # e.g. a negative base to a fractional power, which cannot be stored
+            if not is_finite_real(result):
+                errors.append(CalculationBatchError(index=index, detail="Result is not a finite real number."))
+                continue
+            computed.append((index, data, result))
+    computed.sort(key=lambda entry: entry[0])
+    errors.sort(key=lambda error: error.index)
+
+    now = datetime.utcnow()
+    rows = [
+        {
+            "id": uuid4(),
+            "user_id": current_user.id,
+            "type": data.type.value,
+            "inputs": data.inputs,
+            "result": result,
+            "created_at": now,
+            "updated_at": now,
+        }
+        for _, data, result in computed
+    ]
+
+    if rows:
+        await db.execute(insert(Calculation), rows)
+        await db.commit()
+    return CalculationBatchResponse(
+        created=[CalculationResponse(**row) for row in rows],
+        errors=errors,
+    )
+
 # Browse / List Calculations (for the current user)
 @app.get("/calculations", response_model=List[CalculationResponse], tags=["calculations"])
-def list_calculations(
+async def list_calculations(
+    response: Response,
+    limit: int = Query(
+        settings.CALCULATIONS_PAGE_SIZE,
+        ge=1,
+        le=settings.CALCULATIONS_MAX_PAGE_SIZE,
+        description="Maximum number of calculations to return",
+    ),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor value from the previous page"),
+    calculation_type: Optional[CalculationType] = Query(None, alias="type"),
+    created_after: Optional[datetime] = Query(None, description="Only calculations created at or after this time"),
+    created_before: Optional[datetime] = Query(None, description="Only calculations created before this time"),
     current_user = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
-    calculations = db.query(Calculation).filter(Calculation.user_id == current_user.id).all()
+    """
+    Return one page of the user's calculations, newest first.
+
+    Pages are keyset-paginated on (created_at, id). When more rows exist the
+    response carries an ``X-Next-Cursor`` header; pass it back as ``cursor``
+    to fetch the next page.
+    """
+    after = None
+    if cursor is not None:
+        try:
+            last = CalculationCursor.decode(cursor)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        after = (last.created_at, last.id)
+
+    stmt = Calculation.history(
+        current_user.id,
+        calculation_type=calculation_type.value if calculation_type else None,
+        created_after=created_after,
+        created_before=created_before,
+        after=after,
+    ).limit(limit + 1)
+    calculations = (await db.scalars(stmt)).all()
+
+    if len(calculations) > limit:
+        calculations = calculations[:limit]
+        last = calculations[-1]
+        response.headers["X-Next-Cursor"] = CalculationCursor(
+            created_at=last.created_at, id=last.id
+        ).encode()
     return calculations
 
+EXPORT_COLUMNS = ("id", "type", "inputs", "result", "created_at", "updated_at")
+
+async def _export_chunks(stmt, export_format: CalculationExportFormat):
+    """
+    Stream an export, one encoded chunk per database batch.
+
+    The generator owns its session because it keeps reading after the
+    request's dependencies have been torn down. ``stream`` with
+    ``yield_per`` makes the driver use a server-side cursor (asyncpg), so
+    only a single batch of rows is ever held in memory.
+    """
+    async with AsyncSessionLocal() as db:
+        if export_format == CalculationExportFormat.CSV:
+            buffer = io.StringIO()
+            csv.writer(buffer).writerow(EXPORT_COLUMNS)
+            yield buffer.getvalue()
+
+        result = await db.stream(stmt.execution_options(yield_per=settings.EXPORT_BATCH_SIZE))
+        async for rows in result.partitions():
+            buffer = io.StringIO()
+            if export_format == CalculationExportFormat.CSV:
+                writer = csv.writer(buffer)
+                for row in rows:
+                    writer.writerow([
+                        str(row.id), row.type, json.dumps(row.inputs), row.result,
+                        row.created_at.isoformat(), row.updated_at.isoformat(),
+                    ])
+            else:
+                for row in rows:
+                    buffer.write(json.dumps({
+                        "id": str(row.id),
+                        "type": row.type,
+                        "inputs": row.inputs,
+                        "result": row.result,
+                        "created_at": row.created_at.isoformat(),
+                        "updated_at": row.updated_at.isoformat(),
+                    }))
+                    buffer.write("\n")
+            yield buffer.getvalue()
+
+# Export the full calculation history as NDJSON or CSV
+@app.get("/calculations/export", tags=["calculations"])
+async def export_calculations(
+    export_format: CalculationExportFormat = Query(CalculationExportFormat.NDJSON, alias="format"),
+    calculation_type: Optional[CalculationType] = Query(None, alias="type"),
+    created_after: Optional[datetime] = Query(None, description="Only calculations created at or after this time"),
+    created_before: Optional[datetime] = Query(None, description="Only calculations created before this time"),
+    current_user = Depends(get_current_active_user),
+):
+    """
+    Stream every calculation of the current user, newest first.
+
+    Rows are fetched and encoded batch by batch, so memory use is bounded by
+    EXPORT_BATCH_SIZE rather than by the length of the history.
+    """
+    stmt = Calculation.history(
+        current_user.id,
+        calculation_type=calculation_type.value if calculation_type else None,
+        created_after=created_after,
+        created_before=created_before,
+    ).with_only_columns(*(getattr(Calculation, column) for column in EXPORT_COLUMNS))
+
+    if export_format == CalculationExportFormat.CSV:
+        media_type = "text/csv"
+    else:
+        media_type = "application/x-ndjson"
+    return StreamingResponse(
+        _export_chunks(stmt, export_format),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="calculations.{export_format.value}"'},
+    )
+
 # Read / Retrieve a Specific Calculation by ID
 @app.get("/calculations/{calc_id}", response_model=CalculationResponse, tags=["calculations"])
-def get_calculation(
+async def get_calculation(
     calc_id: str,
     current_user = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     try:
         calc_uuid = UUID(calc_id)
     except ValueError:
         raise HTTPException(status_code=400, detail="Invalid calculation id format.")
-    calculation = db.query(Calculation).filter(
+    calculation = (await db.scalars(select(Calculation).where(
         Calculation.id == calc_uuid,
         Calculation.user_id == current_user.id
-    ).first()
+    ))).first()
     if not calculation:
         raise HTTPException(status_code=404, detail="Calculation not found.")
     return calculation
 
 # Edit / Update a Calculation
 @app.put("/calculations/{calc_id}", response_model=CalculationResponse, tags=["calculations"])
-def update_calculation(
+async def update_calculation(
     calc_id: str,
     calculation_update: CalculationUpdate,
     current_user = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     try:
         calc_uuid = UUID(calc_id)
     except ValueError:
         raise HTTPException(status_code=400, detail="Invalid calculation id format.")
-    calculation = db.query(Calculation).filter(
-        Calculation.id == calc_uuid,
-        Calculation.user_id == current_user.id
-    ).first()
-    if not calculation:
-        raise HTTPException(status_code=404, detail="Calculation not found.")
 
     new_type = getattr(calculation_update, "type", None)
-    if new_type is not None:
+    if new_type is None:
+        # Input-only edits are one ownership-scoped UPDATE ... RETURNING.
+        calculation = (await db.scalars(
+            Calculation.update_inputs(calc_uuid, current_user.id, calculation_update.inputs)
+        )).first()
+        if calculation is not None:
+            await db.commit()
+            return calculation
+        # Nothing matched: only now read the row, to tell 404 from inputs
+        # its type rejects (or a type changed since the UPDATE).
+        calculation = (await db.scalars(select(Calculation).where(
+            Calculation.id == calc_uuid,
+            Calculation.user_id == current_user.id
+        ))).first()
+        if not calculation:
+            raise HTTPException(status_code=404, detail="Calculation not found.")
+        calculation.inputs = calculation_update.inputs
         try:
-            temp = Calculation.create(
-                calculation_type=new_type,
-                user_id=calculation.user_id,
-                inputs=(calculation_update.inputs or calculation.inputs),
-            )
-            computed = temp.get_result()
+            calculation.result = calculation.get_result()
+            if not is_finite_real(calculation.result):
+                raise ValueError("Result is not a finite real number.")
         except ValueError as e:
+            await db.rollback()
             raise HTTPException(status_code=400, detail=str(e))
+        calculation.updated_at = datetime.utcnow()
+        await db.commit()
+        return calculation
 
-        new_calc = temp
-        new_calc.id = calculation.id
-        new_calc.created_at = calculation.created_at
-        new_calc.updated_at = datetime.utcnow()
-        new_calc.user_id = calculation.user_id
-        new_calc.result = computed
-        try:
-            db.delete(calculation)
-            db.flush()
-            db.add(new_calc)
-            db.commit()
-            db.refresh(new_calc)
-            return new_calc
-        except Exception as e:  # pragma: no cover
-            db.rollback()
-            raise HTTPException(status_code=500, detail=str(e))
-    elif calculation_update.inputs is not None:
-        calculation.inputs = calculation_update.inputs
-        calculation.result = calculation.get_result()
-    calculation.updated_at = datetime.utcnow()
-    db.commit()
-    db.refresh(calculation)
-    return calculation
+    calculation = (await db.scalars(select(Calculation).where(
+        Calculation.id == calc_uuid,
+        Calculation.user_id == current_user.id
+    ))).first()
+    if not calculation:
+        raise HTTPException(status_code=404, detail="Calculation not found.")
+
+    try:
+        temp = Calculation.create(
+            calculation_type=new_type,
+            user_id=calculation.user_id,
+            inputs=(calculation_update.inputs or calculation.inputs),
+        )
+        computed = temp.get_result()
+        if not is_finite_real(computed):
+            raise ValueError("Result is not a finite real number.")
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    # Single-table inheritance: the subclass is just the discriminator,
+    # so the row is rewritten in place and the loaded instance is swapped
+    # for one of the new subclass carrying the same identity.
+    new_calc = temp
+    new_calc.id = calculation.id
+    new_calc.created_at = calculation.created_at
+    new_calc.updated_at = datetime.utcnow()
+    new_calc.result = computed
+    try:
+        await db.execute(
+            update(Calculation)
+            .where(Calculation.id == calculation.id)
+            .values(
+                type=new_calc.type,
+                inputs=new_calc.inputs,
+                result=computed,
+                updated_at=new_calc.updated_at,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        db.expunge(calculation)
+        make_transient_to_detached(new_calc)
+        db.add(new_calc)
+        await db.commit()
+        return new_calc
+    except Exception as e:  # pragma: no cover
+        await db.rollback()
+        raise HTTPException(status_code=500, detail=str(e))
 
 # Delete a Calculation
 @app.delete("/calculations/{calc_id}", status_code=status.HTTP_204_NO_CONTENT, tags=["calculations"])
-def delete_calculation(
+async def delete_calculation(
     calc_id: str,
     current_user = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     try:
         calc_uuid = UUID(calc_id)
     except ValueError:
         raise HTTPException(status_code=400, detail="Invalid calculation id format.")
-    calculation = db.query(Calculation).filter(
-        Calculation.id == calc_uuid,
-        Calculation.user_id == current_user.id
-    ).first()
-    if not calculation:
+    deleted = (await db.execute(
+        delete(Calculation)
+        .where(Calculation.id == calc_uuid, Calculation.user_id == current_user.id)
+        .returning(Calculation.id)
+        .execution_options(synchronize_session=False)
+    )).first()
+    if deleted is None:
         raise HTTPException(status_code=404, detail="Calculation not found.")
-    db.delete(calculation)
-    db.commit()
+    await db.commit()
     return None
 
+async def _start_delete_job(
+    background_tasks: BackgroundTasks,
+    response: Response,
+    user_id: UUID,
+    selection: Optional[CalculationDeleteRequest] = None,
+) -> CalculationDeleteJob:
+    try:
+        job = await create_delete_job(user_id)
+    except aioredis.RedisError:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Could not start delete job, retry later",
+            headers={"Retry-After": "1"},
+        )
+    background_tasks.add_task(run_delete_job, job, user_id, selection)
+    response.headers["Location"] = f"/calculations/delete-jobs/{job.id}"
+    return job
+
+# Delete many Calculations in the background
+@app.post(
+    "/calculations/bulk-delete",
+    response_model=CalculationDeleteJob,
+    status_code=status.HTTP_202_ACCEPTED,
+    tags=["calculations"],
+)
+async def bulk_delete_calculations(
+    selection: CalculationDeleteRequest,
+    background_tasks: BackgroundTasks,
+    response: Response,
+    current_user = Depends(get_current_active_user),
+):
+    """
+    Delete the user's calculations with the given ids and/or matching the
+    type and date filters.
+
+    The delete runs after the response is sent, in chunks of
+    CALCULATION_DELETE_CHUNK_SIZE rows, each committed on its own. Follow
+    its progress at the returned ``Location``.
+    """
+    if selection.ids is not None and len(selection.ids) > settings.CALCULATION_DELETE_MAX_IDS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {settings.CALCULATION_DELETE_MAX_IDS} ids per request",
+        )
+    return await _start_delete_job(background_tasks, response, current_user.id, selection)
+
+# Delete the whole calculation history in the background
+@app.delete(
+    "/calculations",
+    response_model=CalculationDeleteJob,
+    status_code=status.HTTP_202_ACCEPTED,
+    tags=["calculations"],
+)
+async def delete_all_calculations(
+    background_tasks: BackgroundTasks,
+    response: Response,
+    current_user = Depends(get_current_active_user),
+):
+    """Delete all of the user's calculations, chunked like bulk-delete."""
+    return await _start_delete_job(background_tasks, response, current_user.id)
+
+@app.get("/calculations/delete-jobs/{job_id}", response_model=CalculationDeleteJob, tags=["calculations"])
+async def read_delete_job(
+    job_id: str,
+    current_user = Depends(get_current_active_user),
+):
+    """Progress of one of the user's delete jobs; kept for CALCULATION_DELETE_JOB_TTL_SECONDS."""
+    try:
+        job = await get_delete_job(current_user.id, job_id)
+    except aioredis.RedisError:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Job status unavailable, retry later",
+            headers={"Retry-After": "1"},
+        )
+    if job is None:
+        raise HTTPException(status_code=404, detail="Delete job not found.")
+    return job
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run("main:app", host="127.0.0.1", port=8001, log_level="info")
@@ -1,13 +1,25 @@
 # Author: Roopesh Kumar Reddy Kaipa
 # Date: 24/11/2025
-from datetime import datetime
+from datetime import datetime, timezone
+import math
 import uuid
-from typing import List
-from sqlalchemy import Column, String, DateTime, ForeignKey, JSON, Float
+from typing import List, Optional, Tuple
+from sqlalchemy import Column, String, DateTime, ForeignKey, JSON, Float, Index, Delete, Select, Update, case, delete, select, tuple_, update
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship, declared_attr
 from sqlalchemy.ext.declarative import declared_attr
 from app.database import Base
+from app.operations import numpy_engine
+
+def _naive_utc(value: datetime) -> datetime:
+    """created_at is stored as naive UTC; normalize aware datetimes before comparing"""
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+def is_finite_real(value) -> bool:
+    """True for results that can be stored: real numbers that are not inf or NaN"""
+    return isinstance(value, (int, float)) and not isinstance(value, bool) and math.isfinite(value)
 
 class AbstractCalculation:
     """Abstract base class for calculations"""
@@ -30,16 +42,14 @@ class AbstractCalculation:
         return Column(
             UUID(as_uuid=True), 
             ForeignKey('users.id', ondelete='CASCADE'),
-            nullable=False,
-            index=True
+            nullable=False
         )
 
     @declared_attr
     def type(cls):
         return Column(
             String(50), 
-            nullable=False,
-            index=True
+            nullable=False
         )
 
     @declared_attr
@@ -92,6 +102,123 @@ class AbstractCalculation:
             raise ValueError(f"Unsupported calculation type: {calculation_type}")
         return calculation_class(user_id=user_id, inputs=inputs)
 
+    @classmethod
+    def history(
+        cls,
+        user_id: uuid.UUID,
+        calculation_type: Optional[str] = None,
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
+        after: Optional[Tuple[datetime, uuid.UUID]] = None,
+    ) -> Select:
+        """
+        Build a SELECT over a user's calculations, newest first.
+
+        Rows are ordered by (created_at, id) descending so that ``after`` can be
+        used as a keyset: only rows strictly older than that (created_at, id)
+        pair are returned, which keeps every page an index range scan instead
+        of an OFFSET over the whole history.
+        """
+        stmt = select(cls).where(cls.user_id == user_id)
+        if calculation_type is not None:
+            stmt = stmt.where(cls.type == calculation_type)
+        if created_after is not None:
+            stmt = stmt.where(cls.created_at >= _naive_utc(created_after))
+        if created_before is not None:
+            stmt = stmt.where(cls.created_at < _naive_utc(created_before))
+        if after is not None:
+            last_created_at, last_id = after
+            last_created_at = _naive_utc(last_created_at)
+            # The row-value comparison is what an index range can use; an
+            # OR of the two cases is only ever applied as a filter. The
+            # redundant created_at bound lets SQLite seek on it as well.
+            stmt = stmt.where(
+                cls.created_at <= last_created_at,
+                tuple_(cls.created_at, cls.id) < tuple_(last_created_at, last_id),
+            )
+        return stmt.order_by(cls.created_at.desc(), cls.id.desc())
+
+    @classmethod
+    def delete_chunk(
+        cls,
+        user_id: uuid.UUID,
+        limit: int,
+        calculation_type: Optional[str] = None,
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
+        ids: Optional[List[uuid.UUID]] = None,
+    ) -> Delete:
+        """
+        Build a DELETE of at most ``limit`` of a user's calculations matching
+        the same filters as history(), optionally restricted to ``ids``.
+
+        Running it until it deletes fewer than ``limit`` rows empties the
+        selection in short transactions instead of one long one.
+        """
+        chunk = (
+            cls.history(user_id, calculation_type, created_after, created_before)
+            .with_only_columns(cls.id)
+            .order_by(None)
+            .limit(limit)
+        )
+        if ids is not None:
+            chunk = chunk.where(cls.id.in_(ids))
+        return delete(cls).where(cls.id.in_(chunk)).execution_options(synchronize_session=False)
+
+    @classmethod
+    def update_inputs(
+        cls,
+        calculation_id: uuid.UUID,
+        user_id: uuid.UUID,
+        inputs: Optional[List[float]] = None,
+    ) -> Update:
+        """
+        Build an ownership-scoped UPDATE ... RETURNING that replaces a
+        calculation's inputs and result without loading the row first.
+
+        The result depends on the row's type, so it is computed here for
+        every type and picked with a CASE on ``type``; types that reject
+        ``inputs`` or would not give a finite real result are left out of
+        the WHERE clause, so no row matches when
+        the id is unknown, owned by someone else, or its type cannot take
+        the new inputs. Without ``inputs`` only ``updated_at`` is touched.
+        """
+        values = {"updated_at": datetime.utcnow()}
+        stmt = update(cls).where(cls.id == calculation_id, cls.user_id == user_id)
+        if inputs is not None:
+            results = {}
+            for calculation_type, mapper in cls.__mapper__.polymorphic_map.items():
+                if mapper.class_ is Calculation:
+                    continue
+                try:
+                    result = cls.create(calculation_type, user_id, inputs).get_result()
+                except ValueError:
+                    continue
+                # e.g. power of a negative base to a fractional exponent is complex
+                if is_finite_real(result):
+                    results[calculation_type] = result
+            values["inputs"] = inputs
+            values["result"] = case(results, value=cls.type) if results else None
+            stmt = stmt.where(cls.type.in_(list(results)))
+        return stmt.values(**values).returning(cls).execution_options(synchronize_session=False)
+
+    @classmethod
+    def evaluate_many(cls, calculation_type: str, inputs_list: List[List[float]]) -> List[float]:
+        """
+        Evaluate many calculations of the same type.
+
+        Uses a single vectorized NumPy pass when that engine is configured and
+        supports the type; otherwise each calculation is evaluated in Python.
+        Raises ValueError on the first invalid calculation.
+        """
+        calculation_type = calculation_type.lower()
+        if numpy_engine.enabled() and calculation_type in numpy_engine.SUPPORTED_TYPES:
+            return numpy_engine.evaluate_batch(calculation_type, inputs_list)
+        return [
+            cls.create(calculation_type, None, inputs).get_result()
+            for inputs in inputs_list
+        ]
+
     def get_result(self) -> float:
         """Method to compute calculation result"""
         raise NotImplementedError
@@ -107,6 +234,23 @@ class Calculation(Base, AbstractCalculation):
         #"with_polymorphic": "*"
     }
 
+# History is always read per user, newest first on (created_at, id); these
+# match history()'s filters and ORDER BY so the rows come off the index in
+# order instead of being sorted. They also cover lookups by user_id alone.
+Index(
+    "ix_calculations_user_created",
+    Calculation.user_id,
+    Calculation.created_at.desc(),
+    Calculation.id.desc(),
+)
+Index(
+    "ix_calculations_user_type_created",
+    Calculation.user_id,
+    Calculation.type,
+    Calculation.created_at.desc(),
+    Calculation.id.desc(),
+)
+
 class Addition(Calculation):
     """Addition calculation"""
     __mapper_args__ = {"polymorphic_identity": "addition"}
@@ -116,6 +260,8 @@ class Addition(Calculation):
             raise ValueError("Inputs must be a list of numbers.")
         if len(self.inputs) < 2:
             raise ValueError("Inputs must be a list with at least two numbers.")
+        if numpy_engine.enabled(len(self.inputs)):
+            return numpy_engine.evaluate("addition", self.inputs)
         return sum(self.inputs)
 
 class Subtraction(Calculation):
@@ -127,6 +273,8 @@ class Subtraction(Calculation):
             raise ValueError("Inputs must be a list of numbers.")
         if len(self.inputs) < 2:
             raise ValueError("Inputs must be a list with at least two numbers.")
+        if numpy_engine.enabled(len(self.inputs)):
+            return numpy_engine.evaluate("subtraction", self.inputs)
         result = self.inputs[0]
         for value in self.inputs[1:]:
             result -= value
@@ -141,6 +289,8 @@ class Multiplication(Calculation):
             raise ValueError("Inputs must be a list of numbers.")
         if len(self.inputs) < 2:
             raise ValueError("Inputs must be a list with at least two numbers.")
+        if numpy_engine.enabled(len(self.inputs)):
+            return numpy_engine.evaluate("multiplication", self.inputs)
         result = 1
         for value in self.inputs:
             result *= value
@@ -155,6 +305,8 @@ class Division(Calculation):
             raise ValueError("Inputs must be a list of numbers.")
         if len(self.inputs) < 2:
             raise ValueError("Inputs must be a list with at least two numbers.")
+        if numpy_engine.enabled(len(self.inputs)):
+            return numpy_engine.evaluate("division", self.inputs)
         result = self.inputs[0]
         for value in self.inputs[1:]:
             if value == 0:
@@ -1,10 +1,14 @@
 # Author: Roopesh Kumar Reddy Kaipa
 # Date: 24/11/2025
+import time
 import uuid
 from datetime import datetime, timezone, timedelta
-from sqlalchemy import Column, String, Boolean, DateTime, or_
+from sqlalchemy import Column, String, Boolean, DateTime, event, or_
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.orm import relationship
+from starlette.concurrency import run_in_threadpool
+from app.auth.identity import encode_identity
+from app.auth.cache import cache_token_claims, get_token_claims, user_cache
 from app.core.config import get_settings
 from app.database import Base
 from app.models.calculation import Calculation
@@ -67,6 +71,15 @@ class User(Base):
         self.updated_at = utcnow()
         return self
 
+    def snapshot(self) -> dict:
+        """Return the column values of this user, e.g. for caching."""
+        return {column.key: getattr(self, column.key) for column in self.__table__.columns}
+
+    @classmethod
+    def from_snapshot(cls, snapshot: dict) -> "User":
+        """Rebuild a detached (transient) user from snapshot()."""
+        return cls(**snapshot)
+
     @property
     def hashed_password(self):
         """Return the stored hashed password."""
@@ -85,6 +98,18 @@ class User(Base):
         from app.auth.jwt import verify_password
         return verify_password(plain_password, self.password)
 
+    def verify_and_update_password(self, plain_password: str) -> bool:
+        """
+        Verify a password like verify_password(), and if the stored hash uses
+        an outdated bcrypt cost, replace it with one at the configured cost.
+        The new hash is saved with the session's next commit.
+        """
+        from app.auth.jwt import verify_and_update_password
+        valid, new_hash = verify_and_update_password(plain_password, self.password)
+        if valid and new_hash:
+            self.password = new_hash
+        return valid
+
     @classmethod
     def hash_password(cls, password: str) -> str:
         """
@@ -100,17 +125,10 @@ class User(Base):
         return get_password_hash(password)
 
     @classmethod
-    def register(cls, db, user_data: dict):
+    def _check_registration(cls, db, user_data: dict) -> str:
         """
-        Register a new user.
+        Validate registration data and return the plain-text password.
 
-        Args:
-            db: SQLAlchemy database session
-            user_data: Dictionary containing user registration data
-            
-        Returns:
-            User: The newly created user instance
-            
         Raises:
             ValueError: If password is invalid or username/email already exists
         """
@@ -124,9 +142,11 @@ class User(Base):
         ).first()
         if existing_user:
             raise ValueError("Username or email already exists")
-        
-        # Create new user instance
-        hashed_password = cls.hash_password(password)
+        return password
+
+    @classmethod
+    def _build(cls, db, user_data: dict, hashed_password: str):
+        """Create and add a new user instance with an already hashed password."""
         user = cls(
             first_name=user_data["first_name"],
             last_name=user_data["last_name"],
@@ -140,32 +160,57 @@ class User(Base):
         return user
 
     @classmethod
-    def authenticate(cls, db, username_or_email: str, password: str):
+    def register(cls, db, user_data: dict):
         """
-        Authenticate a user by username/email and password.
-        
+        Register a new user.
+
         Args:
             db: SQLAlchemy database session
-            username_or_email: Username or email to authenticate
-            password: Password to verify
+            user_data: Dictionary containing user registration data
             
         Returns:
-            dict: Authentication result with tokens and user data, or None if authentication fails
+            User: The newly created user instance
+            
+        Raises:
+            ValueError: If password is invalid or username/email already exists
         """
-        user = db.query(cls).filter(
+        password = cls._check_registration(db, user_data)
+        return cls._build(db, user_data, cls.hash_password(password))
+
+    @classmethod
+    async def register_async(cls, db, user_data: dict):
+        """
+        Register a new user without blocking the event loop.
+
+        Same contract as register(); the queries run in the threadpool and
+        bcrypt runs in the password hashing pool.
+        """
+        from app.auth.jwt import get_password_hash_async
+        password = await run_in_threadpool(cls._check_registration, db, user_data)
+        hashed_password = await get_password_hash_async(password)
+        return cls._build(db, user_data, hashed_password)
+
+    @classmethod
+    def find_by_login(cls, db, username_or_email: str):
+        """Return the user matching a username or email, or None."""
+        return db.query(cls).filter(
             or_(cls.username == username_or_email, cls.email == username_or_email)
         ).first()
 
-        if not user or not user.verify_password(password):
-            return None
+    def start_session(self, db) -> dict:
+        """
+        Record a successful login and issue a fresh token pair.
 
+        Returns:
+            dict: Authentication result with tokens and user data
+        """
         # Update the last_login timestamp
-        user.last_login = utcnow()
+        self.last_login = utcnow()
         db.flush()
 
         # Generate tokens
-        access_token = cls.create_access_token({"sub": str(user.id)})
-        refresh_token = cls.create_refresh_token({"sub": str(user.id)})
+        access_token = self.create_access_token({"sub": str(self.id), "idn": encode_identity(self)})
+        refresh_token = self.create_refresh_token({"sub": str(self.id)})
         expires_at = utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
 
         return {
@@ -173,9 +218,64 @@ class User(Base):
             "refresh_token": refresh_token,
             "token_type": "bearer",
             "expires_at": expires_at,
-            "user": user
+            "user": self
         }
 
+    @classmethod
+    def authenticate(cls, db, username_or_email: str, password: str):
+        """
+        Authenticate a user by username/email and password. A password hash
+        made with an outdated bcrypt cost is transparently upgraded.
+        
+        Args:
+            db: SQLAlchemy database session
+            username_or_email: Username or email to authenticate
+            password: Password to verify
+            
+        Returns:
+            dict: Authentication result with tokens and user data, or None if authentication fails
+        """
+        user = cls.find_by_login(db, username_or_email)
+        if not user:
+            # same bcrypt cost as a wrong password, so timing does not reveal the user exists
+            from app.auth.jwt import verify_dummy_password
+            verify_dummy_password(password)
+            return None
+        if not user.verify_and_update_password(password):
+            return None
+        return user.start_session(db)
+
+    @classmethod
+    async def authenticate_async(cls, db, username_or_email: str, password: str):
+        """
+        Authenticate a user without blocking the event loop.
+
+        Same contract as authenticate(); the queries run in the threadpool and
+        bcrypt runs in the password hashing pool. Unknown login names cost
+        one dummy verify, and with LOGIN_LATENCY_PADDING every outcome is
+        padded to the measured bcrypt time.
+        """
+        from app.auth.jwt import (
+            pad_login_latency,
+            verify_and_update_password_async,
+            verify_dummy_password_async,
+        )
+        started_at = time.perf_counter()
+        user = await run_in_threadpool(cls.find_by_login, db, username_or_email)
+        if not user:
+            await verify_dummy_password_async(password)
+            await pad_login_latency(started_at)
+            return None
+        valid, new_hash = await verify_and_update_password_async(password, user.password)
+        if not valid:
+            await pad_login_latency(started_at)
+            return None
+        if new_hash:
+            user.password = new_hash
+        result = await run_in_threadpool(user.start_session, db)
+        await pad_login_latency(started_at)
+        return result
+
     @classmethod
     def create_access_token(cls, data: dict) -> str:
         """
@@ -189,7 +289,7 @@ class User(Base):
         """
         from app.auth.jwt import create_token
         from app.schemas.token import TokenType
-        return create_token(data["sub"], TokenType.ACCESS)
+        return create_token(data["sub"], TokenType.ACCESS, identity=data.get("idn"))
 
     @classmethod
     def create_refresh_token(cls, data: dict) -> str:
@@ -206,6 +306,31 @@ class User(Base):
         from app.schemas.token import TokenType
         return create_token(data["sub"], TokenType.REFRESH)
 
+    @classmethod
+    def verify_token_claims(cls, token: str):
+        """
+        Verify a JWT access token and return its claims.
+
+        Args:
+            token: JWT token to verify
+
+        Returns:
+            dict: Verified claims if the token is valid, None otherwise
+        """
+        from app.auth.keys import verification_params
+        from app.schemas.token import TokenType
+        from jose import jwt, JWTError
+        try:
+            payload = get_token_claims(token, "access")
+            if payload is None:
+                key, algorithms = verification_params(token, TokenType.ACCESS)
+                payload = jwt.decode(token, key, algorithms=algorithms)
+                if payload.get("type") == "access":
+                    cache_token_claims(token, "access", payload)
+            return payload
+        except JWTError:
+            return None
+
     @classmethod
     def verify_token(cls, token: str):
         """
@@ -217,16 +342,19 @@ class User(Base):
         Returns:
             UUID: User ID if token is valid, None otherwise
         """
-        from app.core.config import settings
-        from jose import jwt, JWTError
+        payload = cls.verify_token_claims(token)
+        if payload is None:
+            return None
+        sub = payload.get("sub")
+        if sub is None:
+            return None
         try:
-            payload = jwt.decode(token, settings.JWT_SECRET_KEY, algorithms=[settings.ALGORITHM])
-            sub = payload.get("sub")
-            if sub is None:
-                return None
-            try:
-                return uuid.UUID(sub)
-            except (ValueError, TypeError):
-                return None
-        except JWTError:
-            return None
\ No newline at end of file
+            return uuid.UUID(sub)
+        except (ValueError, TypeError):
+            return None
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _invalidate_cached_user(mapper, connection, target):
+    """Drop a user from the identity cache as soon as their row changes."""
+    user_cache.pop(target.id)
@@ -0,0 +1,129 @@
+# Author: Roopesh Kumar Reddy Kaipa
+# Date: 18/10/2026
+"""
+Module: numpy_engine.py
+
+Optional NumPy evaluation backend for the Calculation models. It evaluates a
+single calculation, or a whole batch of calculations of the same type, as
+array reductions instead of Python loops.
+
+The engine is selected with ``CALCULATION_ENGINE="numpy"`` in Settings and is
+only used when NumPy is importable; otherwise the pure-Python path is kept.
+
+Tolerance:
+Multiplication and division are reduced left to right like the pure-Python
+loops, so they give the same values, including the same overflow to inf or
+underflow to 0. They agree within ``rel_tol=RTOL``.
+Sums use pairwise summation, so addition and subtraction can differ in the
+last bits. Their rounding error scales with the magnitude of the inputs, not
+of the result. They agree within ``rel_tol=RTOL``,
+``abs_tol=RTOL * sum(abs(x) for x in inputs)``. isclose() applies these rules.
+
+Functions:
+- enabled(size) -> bool: Whether the NumPy engine should be used.
+- isclose(calculation_type, a, b, inputs) -> bool: Whether two results agree
+  within the tolerance above.
+- evaluate(calculation_type, inputs) -> float: Evaluate one calculation.
+- evaluate_batch(calculation_type, inputs_list) -> List[float]: Evaluate many
+  same-type calculations at once.
+"""
+
+import math
+from typing import List, Optional, Sequence
+
+from app.core.config import settings
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is an optional dependency
+    np = None
+
+# Relative tolerance between the NumPy and pure-Python results
+RTOL = 1e-9
+
+SUPPORTED_TYPES = ("addition", "subtraction", "multiplication", "division")
+
+def enabled(size: Optional[int] = None) -> bool:
+    """
+    Return True when the NumPy engine is configured, installed, and worth using.
+
+    When `size` is given (a single calculation), inputs shorter than
+    NUMPY_ENGINE_MIN_INPUTS stay on the pure-Python path because array setup
+    costs more than the loop it replaces. Batches always vectorize.
+    """
+    if np is None or settings.CALCULATION_ENGINE != "numpy":
+        return False
+    return size is None or size >= settings.NUMPY_ENGINE_MIN_INPUTS
+
+def isclose(calculation_type: str, a: float, b: float, inputs: Sequence[float]) -> bool:
+    """Whether NumPy and pure-Python results `a` and `b` agree for `inputs`"""
+    abs_tol = 0.0
+    if calculation_type in ("addition", "subtraction"):
+        abs_tol = RTOL * sum(abs(x) for x in inputs)
+    return math.isclose(a, b, rel_tol=RTOL, abs_tol=abs_tol)
+
+def _check(calculation_type: str, inputs: Sequence[float]) -> None:
+    """Apply the same arity and division-by-zero rules as the models"""
+    if calculation_type not in SUPPORTED_TYPES:
+        raise ValueError(f"Unsupported calculation type: {calculation_type}")
+    if not isinstance(inputs, list):
+        raise ValueError("Inputs must be a list of numbers.")
+    if len(inputs) < 2:
+        raise ValueError("Inputs must be a list with at least two numbers.")
+    if calculation_type == "division" and any(value == 0 for value in inputs[1:]):
+        raise ValueError("Cannot divide by zero.")
+
+def _reduce(calculation_type: str, matrix) -> "np.ndarray":
+    """
+    Reduce each row of `matrix` according to the calculation type.
+
+    Rows are padded with the identity of the tail reduction (0 for sums,
+    1 for products and quotients), so ragged batches give the same answer as
+    unpadded rows.
+    """
+    first, rest = matrix[:, 0], matrix[:, 1:]
+    # Python floats overflow to inf and underflow to 0 silently; so do these.
+    with np.errstate(over="ignore", under="ignore", invalid="ignore"):
+        if calculation_type == "addition":
+            return matrix.sum(axis=1)
+        if calculation_type == "subtraction":
+            return first - rest.sum(axis=1)
+        if calculation_type == "multiplication":
+            return np.multiply.reduce(matrix, axis=1)
+        # One division at a time, left to right: dividing by the product of
+        # the divisors would overflow or underflow where the loop does not.
+        return np.divide.reduce(matrix, axis=1)
+
+def evaluate(calculation_type: str, inputs: Sequence[float]) -> float:
+    """
+    Evaluate a single calculation with NumPy.
+
+    Raises:
+    - ValueError: For unsupported types, too few inputs or division by zero.
+    """
+    _check(calculation_type, inputs)
+    matrix = np.asarray(inputs, dtype=np.float64).reshape(1, -1)
+    return float(_reduce(calculation_type, matrix)[0])
+
+def evaluate_batch(calculation_type: str, inputs_list: Sequence[Sequence[float]]) -> List[float]:
+    """
+    Evaluate many calculations of the same type in one vectorized pass.
+
+    Raises:
+    - ValueError: If any row breaks the arity or division-by-zero rules; the
+      message names the offending row.
+    """
+    for index, inputs in enumerate(inputs_list):
+        try:
+            _check(calculation_type, inputs)
+        except ValueError as e:
+            raise ValueError(f"Row {index}: {e}")
+    if not inputs_list:
+        return []
+
+    pad = 0.0 if calculation_type in ("addition", "subtraction") else 1.0
+    width = max(len(inputs) for inputs in inputs_list)
+    matrix = np.full((len(inputs_list), width), pad, dtype=np.float64)
+    for row, inputs in enumerate(inputs_list):
+        matrix[row, :len(inputs)] = inputs
+    return _reduce(calculation_type, matrix).tolist()
@@ -8,13 +8,20 @@ from .user import (
     PasswordUpdate
 )
 
-from .token import Token, TokenData, TokenResponse
+from .token import RefreshRequest, Token, TokenData, TokenResponse
 from .calculation import (
     CalculationType,
     CalculationBase,
     CalculationCreate,
     CalculationUpdate,
-    CalculationResponse
+    CalculationResponse,
+    CalculationBatchError,
+    CalculationBatchResponse,
+    CalculationCursor,
+    CalculationDeleteJob,
+    CalculationDeleteJobStatus,
+    CalculationDeleteRequest,
+    CalculationExportFormat
 )
 
 __all__ = [
@@ -24,6 +31,7 @@ __all__ = [
     'UserLogin',
     'UserUpdate',
     'PasswordUpdate',
+    'RefreshRequest',
     'Token',
     'TokenData',
     'TokenResponse',
@@ -32,4 +40,11 @@ __all__ = [
     'CalculationCreate',
     'CalculationUpdate',
     'CalculationResponse',
+    'CalculationBatchError',
+    'CalculationBatchResponse',
+    'CalculationCursor',
+    'CalculationDeleteJob',
+    'CalculationDeleteJobStatus',
+    'CalculationDeleteRequest',
+    'CalculationExportFormat',
 ]
\ No newline at end of file
@@ -1,5 +1,6 @@
 # Author: Roopesh Kumar Reddy Kaipa
 # Date: 24/11/2025
+import base64
 from enum import Enum
 from pydantic import BaseModel, Field, ConfigDict, model_validator, field_validator
 from typing import List, Optional
@@ -14,6 +15,18 @@ class CalculationType(str, Enum):
     DIVISION = "division"
     POWER = "power"
 
+class CalculationExportFormat(str, Enum):
+    """Supported formats for streaming a calculation history export"""
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+class CalculationDeleteJobStatus(str, Enum):
+    """Lifecycle of a background bulk delete"""
+    PENDING = "pending"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+
 class CalculationBase(BaseModel):
     type: CalculationType = Field(
         ...,
@@ -152,3 +165,59 @@ class CalculationResponse(CalculationBase):
             }
         }
     )
+
+class CalculationBatchError(BaseModel):
+    """A batch item that could not be validated or computed"""
+    index: int = Field(..., description="Position of the item in the submitted batch", example=2)
+    detail: str = Field(..., description="Why the item was rejected", example="Cannot divide by zero")
+
+class CalculationBatchResponse(BaseModel):
+    """Outcome of a batch submission; rejected items do not fail the batch"""
+    created: List[CalculationResponse] = Field(..., description="Calculations that were stored")
+    errors: List[CalculationBatchError] = Field(..., description="Items that were rejected")
+
+class CalculationDeleteRequest(BaseModel):
+    """Calculations to delete in the background; all given criteria must match"""
+    ids: Optional[List[UUID]] = Field(None, description="Only these calculations", min_length=1)
+    type: Optional[CalculationType] = Field(None, description="Only calculations of this type")
+    created_after: Optional[datetime] = Field(None, description="Only calculations created at or after this time")
+    created_before: Optional[datetime] = Field(None, description="Only calculations created before this time")
+
+    @model_validator(mode='after')
+    def require_criteria(self) -> "CalculationDeleteRequest":
+        """An empty selection would delete everything; that is DELETE /calculations"""
+        if self.ids is None and self.type is None and self.created_after is None and self.created_before is None:
+            raise ValueError("Give ids or at least one filter; use DELETE /calculations to delete all history")
+        return self
+
+    model_config = ConfigDict(
+        json_schema_extra={"example": {"type": "division", "created_before": "2025-01-01T00:00:00"}}
+    )
+
+class CalculationDeleteJob(BaseModel):
+    """Progress of a background bulk delete"""
+    id: str = Field(..., description="Job id, for GET /calculations/delete-jobs/{id}")
+    status: CalculationDeleteJobStatus = Field(CalculationDeleteJobStatus.PENDING, description="Where the job is")
+    deleted: int = Field(0, description="Calculations deleted so far")
+    created_at: datetime = Field(..., description="When the job was accepted")
+    finished_at: Optional[datetime] = Field(None, description="When the job finished or failed")
+    detail: Optional[str] = Field(None, description="Why the job failed")
+
+class CalculationCursor(BaseModel):
+    """Opaque keyset cursor pointing at the last calculation of a page"""
+    created_at: datetime = Field(..., description="created_at of the last row returned")
+    id: UUID = Field(..., description="id of the last row returned")
+
+    def encode(self) -> str:
+        """Serialize the cursor to a URL-safe token"""
+        raw = self.model_dump_json().encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> "CalculationCursor":
+        """Parse a token produced by encode(); raises ValueError if it is malformed"""
+        try:
+            raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+            return cls.model_validate_json(raw)
+        except ValueError:
+            raise ValueError("Invalid cursor")
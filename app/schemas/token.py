@@ -29,6 +29,18 @@ class Token(BaseModel):
         }
     )
 
+class RefreshRequest(BaseModel):
+    """Schema for exchanging a refresh token for a new token pair."""
+    refresh_token: str = Field(..., description="JWT refresh token")
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "refresh_token": "eyJ0eXAiOiJKV1QiLCJhbGciOiJIUzI1NiJ9..."
+            }
+        }
+    )
+
 class TokenData(BaseModel):
     """Schema for JWT token payload."""
     user_id: UUID = Field(..., description="User ID from the token")
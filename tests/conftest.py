@@ -12,9 +12,11 @@ import requests
 from faker import Faker
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool
 from playwright.sync_api import sync_playwright, Browser, Page
 
-from app.database import Base, get_engine, get_sessionmaker
+from app.database import AsyncSessionLocal, Base, get_async_database_url, get_engine, get_sessionmaker
 from app.models.user import User
 from app.core.config import settings
 from app.database_init import init_db, drop_db
@@ -39,6 +41,12 @@ else:
 
 TestingSessionLocal = get_sessionmaker(engine=test_engine)
 
+# TestClient runs each request on a fresh event loop unless it is used as a
+# context manager, and pooled asyncpg connections cannot move between loops.
+# Give the app's async sessions an unpooled engine for the test run.
+test_async_url = get_async_database_url(test_engine.url.render_as_string(hide_password=False))
+AsyncSessionLocal.configure(bind=create_async_engine(test_async_url, poolclass=NullPool))
+
 def create_fake_user() -> Dict[str, str]:
     """Generate a dictionary of fake user data for testing."""
     return {
@@ -125,6 +133,20 @@ def db_session() -> Generator[Session, None, None]:
     finally:
         session.close()
 
+class FakeClock:
+    """A settable stand-in for ``time.monotonic``-style clocks."""
+
+    def __init__(self, now: float = 0.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+@pytest.fixture
+def fake_clock() -> FakeClock:
+    """Provide a clock that only moves when the test sets ``now``."""
+    return FakeClock()
+
 @pytest.fixture
 def fake_user_data() -> Dict[str, str]:
     """Provide fake user data."""
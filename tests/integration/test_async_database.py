@@ -0,0 +1,51 @@
+# Author: Roopesh Kumar Reddy Kaipa
+# Date: 18/10/2026
+import asyncio
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+
+from app.auth import jwt as auth_jwt
+from app.database import AsyncSessionLocal, get_async_database_url
+from app.models.calculation import Calculation
+from app.models.user import User
+
+
+def test_get_async_database_url_maps_drivers():
+    assert get_async_database_url("sqlite:///./db.sqlite") == "sqlite+aiosqlite:///./db.sqlite"
+    assert get_async_database_url("postgresql://u:p@localhost:5432/db") == "postgresql+asyncpg://u:p@localhost:5432/db"
+    assert get_async_database_url("postgresql+psycopg2://u:p@db/x") == "postgresql+asyncpg://u:p@db/x"
+    with pytest.raises(ValueError):
+        get_async_database_url("mysql://u:p@localhost/db")
+
+
+def test_async_session_reads_committed_rows(db_session, test_user):
+    calc = Calculation.create("addition", test_user.id, [1, 2])
+    calc.result = calc.get_result()
+    db_session.add(calc)
+    db_session.commit()
+
+    async def load():
+        async with AsyncSessionLocal() as db:
+            rows = (await db.scalars(Calculation.history(test_user.id))).all()
+            return [(type(row).__name__, row.result) for row in rows]
+
+    assert asyncio.run(load()) == [("Addition", 3)]
+
+
+def test_get_current_user_with_async_session(test_user):
+    token = auth_jwt.create_token(test_user.id, auth_jwt.TokenType.ACCESS)
+
+    async def resolve(token):
+        async with AsyncSessionLocal() as db:
+            return await auth_jwt.get_current_user(token=token, db=db)
+
+    user = asyncio.run(resolve(token))
+    assert isinstance(user, User)
+    assert user.id == test_user.id
+
+    missing = auth_jwt.create_token(uuid4(), auth_jwt.TokenType.ACCESS)
+    with pytest.raises(HTTPException) as excinfo:
+        asyncio.run(resolve(missing))
+    assert excinfo.value.status_code == 401
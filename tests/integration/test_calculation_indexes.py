@@ -0,0 +1,61 @@
+# Author: Roopesh Kumar Reddy Kaipa
+# Date: 18/10/2026
+import re
+import uuid
+from datetime import datetime
+
+import pytest
+
+from app.models.calculation import Calculation
+
+
+def _plan(db_session, stmt):
+    """Query plan lines for ``stmt`` on the test database."""
+    conn = db_session.connection()
+    compiled = stmt.compile(dialect=conn.dialect)
+    if compiled.positiontup is not None:
+        params = tuple(_raw(compiled.params[name]) for name in compiled.positiontup)
+    else:
+        params = {name: _raw(value) for name, value in compiled.params.items()}
+
+    if conn.dialect.name == "sqlite":
+        rows = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {compiled}", params).all()
+        return [row[-1] for row in rows]
+    if conn.dialect.name == "postgresql":
+        # The test tables are tiny; make the planner show whether it *can*
+        # use an index rather than whether it prefers a seq scan here.
+        conn.exec_driver_sql("SET LOCAL enable_seqscan = off")
+        return [row[0] for row in conn.exec_driver_sql(f"EXPLAIN {compiled}", params).all()]
+    pytest.skip(f"no plan assertions for {conn.dialect.name}")
+
+
+def _raw(value):
+    return str(value) if isinstance(value, uuid.UUID) else value
+
+
+def _assert_index_ordered(plan, index, bounded_by_created_at=False):
+    text = "\n".join(plan)
+    assert index in text, text
+    # rows come off the index in ORDER BY order, with no separate sort step
+    assert "TEMP B-TREE" not in text, text
+    assert not any(line.strip().startswith("Sort") for line in plan), text
+    if bounded_by_created_at:
+        # the created_at range must bound the index scan, not filter its rows
+        assert any(
+            re.search(r"created_at[<>]", line)
+            or ("Index Cond" in line and "created_at" in line)
+            for line in plan
+        ), text
+
+
+@pytest.mark.parametrize("kwargs, index, bounded", [
+    ({}, "ix_calculations_user_created", False),
+    ({"created_after": datetime(2025, 1, 1), "created_before": datetime(2025, 2, 1)}, "ix_calculations_user_created", True),
+    ({"after": (datetime(2025, 1, 1), uuid.UUID(int=1))}, "ix_calculations_user_created", True),
+    ({"calculation_type": "addition"}, "ix_calculations_user_type_created", False),
+    ({"calculation_type": "addition", "created_after": datetime(2025, 1, 1)}, "ix_calculations_user_type_created", True),
+    ({"calculation_type": "addition", "after": (datetime(2025, 1, 1), uuid.UUID(int=1))}, "ix_calculations_user_type_created", True),
+])
+def test_history_pages_use_composite_index(db_session, kwargs, index, bounded):
+    stmt = Calculation.history(uuid.uuid4(), **kwargs).limit(100)
+    _assert_index_ordered(_plan(db_session, stmt), index, bounded_by_created_at=bounded)
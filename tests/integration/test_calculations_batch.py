@@ -0,0 +1,74 @@
+# Author: Roopesh Kumar Reddy Kaipa
+# Date: 18/10/2026
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.models.calculation import Calculation, Division
+from app.auth.dependencies import get_current_active_user
+
+
+def test_batch_creates_valid_items_and_reports_errors(db_session, test_user):
+    payload = [
+        {"type": "addition", "inputs": [1, 2, 3]},
+        {"type": "division", "inputs": [8, 0]},
+        {"type": "modulo", "inputs": [1, 2]},
+        {"type": "power", "inputs": [2, 10]},
+        {"type": "division", "inputs": [9, 3]},
+        {"type": "addition", "inputs": [1]},
+    ]
+
+    app.dependency_overrides[get_current_active_user] = lambda: test_user
+    try:
+        client = TestClient(app)
+        r = client.post("/calculations/batch", json=payload)
+        assert r.status_code == 201
+        body = r.json()
+    finally:
+        app.dependency_overrides.pop(get_current_active_user, None)
+
+    assert [c["result"] for c in body["created"]] == [6, 1024, 3]
+    assert [e["index"] for e in body["errors"]] == [1, 2, 5]
+    assert "divide by zero" in body["errors"][0]["detail"]
+
+    stored = db_session.query(Calculation).filter(Calculation.user_id == test_user.id).all()
+    assert {str(c.id) for c in stored} == {c["id"] for c in body["created"]}
+    # Rows written by the bulk INSERT load back as the right subclass
+    division = next(c for c in stored if c.type == "division")
+    assert isinstance(division, Division)
+    assert division.get_result() == 3
+
+
+def test_batch_rejects_empty_and_all_invalid(test_user):
+    app.dependency_overrides[get_current_active_user] = lambda: test_user
+    try:
+        client = TestClient(app)
+        r = client.post("/calculations/batch", json=[])
+        assert r.status_code == 422
+
+        r = client.post("/calculations/batch", json=[{"type": "addition"}])
+        assert r.status_code == 201
+        assert r.json()["created"] == []
+        assert r.json()["errors"][0]["index"] == 0
+    finally:
+        app.dependency_overrides.pop(get_current_active_user, None)
+
+
+def test_batch_reports_non_real_results_per_item(db_session, test_user):
+    payload = [
+        {"type": "power", "inputs": [-8, 0.5]},
+        {"type": "multiplication", "inputs": [1e200, 1e200]},
+        {"type": "addition", "inputs": [1, 2]},
+    ]
+
+    app.dependency_overrides[get_current_active_user] = lambda: test_user
+    try:
+        client = TestClient(app)
+        r = client.post("/calculations/batch", json=payload)
+        assert r.status_code == 201
+        body = r.json()
+    finally:
+        app.dependency_overrides.pop(get_current_active_user, None)
+
+    assert [c["result"] for c in body["created"]] == [3]
+    assert [e["index"] for e in body["errors"]] == [0, 1]
+    assert body["errors"][0]["detail"] == "Result is not a finite real number."
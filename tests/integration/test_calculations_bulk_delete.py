@@ -0,0 +1,134 @@
+# Author: Roopesh Kumar Reddy Kaipa
+# Date: 18/10/2026
+from datetime import datetime, timedelta
+
+import aioredis
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import select
+
+from app import jobs
+from app.main import app
+from app.models.calculation import Calculation
+from app.auth.dependencies import get_current_active_user
+
+
+def _seed_history(db_session, user, count=5):
+    base = datetime(2025, 1, 1, 12, 0, 0)
+    calcs = []
+    for i in range(count):
+        calc_type = "addition" if i % 2 == 0 else "multiplication"
+        calc = Calculation.create(calculation_type=calc_type, user_id=user.id, inputs=[i, 2])
+        calc.result = calc.get_result()
+        calc.created_at = base + timedelta(minutes=i)
+        calcs.append(calc)
+    db_session.add_all(calcs)
+    db_session.commit()
+    return calcs
+
+
+def _remaining(db_session, user):
+    db_session.expire_all()
+    return set(db_session.scalars(select(Calculation.id).where(Calculation.user_id == user.id)))
+
+
+@pytest.fixture
+def client_as(test_user):
+    app.dependency_overrides[get_current_active_user] = lambda: test_user
+    try:
+        yield TestClient(app)
+    finally:
+        app.dependency_overrides.pop(get_current_active_user, None)
+
+
+@pytest.fixture
+def small_chunks(monkeypatch):
+    monkeypatch.setattr(jobs.settings, "CALCULATION_DELETE_CHUNK_SIZE", 2)
+
+
+def test_bulk_delete_by_filter(db_session, test_user, seed_users, client_as, small_chunks):
+    calcs = _seed_history(db_session, test_user)
+    others = _seed_history(db_session, seed_users[0])
+    # additions at 12:00 and 12:02 match; the one at 12:04 is too late
+    kept = {calcs[1].id, calcs[3].id, calcs[4].id}
+
+    r = client_as.post("/calculations/bulk-delete", json={
+        "type": "addition",
+        "created_before": "2025-01-01T12:03:00",
+    })
+    assert r.status_code == 202
+    # TestClient runs background tasks before returning the response.
+    job = client_as.get(r.headers["Location"]).json()
+    assert job["status"] == "done"
+    assert job["deleted"] == 2
+    assert _remaining(db_session, test_user) == kept
+    assert len(_remaining(db_session, seed_users[0])) == len(others)
+
+
+def test_bulk_delete_by_ids_is_owner_scoped(db_session, test_user, seed_users, client_as, small_chunks):
+    calcs = _seed_history(db_session, test_user)
+    others = _seed_history(db_session, seed_users[0])
+    ids = [str(c.id) for c in calcs[:3]] + [str(others[0].id)]
+    kept = {c.id for c in calcs[3:]}
+    other_id = others[0].id
+
+    r = client_as.post("/calculations/bulk-delete", json={"ids": ids})
+    assert r.status_code == 202
+    job = client_as.get(r.headers["Location"]).json()
+    assert job["deleted"] == 3
+    assert _remaining(db_session, test_user) == kept
+    assert other_id in _remaining(db_session, seed_users[0])
+
+
+def test_delete_all_history_in_chunks(db_session, test_user, client_as, small_chunks):
+    _seed_history(db_session, test_user, count=5)
+
+    r = client_as.delete("/calculations")
+    assert r.status_code == 202
+    assert r.json()["status"] == "pending"
+    job = client_as.get(f"/calculations/delete-jobs/{r.json()['id']}").json()
+    assert job["status"] == "done"
+    assert job["deleted"] == 5
+    assert job["finished_at"] is not None
+    assert _remaining(db_session, test_user) == set()
+
+
+def test_bulk_delete_requires_criteria(client_as):
+    r = client_as.post("/calculations/bulk-delete", json={})
+    assert r.status_code == 422
+
+
+def test_bulk_delete_caps_ids(monkeypatch, client_as):
+    monkeypatch.setattr("app.main.settings.CALCULATION_DELETE_MAX_IDS", 1)
+    ids = ["00000000-0000-0000-0000-000000000001", "00000000-0000-0000-0000-000000000002"]
+    r = client_as.post("/calculations/bulk-delete", json={"ids": ids})
+    assert r.status_code == 400
+
+
+def test_unknown_job_is_404(client_as):
+    assert client_as.get("/calculations/delete-jobs/nope").status_code == 404
+
+
+def test_delete_job_fails_closed_without_redis(monkeypatch, db_session, test_user, client_as):
+    _seed_history(db_session, test_user, count=2)
+
+    async def _down(*args, **kwargs):
+        raise aioredis.RedisError("down")
+
+    monkeypatch.setattr(jobs, "save_delete_job", _down)
+    r = client_as.delete("/calculations")
+    assert r.status_code == 503
+    assert len(_remaining(db_session, test_user)) == 2
+
+
+def test_failed_chunk_marks_job_failed(monkeypatch, db_session, test_user, client_as):
+    _seed_history(db_session, test_user, count=2)
+
+    async def _broken(stmt):
+        raise RuntimeError("database went away")
+
+    monkeypatch.setattr(jobs, "_delete_chunk", _broken)
+    r = client_as.delete("/calculations")
+    job = client_as.get(r.headers["Location"]).json()
+    assert job["status"] == "failed"
+    assert job["detail"] == "database went away"
@@ -0,0 +1,61 @@
+# Author: Roopesh Kumar Reddy Kaipa
+# Date: 18/10/2026
+import csv
+import io
+import json
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.models.calculation import Calculation
+from app.auth.dependencies import get_current_active_user
+from app.core.config import settings
+
+
+def _seed(db_session, user, count):
+    for i in range(count):
+        calc = Calculation.create(calculation_type="addition", user_id=user.id, inputs=[i, 1])
+        calc.result = calc.get_result()
+        db_session.add(calc)
+    db_session.commit()
+
+
+def test_export_ndjson_streams_all_rows_in_batches(monkeypatch, db_session, test_user):
+    _seed(db_session, test_user, 7)
+    monkeypatch.setattr(settings, "EXPORT_BATCH_SIZE", 3)
+
+    app.dependency_overrides[get_current_active_user] = lambda: test_user
+    try:
+        client = TestClient(app)
+        r = client.get("/calculations/export")
+        assert r.status_code == 200
+        assert r.headers["content-type"].startswith("application/x-ndjson")
+        rows = [json.loads(line) for line in r.text.splitlines()]
+        assert len(rows) == 7
+        assert sorted(row["inputs"][0] for row in rows) == list(range(7))
+        assert all(row["result"] == row["inputs"][0] + 1 for row in rows)
+    finally:
+        app.dependency_overrides.pop(get_current_active_user, None)
+
+
+def test_export_csv_with_type_filter(db_session, test_user):
+    _seed(db_session, test_user, 2)
+    calc = Calculation.create(calculation_type="multiplication", user_id=test_user.id, inputs=[3, 4])
+    calc.result = calc.get_result()
+    db_session.add(calc)
+    db_session.commit()
+
+    app.dependency_overrides[get_current_active_user] = lambda: test_user
+    try:
+        client = TestClient(app)
+        r = client.get("/calculations/export", params={"format": "csv", "type": "multiplication"})
+        assert r.status_code == 200
+        assert r.headers["content-type"].startswith("text/csv")
+        assert "calculations.csv" in r.headers["content-disposition"]
+        rows = list(csv.DictReader(io.StringIO(r.text)))
+        assert len(rows) == 1
+        assert rows[0]["id"] == str(calc.id)
+        assert json.loads(rows[0]["inputs"]) == [3, 4]
+        assert float(rows[0]["result"]) == 12
+    finally:
+        app.dependency_overrides.pop(get_current_active_user, None)
@@ -0,0 +1,112 @@
+# Author: Roopesh Kumar Reddy Kaipa
+# Date: 18/10/2026
+from datetime import datetime, timedelta
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.models.calculation import Calculation
+from app.auth.dependencies import get_current_active_user
+
+
+def _seed_history(db_session, user, count=5):
+    base = datetime(2025, 1, 1, 12, 0, 0)
+    calcs = []
+    for i in range(count):
+        calc_type = "addition" if i % 2 == 0 else "multiplication"
+        calc = Calculation.create(calculation_type=calc_type, user_id=user.id, inputs=[i, 2])
+        calc.result = calc.get_result()
+        calc.created_at = base + timedelta(minutes=i)
+        calcs.append(calc)
+    db_session.add_all(calcs)
+    db_session.commit()
+    return calcs
+
+
+def test_list_calculations_keyset_pages(db_session, test_user):
+    calcs = _seed_history(db_session, test_user)
+    expected = [str(c.id) for c in sorted(calcs, key=lambda c: c.created_at, reverse=True)]
+
+    app.dependency_overrides[get_current_active_user] = lambda: test_user
+    try:
+        client = TestClient(app)
+        seen = []
+        cursor = None
+        while True:
+            params = {"limit": 2}
+            if cursor:
+                params["cursor"] = cursor
+            r = client.get("/calculations", params=params)
+            assert r.status_code == 200
+            page = r.json()
+            assert len(page) <= 2
+            seen.extend(c["id"] for c in page)
+            cursor = r.headers.get("X-Next-Cursor")
+            if cursor is None:
+                break
+        assert seen == expected
+    finally:
+        app.dependency_overrides.pop(get_current_active_user, None)
+
+
+def test_list_calculations_keyset_pages_through_equal_timestamps(db_session, test_user):
+    calcs = _seed_history(db_session, test_user)
+    for calc in calcs:
+        calc.created_at = datetime(2025, 1, 1, 12, 0, 0)
+    db_session.commit()
+
+    app.dependency_overrides[get_current_active_user] = lambda: test_user
+    try:
+        client = TestClient(app)
+        seen = []
+        params = {"limit": 2}
+        while True:
+            r = client.get("/calculations", params=params)
+            assert r.status_code == 200
+            seen.extend(c["id"] for c in r.json())
+            if "X-Next-Cursor" not in r.headers:
+                break
+            params["cursor"] = r.headers["X-Next-Cursor"]
+        # ties on created_at are broken by id, so no row is skipped or repeated
+        assert sorted(seen) == sorted(str(c.id) for c in calcs)
+    finally:
+        app.dependency_overrides.pop(get_current_active_user, None)
+
+
+def test_list_calculations_filters(db_session, test_user):
+    _seed_history(db_session, test_user)
+
+    app.dependency_overrides[get_current_active_user] = lambda: test_user
+    try:
+        client = TestClient(app)
+        r = client.get("/calculations", params={"type": "multiplication"})
+        assert r.status_code == 200
+        assert len(r.json()) == 2
+        assert all(c["type"] == "multiplication" for c in r.json())
+
+        r = client.get("/calculations", params={
+            "created_after": "2025-01-01T12:01:00",
+            "created_before": "2025-01-01T12:03:00",
+        })
+        assert r.status_code == 200
+        assert [c["inputs"][0] for c in r.json()] == [2, 1]
+
+        # Timezone-aware bounds are normalized to the naive UTC column
+        r = client.get("/calculations", params={"created_after": "2025-01-01T13:03:00+01:00"})
+        assert [c["inputs"][0] for c in r.json()] == [4, 3]
+    finally:
+        app.dependency_overrides.pop(get_current_active_user, None)
+
+
+def test_list_calculations_bad_cursor_and_limit(test_user):
+    app.dependency_overrides[get_current_active_user] = lambda: test_user
+    try:
+        client = TestClient(app)
+        r = client.get("/calculations", params={"cursor": "not-a-cursor"})
+        assert r.status_code == 400
+        r = client.get("/calculations", params={"limit": 0})
+        assert r.status_code == 422
+        r = client.get("/calculations", params={"type": "modulo"})
+        assert r.status_code == 422
+    finally:
+        app.dependency_overrides.pop(get_current_active_user, None)
@@ -0,0 +1,77 @@
+# Author: Roopesh Kumar Reddy Kaipa
+# Date: 18/10/2026
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from app.core.config import settings
+from app.database import (
+    InstrumentedAsyncQueuePool,
+    InstrumentedQueuePool,
+    get_engine,
+    get_pool_options,
+    get_pool_status,
+)
+from app.main import app
+
+
+def test_pool_options_come_from_settings(monkeypatch):
+    monkeypatch.setattr(settings, "DB_POOL_SIZE", 7)
+    monkeypatch.setattr(settings, "DB_MAX_OVERFLOW", 3)
+    monkeypatch.setattr(settings, "DB_POOL_RECYCLE", 600)
+    options = get_pool_options("postgresql://u:p@localhost/db")
+    assert options["poolclass"] is InstrumentedQueuePool
+    assert options["pool_size"] == 7
+    assert options["max_overflow"] == 3
+    assert options["pool_recycle"] == 600
+    assert options["pool_pre_ping"] is True
+    assert get_pool_options("postgresql://u:p@localhost/db", asynchronous=True)["poolclass"] is InstrumentedAsyncQueuePool
+    # In-memory SQLite keeps the default single-connection pool
+    assert get_pool_options("sqlite://") == {}
+    assert get_pool_options("sqlite:///:memory:") == {}
+
+
+def test_pool_status_tracks_checkouts_and_timeouts(monkeypatch, tmp_path):
+    monkeypatch.setattr(settings, "DB_POOL_SIZE", 1)
+    monkeypatch.setattr(settings, "DB_MAX_OVERFLOW", 0)
+    monkeypatch.setattr(settings, "DB_POOL_TIMEOUT", 0.05)
+    engine = get_engine(f"sqlite:///{tmp_path / 'pool.sqlite'}")
+    try:
+        with engine.connect() as conn:
+            conn.execute(text("select 1"))
+            status = get_pool_status(engine)
+            assert status["pool"] == "InstrumentedQueuePool"
+            assert status["size"] == 1
+            assert status["checked_out"] == 1
+            assert status["overflow"] == 0
+
+            with pytest.raises(PoolTimeoutError):
+                engine.connect()
+
+        status = get_pool_status(engine)
+        assert status["checked_out"] == 0
+        assert status["timeouts"] == 1
+        assert status["waits"] == 2
+        assert status["wait_seconds_max"] >= 0.05
+    finally:
+        engine.dispose()
+
+
+def test_db_health_endpoint():
+    client = TestClient(app)
+    r = client.get("/health/db")
+    assert r.status_code == 200
+    body = r.json()
+    assert set(body) == {"sync", "async"}
+    assert "pool" in body["sync"]
+
+
+def test_default_pools_fit_postgres_max_connections():
+    from app.core.config import Settings
+
+    defaults = Settings.model_fields
+    per_engine = defaults["DB_POOL_SIZE"].default + defaults["DB_MAX_OVERFLOW"].default
+    # Dockerfile runs 4 workers, each with a sync and an async engine;
+    # Postgres allows 100 connections by default.
+    assert 4 * 2 * per_engine < 100
@@ -1,5 +1,6 @@
 # Author: Roopesh Kumar Reddy Kaipa
 # Date: 24/11/2025
+import asyncio
 import pytest
 from unittest.mock import patch
 from fastapi import HTTPException, status
@@ -44,7 +45,7 @@ def mock_verify_token():
 def test_get_current_user_valid_token_existing_user(mock_verify_token):
     mock_verify_token.return_value = sample_user_data
 
-    user_response = get_current_user(token="validtoken")
+    user_response = asyncio.run(get_current_user(token="validtoken"))
 
     assert isinstance(user_response, UserResponse)
     assert user_response.id == sample_user_data["id"]
@@ -64,7 +65,7 @@ def test_get_current_user_invalid_token(mock_verify_token):
     mock_verify_token.return_value = None
 
     with pytest.raises(HTTPException) as exc_info:
-        get_current_user(token="invalidtoken")
+        asyncio.run(get_current_user(token="invalidtoken"))
 
     assert exc_info.value.status_code == status.HTTP_401_UNAUTHORIZED
     assert exc_info.value.detail == "Could not validate credentials"
@@ -77,7 +78,7 @@ def test_get_current_user_valid_token_incomplete_payload(mock_verify_token):
     mock_verify_token.return_value = {}
 
     with pytest.raises(HTTPException) as exc_info:
-        get_current_user(token="validtoken")
+        asyncio.run(get_current_user(token="validtoken"))
 
     assert exc_info.value.status_code == status.HTTP_401_UNAUTHORIZED
     assert exc_info.value.detail == "Could not validate credentials"
@@ -88,7 +89,7 @@ def test_get_current_user_valid_token_incomplete_payload(mock_verify_token):
 def test_get_current_active_user_active(mock_verify_token):
     mock_verify_token.return_value = sample_user_data
 
-    current_user = get_current_user(token="validtoken")
+    current_user = asyncio.run(get_current_user(token="validtoken"))
     active_user = get_current_active_user(current_user=current_user)
 
     assert isinstance(active_user, UserResponse)
@@ -98,7 +99,7 @@ def test_get_current_active_user_active(mock_verify_token):
 def test_get_current_active_user_inactive(mock_verify_token):
     mock_verify_token.return_value = inactive_user_data
 
-    current_user = get_current_user(token="validtoken")
+    current_user = asyncio.run(get_current_user(token="validtoken"))
 
     with pytest.raises(HTTPException) as exc_info:
         get_current_active_user(current_user=current_user)
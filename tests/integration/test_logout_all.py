@@ -0,0 +1,110 @@
+# Author: Roopesh Kumar Reddy Kaipa
+# Date: 18/10/2026
+import asyncio
+import time
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+from jose import jwt
+
+from app.auth import redis as auth_redis
+from app.auth.jwt import create_token, decode_token, settings
+from app.main import app
+from app.schemas.token import TokenType
+
+
+def _register_and_login(client):
+    name = f"everywhere_{uuid4().hex[:8]}"
+    password = "StrongPass1!"
+    r = client.post("/auth/register", json={
+        "first_name": "Every",
+        "last_name": "Where",
+        "email": f"{name}@example.com",
+        "username": name,
+        "password": password,
+        "confirm_password": password,
+    })
+    assert r.status_code == 201
+    r = client.post("/auth/login", json={"username": name, "password": password})
+    assert r.status_code == 200
+    return r.json()
+
+
+def test_logout_all_revokes_every_session_with_one_key():
+    client = TestClient(app)
+    first = _register_and_login(client)
+    other = client.post(
+        "/auth/login",
+        json={"username": first["username"], "password": "StrongPass1!"},
+    ).json()
+
+    redis = asyncio.run(auth_redis.get_redis())
+    keys_before = len(redis._store)
+
+    headers = {"Authorization": f"Bearer {first['access_token']}"}
+    r = client.post("/auth/logout-all", headers=headers)
+    assert r.status_code == 204
+    assert len(redis._store) == keys_before + 1
+
+    for token, token_type in [
+        (first["access_token"], TokenType.ACCESS),
+        (first["refresh_token"], TokenType.REFRESH),
+        (other["access_token"], TokenType.ACCESS),
+        (other["refresh_token"], TokenType.REFRESH),
+    ]:
+        with pytest.raises(HTTPException) as excinfo:
+            asyncio.run(decode_token(token, token_type))
+        assert excinfo.value.detail == "Token has been revoked"
+
+    time.sleep(0.002)
+    fresh = client.post(
+        "/auth/login",
+        json={"username": first["username"], "password": "StrongPass1!"},
+    ).json()
+    payload = asyncio.run(decode_token(fresh["access_token"], TokenType.ACCESS))
+    assert payload["sub"] == first["user_id"]
+
+
+def test_tokens_without_iat_ms_fall_back_to_iat():
+    user_id = str(uuid4())
+    legacy = jwt.encode(
+        {"sub": user_id, "type": "access", "exp": int(time.time()) + 60,
+         "iat": int(time.time()) - 5, "jti": uuid4().hex},
+        settings.JWT_SECRET_KEY,
+        algorithm=settings.ALGORITHM,
+    )
+    asyncio.run(auth_redis.revoke_all_for_user(user_id))
+    with pytest.raises(HTTPException):
+        asyncio.run(decode_token(legacy, TokenType.ACCESS))
+
+    time.sleep(0.002)
+    current = create_token(user_id, TokenType.ACCESS)
+    assert asyncio.run(decode_token(current, TokenType.ACCESS))["sub"] == user_id
+
+
+def test_revoke_all_mark_is_read_from_redis_once_per_cache_ttl(monkeypatch):
+    user_id = str(uuid4())
+    redis = asyncio.run(auth_redis.get_redis())
+    asyncio.run(redis.set(f"revoked_before:{user_id}", "1234", ex=60))
+    assert asyncio.run(auth_redis.get_revoked_before(user_id)) == 1234
+
+    async def no_round_trip(key):
+        raise AssertionError("the mark should be cached")
+
+    monkeypatch.setattr(redis, "get", no_round_trip)
+    assert asyncio.run(auth_redis.get_revoked_before(user_id)) == 1234
+
+
+def test_logout_all_locks_out_calculation_endpoints():
+    client = TestClient(app)
+    tokens = _register_and_login(client)
+    headers = {"Authorization": f"Bearer {tokens['access_token']}"}
+    assert client.get("/calculations", headers=headers).status_code == 200
+
+    assert client.post("/auth/logout-all", headers=headers).status_code == 204
+
+    assert client.get("/calculations", headers=headers).status_code == 401
+    r = client.post("/calculations", json={"type": "addition", "inputs": [1, 2]}, headers=headers)
+    assert r.status_code == 401
@@ -28,7 +28,10 @@ def test_login_timezone_branch(monkeypatch, db_session):
             "expires_at": datetime.utcnow(),  # naive
         }
 
-    monkeypatch.setattr(User, "authenticate", classmethod(lambda cls, db, u, p: fake_auth(db, u, p)))
+    async def fake_auth_async(cls, db, u, p):
+        return fake_auth(db, u, p)
+
+    monkeypatch.setattr(User, "authenticate_async", classmethod(fake_auth_async))
 
     client = TestClient(app)
     payload = {"username": "u123", "password": "ValidPass1!"}
@@ -0,0 +1,86 @@
+# Author: Roopesh Kumar Reddy Kaipa
+# Date: 18/10/2026
+import asyncio
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+
+from app.auth import jwt as auth_jwt
+from app.auth.jwt import decode_token
+from app.main import app
+from app.schemas.token import TokenType
+
+
+def _login(client):
+    name = f"rotate_{uuid4().hex[:8]}"
+    password = "StrongPass1!"
+    r = client.post("/auth/register", json={
+        "first_name": "Ro",
+        "last_name": "Tate",
+        "email": f"{name}@example.com",
+        "username": name,
+        "password": password,
+        "confirm_password": password,
+    })
+    assert r.status_code == 201
+    r = client.post("/auth/login", json={"username": name, "password": password})
+    assert r.status_code == 200
+    return r.json()
+
+
+def test_refresh_rotates_without_hashing(monkeypatch):
+    client = TestClient(app)
+    tokens = _login(client)
+
+    async def no_bcrypt(*args, **kwargs):
+        raise AssertionError("refresh must not verify a password")
+
+    monkeypatch.setattr(auth_jwt.password_pool, "verify", no_bcrypt)
+    r = client.post("/auth/refresh", json={"refresh_token": tokens["refresh_token"]})
+    assert r.status_code == 200
+    body = r.json()
+    assert body["token_type"] == "bearer"
+    assert body["refresh_token"] != tokens["refresh_token"]
+
+    payload = asyncio.run(decode_token(body["access_token"], TokenType.ACCESS))
+    assert payload["sub"] == tokens["user_id"]
+    # the exchanged refresh token is now revoked
+    with pytest.raises(HTTPException):
+        asyncio.run(decode_token(tokens["refresh_token"], TokenType.REFRESH))
+
+
+def test_refresh_token_reuse_revokes_all_sessions():
+    client = TestClient(app)
+    tokens = _login(client)
+    first = client.post("/auth/refresh", json={"refresh_token": tokens["refresh_token"]}).json()
+
+    r = client.post("/auth/refresh", json={"refresh_token": tokens["refresh_token"]})
+    assert r.status_code == 401
+    assert r.json()["detail"] == "Refresh token reuse detected"
+
+    # the pair minted by the first exchange is gone too
+    r = client.post("/auth/refresh", json={"refresh_token": first["refresh_token"]})
+    assert r.status_code == 401
+    with pytest.raises(HTTPException):
+        asyncio.run(decode_token(first["access_token"], TokenType.ACCESS))
+
+
+def test_logged_out_refresh_token_is_rejected_without_revoking_all():
+    client = TestClient(app)
+    tokens = _login(client)
+    r = client.post("/auth/logout", headers={"Authorization": f"Bearer {tokens['refresh_token']}"})
+    assert r.status_code == 204
+
+    r = client.post("/auth/refresh", json={"refresh_token": tokens["refresh_token"]})
+    assert r.status_code == 401
+    assert r.json()["detail"] == "Token has been revoked"
+    assert asyncio.run(decode_token(tokens["access_token"], TokenType.ACCESS))
+
+
+def test_refresh_rejects_access_tokens():
+    client = TestClient(app)
+    tokens = _login(client)
+    r = client.post("/auth/refresh", json={"refresh_token": tokens["access_token"]})
+    assert r.status_code == 401
@@ -0,0 +1,130 @@
+# Author: Roopesh Kumar Reddy Kaipa
+# Date: 18/10/2026
+from contextlib import contextmanager
+from uuid import uuid4
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.auth.identity import encode_identity
+from app.auth.jwt import create_token
+from app.main import app
+from app.schemas.token import TokenType
+
+
+@contextmanager
+def _statements():
+    """Verbs of the SQL statements run while the block executes, on any engine."""
+    verbs = []
+
+    def _record(conn, cursor, statement, *args):
+        verbs.append(statement.split()[0].upper())
+
+    event.listen(Engine, "before_cursor_execute", _record)
+    try:
+        yield verbs
+    finally:
+        event.remove(Engine, "before_cursor_execute", _record)
+
+
+def _headers(user):
+    token = create_token(user.id, TokenType.ACCESS, identity=encode_identity(user))
+    return {"Authorization": f"Bearer {token}"}
+
+
+def test_create_calculation_is_one_insert(test_user):
+    client = TestClient(app)
+    with _statements() as verbs:
+        r = client.post("/calculations", json={"type": "addition", "inputs": [1, 2]}, headers=_headers(test_user))
+    assert r.status_code == 201
+    assert r.json()["created_at"] is not None
+    assert verbs == ["INSERT"]
+
+
+def test_update_calculation_inputs_is_one_update(test_user):
+    client = TestClient(app)
+    headers = _headers(test_user)
+    cid = client.post("/calculations", json={"type": "addition", "inputs": [1, 2]}, headers=headers).json()["id"]
+    with _statements() as verbs:
+        r = client.put(f"/calculations/{cid}", json={"inputs": [2, 3]}, headers=headers)
+    assert r.status_code == 200
+    assert r.json()["result"] == 5
+    assert verbs == ["UPDATE"]
+
+
+def test_register_does_not_read_back():
+    client = TestClient(app)
+    payload = {
+        "first_name": "Round",
+        "last_name": "Trip",
+        "email": f"{uuid4()}@ex.com",
+        "username": f"user{uuid4().hex[:6]}",
+        "password": "ValidPass1!",
+        "confirm_password": "ValidPass1!",
+    }
+    with _statements() as verbs:
+        r = client.post("/auth/register", json=payload)
+    assert r.status_code == 201
+    assert r.json()["username"] == payload["username"]
+    assert r.json()["id"]
+    assert verbs[-1] == "INSERT"
+
+
+def test_delete_calculation_is_one_delete(test_user):
+    client = TestClient(app)
+    headers = _headers(test_user)
+    cid = client.post("/calculations", json={"type": "addition", "inputs": [1, 2]}, headers=headers).json()["id"]
+    with _statements() as verbs:
+        r = client.delete(f"/calculations/{cid}", headers=headers)
+    assert r.status_code == 204
+    assert verbs == ["DELETE"]
+    assert client.delete(f"/calculations/{cid}", headers=headers).status_code == 404
+
+
+def test_writes_are_scoped_to_the_owner(db_session, test_user, seed_users):
+    client = TestClient(app)
+    cid = client.post(
+        "/calculations", json={"type": "addition", "inputs": [1, 2]}, headers=_headers(test_user)
+    ).json()["id"]
+    other = _headers(seed_users[0])
+
+    assert client.put(f"/calculations/{cid}", json={"inputs": [5, 5]}, headers=other).status_code == 404
+    assert client.put(f"/calculations/{cid}", json={}, headers=other).status_code == 404
+    assert client.delete(f"/calculations/{cid}", headers=other).status_code == 404
+
+    r = client.get(f"/calculations/{cid}", headers=_headers(test_user))
+    assert r.status_code == 200
+    assert r.json()["result"] == 3
+
+
+def test_update_inputs_rejected_by_type_is_400(test_user):
+    client = TestClient(app)
+    headers = _headers(test_user)
+    cid = client.post("/calculations", json={"type": "division", "inputs": [8, 2]}, headers=headers).json()["id"]
+
+    r = client.put(f"/calculations/{cid}", json={"inputs": [8, 0]}, headers=headers)
+    assert r.status_code == 400
+    assert "divide by zero" in r.json()["detail"]
+    assert client.get(f"/calculations/{cid}", headers=headers).json()["inputs"] == [8, 2]
+
+
+def test_update_inputs_with_complex_power_result_keeps_other_types(test_user):
+    client = TestClient(app)
+    headers = _headers(test_user)
+    cid = client.post("/calculations", json={"type": "addition", "inputs": [1, 2]}, headers=headers).json()["id"]
+
+    # (-8) ** 0.5 is complex, which must not stop an addition from being edited
+    r = client.put(f"/calculations/{cid}", json={"inputs": [-8, 0.5]}, headers=headers)
+    assert r.status_code == 200
+    assert r.json()["result"] == -7.5
+
+
+def test_update_power_inputs_with_complex_result_is_400(test_user):
+    client = TestClient(app)
+    headers = _headers(test_user)
+    cid = client.post("/calculations", json={"type": "power", "inputs": [2, 3]}, headers=headers).json()["id"]
+
+    r = client.put(f"/calculations/{cid}", json={"inputs": [-8, 0.5]}, headers=headers)
+    assert r.status_code == 400
+    assert client.get(f"/calculations/{cid}", headers=headers).json()["result"] == 8
@@ -0,0 +1,80 @@
+# Author: Roopesh Kumar Reddy Kaipa
+# Date: 18/10/2026
+import asyncio
+
+import pytest
+
+from app.auth import calibrate, hashing
+from app.auth import jwt as auth_jwt
+from app.models.user import User
+
+PASSWORD = "RehashPass1!"
+
+
+def _cost(hashed: str) -> int:
+    return int(hashed.split("$")[2])
+
+
+@pytest.fixture
+def configured_rounds(monkeypatch):
+    monkeypatch.setattr(hashing.settings, "BCRYPT_ROUNDS", 5)
+    monkeypatch.setattr(auth_jwt, "pwd_context", hashing.build_context(5))
+
+
+@pytest.fixture
+def old_cost_user(db_session, test_user):
+    test_user.password = hashing.build_context(4).hash(PASSWORD)
+    db_session.commit()
+    return test_user
+
+
+def test_context_flags_other_costs_for_update():
+    context = hashing.build_context(5)
+    assert context.needs_update(hashing.build_context(4).hash(PASSWORD))
+    assert context.needs_update(hashing.build_context(6).hash(PASSWORD))
+    assert not context.needs_update(context.hash(PASSWORD))
+
+
+def test_login_rehashes_outdated_cost(configured_rounds, db_session, old_cost_user):
+    assert User.authenticate(db_session, old_cost_user.username, PASSWORD) is not None
+    db_session.commit()
+    db_session.refresh(old_cost_user)
+    upgraded = old_cost_user.password
+    assert _cost(upgraded) == 5
+    assert auth_jwt.verify_password(PASSWORD, upgraded)
+
+    # a hash at the configured cost is left alone
+    User.authenticate(db_session, old_cost_user.username, PASSWORD)
+    db_session.commit()
+    assert old_cost_user.password == upgraded
+
+
+def test_failed_login_keeps_old_hash(configured_rounds, db_session, old_cost_user):
+    before = old_cost_user.password
+    assert User.authenticate(db_session, old_cost_user.username, "wrong-password") is None
+    assert old_cost_user.password == before
+
+
+def test_async_login_rehashes_on_the_pool(configured_rounds, db_session, old_cost_user):
+    result = asyncio.run(User.authenticate_async(db_session, old_cost_user.username, PASSWORD))
+    assert result is not None
+    db_session.commit()
+    db_session.refresh(old_cost_user)
+    assert _cost(old_cost_user.password) == 5
+
+
+def test_recommend_rounds_extrapolates_and_confirms():
+    # simulated hardware: 1 ms at 4 rounds, doubling per round
+    fake = lambda rounds: 0.001 * 2 ** (rounds - 4)
+    timings = calibrate.recommend_rounds(0.25, base_rounds=8, measure=fake)
+    assert calibrate.best_rounds(timings, 0.25) == 11
+    assert set(timings) == {8, 11, 12}
+
+    assert calibrate.best_rounds(calibrate.recommend_rounds(1e-6, measure=fake), 1e-6) == calibrate.MIN_ROUNDS
+    with pytest.raises(ValueError):
+        calibrate.recommend_rounds(0)
+
+
+def test_calibrate_cli_prints_recommendation(capsys):
+    assert calibrate.main(["--target-ms", "5", "--base-rounds", "4", "--samples", "1"]) == 0
+    assert "BCRYPT_ROUNDS=" in capsys.readouterr().out
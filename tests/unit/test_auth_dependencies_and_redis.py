@@ -1,5 +1,6 @@
 # Author: Roopesh Kumar Reddy Kaipa
 # Date: 24/11/2025
+import asyncio
 import pytest
 from uuid import uuid4
 from datetime import datetime
@@ -25,7 +26,7 @@ def test_get_current_user_full_payload(monkeypatch):
     }
 
     monkeypatch.setattr(User, "verify_token", staticmethod(lambda t: payload))
-    user_resp = dependencies.get_current_user("token")
+    user_resp = asyncio.run(dependencies.get_current_user("token"))
     assert isinstance(user_resp, UserResponse)
     assert user_resp.username == "alice"
 
@@ -33,21 +34,21 @@ def test_get_current_user_full_payload(monkeypatch):
 def test_get_current_user_minimal_sub(monkeypatch):
     sub = str(uuid4())
     monkeypatch.setattr(User, "verify_token", staticmethod(lambda t: {"sub": sub}))
-    user_resp = dependencies.get_current_user("token")
+    user_resp = asyncio.run(dependencies.get_current_user("token"))
     assert user_resp.id is not None
 
 
 def test_get_current_user_uuid(monkeypatch):
     uid = uuid4()
     monkeypatch.setattr(User, "verify_token", staticmethod(lambda t: uid))
-    user_resp = dependencies.get_current_user("token")
+    user_resp = asyncio.run(dependencies.get_current_user("token"))
     assert user_resp.id == uid
 
 
 def test_get_current_user_invalid(monkeypatch):
     monkeypatch.setattr(User, "verify_token", staticmethod(lambda t: None))
     with pytest.raises(Exception):
-        dependencies.get_current_user("token")
+        asyncio.run(dependencies.get_current_user("token"))
 
 
 def test_redis_blacklist_behavior():
@@ -1,5 +1,6 @@
 # Author: Roopesh Kumar Reddy Kaipa
 # Date: 24/11/2025
+import asyncio
 import pytest
 from fastapi import HTTPException
 
@@ -13,7 +14,7 @@ def test_get_current_user_unsupported_type(monkeypatch):
     """
     monkeypatch.setattr(user_module.User, "verify_token", staticmethod(lambda token: 123))
     with pytest.raises(HTTPException) as excinfo:
-        dependencies.get_current_user(token="dummy")
+        asyncio.run(dependencies.get_current_user(token="dummy"))
 
     assert excinfo.value.status_code == 401
     assert excinfo.value.detail == "Could not validate credentials"
@@ -0,0 +1,143 @@
+# Author: Roopesh Kumar Reddy Kaipa
+# Date: 18/10/2026
+import asyncio
+import time
+from uuid import uuid4
+
+import aioredis
+import pytest
+from fastapi.testclient import TestClient
+
+from app.auth import redis as auth_redis
+from app.auth.bloom import BlacklistFilter, BloomFilter
+from app.main import app
+
+
+def test_bloom_filter_has_no_false_negatives_and_bounded_false_positives():
+    bloom = BloomFilter(capacity=2000, error_rate=0.01)
+    members = [str(uuid4()) for _ in range(2000)]
+    for item in members:
+        bloom.add(item)
+    assert all(item in bloom for item in members)
+    false_positives = sum(str(uuid4()) in bloom for _ in range(20000))
+    assert false_positives < 20000 * 0.01 * 3
+
+
+@pytest.mark.parametrize("capacity, error_rate", [(0, 0.01), (10, 0), (10, 1.5)])
+def test_bloom_filter_rejects_bad_sizing(capacity, error_rate):
+    with pytest.raises(ValueError):
+        BloomFilter(capacity, error_rate)
+
+
+@pytest.fixture
+def bloom_front(monkeypatch, fake_clock):
+    clock = fake_clock
+    front = BlacklistFilter(enabled=True, capacity=1000, error_rate=0.001, rebuild_seconds=30, clock=clock)
+    monkeypatch.setattr(auth_redis, "blacklist_filter", front)
+    return front, clock
+
+
+def test_unrevoked_tokens_skip_redis(monkeypatch, bloom_front):
+    front, _ = bloom_front
+    revoked = str(uuid4())
+    asyncio.run(auth_redis.add_to_blacklist(revoked, 60))
+    asyncio.run(auth_redis.refresh_blacklist_filter())
+    assert asyncio.run(auth_redis.is_blacklisted(revoked))
+    assert front.rebuilds == 1 and front.positives == 1
+
+    redis = asyncio.run(auth_redis.get_redis())
+
+    async def no_round_trip(*keys):
+        raise AssertionError("negative answers must not reach Redis")
+
+    monkeypatch.setattr(redis, "exists", no_round_trip)
+    assert asyncio.run(auth_redis.is_blacklisted(str(uuid4()))) is False
+    assert asyncio.run(auth_redis.are_blacklisted([str(uuid4()), str(uuid4())])) == [False, False]
+    assert front.negatives == 3
+
+
+def test_lookups_never_rebuild(monkeypatch, bloom_front):
+    front, _ = bloom_front
+    redis = asyncio.run(auth_redis.get_redis())
+
+    def no_scan(*args, **kwargs):
+        raise AssertionError("lookups must not scan the blacklist")
+
+    monkeypatch.setattr(redis, "scan_iter", no_scan)
+    # Not built yet: answered by Redis, without building the filter.
+    assert not asyncio.run(auth_redis.is_blacklisted(str(uuid4())))
+    assert front.rebuilds == 0 and front.negatives == 0
+
+
+def test_local_revocations_are_visible_immediately(bloom_front):
+    front, _ = bloom_front
+    asyncio.run(auth_redis.refresh_blacklist_filter())
+    jtis = [str(uuid4()) for _ in range(3)]
+    asyncio.run(auth_redis.add_many_to_blacklist({jti: 60 for jti in jtis}))
+    assert asyncio.run(auth_redis.are_blacklisted(jtis + ["unknown"])) == [True, True, True, False]
+    assert front.rebuilds == 1
+
+
+def test_remote_revocations_are_picked_up_on_rebuild(bloom_front):
+    front, clock = bloom_front
+    asyncio.run(auth_redis.refresh_blacklist_filter())
+
+    # Another worker revokes a token: only Redis knows about it.
+    remote = str(uuid4())
+    redis = asyncio.run(auth_redis.get_redis())
+    asyncio.run(redis.set(f"blacklist:{remote}", "1", ex=60))
+    assert asyncio.run(auth_redis.is_blacklisted(remote)) is False
+
+    clock.now = 30
+    asyncio.run(auth_redis.refresh_blacklist_filter())
+    assert asyncio.run(auth_redis.is_blacklisted(remote))
+    assert front.rebuilds == 2
+    assert front.stats()["items"] >= 1
+
+
+def test_stalled_filter_falls_back_to_redis(bloom_front):
+    front, clock = bloom_front
+    asyncio.run(auth_redis.refresh_blacklist_filter())
+    remote = str(uuid4())
+    redis = asyncio.run(auth_redis.get_redis())
+    asyncio.run(redis.set(f"blacklist:{remote}", "1", ex=60))
+
+    clock.now = 60
+    assert asyncio.run(auth_redis.is_blacklisted(remote))
+    assert front.positives == 0 and front.negatives == 0
+
+
+def test_background_rebuilds_survive_redis_errors(monkeypatch, bloom_front):
+    front, _ = bloom_front
+    front.rebuild_seconds = 0
+    calls = []
+
+    async def flaky():
+        calls.append(1)
+        if len(calls) == 1:
+            raise aioredis.RedisError("down")
+        await front.rebuild(_empty())
+
+    async def _empty():
+        return
+        yield
+
+    monkeypatch.setattr(auth_redis, "refresh_blacklist_filter", flaky)
+
+    async def scenario():
+        task = asyncio.create_task(auth_redis.keep_blacklist_filter_fresh())
+        while front.rebuilds < 2:
+            await asyncio.sleep(0)
+        task.cancel()
+
+    asyncio.run(asyncio.wait_for(scenario(), 5))
+    assert len(calls) >= 3 and front.ready
+
+
+def test_lifespan_runs_the_rebuild_task(bloom_front):
+    front, _ = bloom_front
+    with TestClient(app):
+        deadline = time.monotonic() + 5
+        while not front.ready and time.monotonic() < deadline:
+            time.sleep(0.01)
+    assert front.rebuilds >= 1
@@ -1,5 +1,6 @@
 # Author: Roopesh Kumar Reddy Kaipa
 # Date: 24/11/2025
+import asyncio
 import importlib
 import uuid
 from datetime import timedelta, datetime, timezone
@@ -23,7 +24,7 @@ def test_get_current_user_token_none_raises():
     orig = User.verify_token
     User.verify_token = classmethod(lambda cls, t: None)
     with pytest.raises(Exception) as excinfo:
-        auth_deps.get_current_user(token="invalid")
+        asyncio.run(auth_deps.get_current_user(token="invalid"))
     assert "Could not validate credentials" in str(excinfo.value)
     User.verify_token = orig
 
@@ -33,12 +34,12 @@ def test_get_current_user_minimal_payload_and_uuid_payload():
     sub_id = uuid.uuid4()
     orig = User.verify_token
     User.verify_token = classmethod(lambda cls, t: {"sub": str(sub_id)})
-    resp = auth_deps.get_current_user(token="tok")
+    resp = asyncio.run(auth_deps.get_current_user(token="tok"))
     assert resp.id is not None
 
     # return a UUID directly
     User.verify_token = classmethod(lambda cls, t: sub_id)
-    resp2 = auth_deps.get_current_user(token="tok2")
+    resp2 = asyncio.run(auth_deps.get_current_user(token="tok2"))
     assert resp2.id == sub_id
     User.verify_token = orig
 
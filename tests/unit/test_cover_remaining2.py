@@ -30,7 +30,7 @@ def test_get_current_user_full_payload_branch():
     }
     orig = User.verify_token
     User.verify_token = classmethod(lambda cls, t: {**full, "username": full["username"]})
-    resp = auth_deps.get_current_user(token="tok")
+    resp = asyncio.run(auth_deps.get_current_user(token="tok"))
     assert resp.username == "fulluser"
     User.verify_token = orig
 
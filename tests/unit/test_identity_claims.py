@@ -0,0 +1,92 @@
+# Author: Roopesh Kumar Reddy Kaipa
+# Date: 18/10/2026
+import asyncio
+from datetime import datetime, timezone
+
+import pytest
+from fastapi import HTTPException
+
+from app.auth import jwt as auth_jwt
+from app.auth.dependencies import get_current_user
+from app.auth.identity import IDENTITY_CLAIMS_VERSION, decode_identity, encode_identity
+from app.models.user import User
+from app.schemas.token import TokenType
+
+
+def test_identity_round_trip(test_user):
+    claims = encode_identity(test_user)
+    assert claims["v"] == IDENTITY_CLAIMS_VERSION
+
+    fields = decode_identity({"sub": str(test_user.id), "idn": claims})
+    assert fields["username"] == test_user.username
+    assert fields["email"] == test_user.email
+    assert fields["is_active"] is test_user.is_active
+    assert fields["created_at"].tzinfo is timezone.utc
+
+
+@pytest.mark.parametrize("idn", [None, "x", {"v": 99, "u": "a"}, {"v": IDENTITY_CLAIMS_VERSION}])
+def test_unusable_identity_is_ignored(idn):
+    assert decode_identity({"sub": "user-1", "idn": idn}) is None
+
+
+def test_naive_timestamps_are_utc():
+    class Naive:
+        username, email, first_name, last_name = "n", "n@example.com", "N", "N"
+        is_active, is_verified = True, False
+        created_at = updated_at = datetime(2026, 1, 1)
+
+    claims = encode_identity(Naive)
+    assert claims["c"] == int(datetime(2026, 1, 1, tzinfo=timezone.utc).timestamp())
+
+
+def test_current_user_from_claims_skips_db(monkeypatch, test_user):
+    token = auth_jwt.create_token(test_user.id, TokenType.ACCESS, identity=encode_identity(test_user))
+
+    def _no_lookup(*args, **kwargs):
+        raise AssertionError("identity claims should have been used")
+
+    monkeypatch.setattr(User, "verify_token", _no_lookup)
+    user = asyncio.run(get_current_user(token))
+    assert user.id == test_user.id
+    assert user.username == test_user.username
+    assert user.is_verified is test_user.is_verified
+
+
+def test_identity_only_in_access_tokens(test_user):
+    identity = encode_identity(test_user)
+    refresh = auth_jwt.create_token(test_user.id, TokenType.REFRESH, identity=identity)
+    assert "idn" not in auth_jwt.jwt.get_unverified_claims(refresh)
+
+
+def test_identity_claims_can_be_disabled(monkeypatch, test_user):
+    monkeypatch.setattr(auth_jwt.settings, "TOKEN_IDENTITY_CLAIMS", False)
+    token = auth_jwt.create_token(test_user.id, TokenType.ACCESS, identity=encode_identity(test_user))
+    assert "idn" not in auth_jwt.jwt.get_unverified_claims(token)
+    # Falls back to the minimal, sub-only profile.
+    assert asyncio.run(get_current_user(token)).username == "unknown"
+
+
+def test_tampered_token_is_rejected(test_user):
+    token = auth_jwt.create_token(test_user.id, TokenType.ACCESS, identity=encode_identity(test_user))
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(get_current_user(token[:-2] + ("AA" if token[-2:] != "AA" else "BB")))
+    assert exc.value.status_code == 401
+
+
+def test_login_tokens_carry_identity(db_session, test_user):
+    test_user.password = auth_jwt.get_password_hash("Secret123!")
+    db_session.commit()
+    result = User.authenticate(db_session, test_user.username, "Secret123!")
+    claims = auth_jwt.jwt.get_unverified_claims(result["access_token"])
+    assert claims["idn"]["u"] == test_user.username
+
+
+def test_blacklisted_token_with_claims_is_rejected(test_user):
+    from app.auth.redis import add_to_blacklist
+
+    token = auth_jwt.create_token(test_user.id, TokenType.ACCESS, identity=encode_identity(test_user))
+    claims = auth_jwt.jwt.get_unverified_claims(token)
+    asyncio.run(add_to_blacklist(claims["jti"], 60))
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(get_current_user(token))
+    assert exc.value.status_code == 401
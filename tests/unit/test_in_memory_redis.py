@@ -0,0 +1,257 @@
+# Author: Roopesh Kumar Reddy Kaipa
+# Date: 18/10/2026
+import asyncio
+
+import pytest
+
+import aioredis
+from aioredis import _InMemoryRedis
+
+
+def test_keys_expire_lazily_on_read(fake_clock):
+    clock = fake_clock
+    red = _InMemoryRedis(clock=clock)
+
+    async def scenario():
+        await red.set("a", "1", ex=10)
+        await red.set("b", "2")
+        assert await red.exists("a") == 1
+        assert await red.ttl("a") == 10
+        assert await red.ttl("b") == -1
+        clock.now = 10
+        assert await red.exists("a") == 0
+        assert await red.get("a") is None
+        assert await red.get("b") == "2"
+        assert await red.ttl("a") == -2
+
+    asyncio.run(scenario())
+    assert "a" not in red._store
+
+
+def test_no_task_per_key_and_sweep_removes_unread_keys(fake_clock):
+    clock = fake_clock
+    red = _InMemoryRedis(clock=clock)
+
+    async def scenario():
+        before = len(asyncio.all_tasks())
+        for i in range(500):
+            await red.set(f"k{i}", "1", ex=5 + i % 3)
+        # only the single sweeper task exists, however many keys carry a TTL
+        assert len(asyncio.all_tasks()) == before + 1
+
+    asyncio.run(scenario())
+    clock.now = 6
+    removed = red.sweep()
+    assert removed == len([i for i in range(500) if 5 + i % 3 <= 6])
+    clock.now = 100
+    red.sweep()
+    assert red._store == {} and red._expires == {} and red._heap == []
+
+
+def test_overwriting_ttl_keeps_heap_bounded(fake_clock):
+    clock = fake_clock
+    red = _InMemoryRedis(clock=clock)
+
+    async def scenario():
+        for _ in range(1000):
+            await red.set("hot", "1", ex=60)
+        await red.set("hot", "1")  # persist: the key no longer expires
+
+    asyncio.run(scenario())
+    assert len(red._heap) <= 2 * len(red._expires) + 65
+    clock.now = 120
+    red.sweep()
+    assert "hot" in red._store
+
+
+def test_background_sweeper_runs_and_survives_new_loops():
+    red = _InMemoryRedis(sweep_interval=0.01)
+
+    async def scenario():
+        await red.set("short", "1", ex=0.01)
+        await asyncio.sleep(0.05)
+        assert "short" not in red._store
+
+    asyncio.run(scenario())
+    asyncio.run(scenario())
+
+
+def _fill(red, keys, **kwargs):
+    async def scenario():
+        for key in keys:
+            await red.set(key, "x" * 10, **kwargs)
+
+    asyncio.run(scenario())
+
+
+def _entry_size(red):
+    return red._sizeof("k00", "x" * 10)
+
+
+def test_noeviction_rejects_writes_over_maxmemory():
+    red = _InMemoryRedis()
+    red._set_config("maxmemory", _entry_size(red) * 3)
+    _fill(red, ["k00", "k01", "k02"])
+    with pytest.raises(aioredis.ResponseError):
+        _fill(red, ["k03"])
+    info = asyncio.run(red.info())
+    assert info["keys"] == 3 and info["rejected_writes"] == 1
+    assert info["used_memory"] <= info["maxmemory"]
+
+
+def test_allkeys_lru_evicts_least_recently_used(fake_clock):
+    clock = fake_clock
+    red = _InMemoryRedis(clock=clock, maxmemory_policy="allkeys-lru", maxmemory_samples=50)
+    red._set_config("maxmemory", _entry_size(red) * 3)
+    _fill(red, ["k00", "k01", "k02"])
+    clock.now = 1
+    asyncio.run(red.get("k00"))
+    asyncio.run(red.get("k02"))
+    clock.now = 2
+    _fill(red, ["k03"])
+    assert set(red._store) == {"k00", "k02", "k03"}
+    assert asyncio.run(red.info())["evicted_keys"] == 1
+
+
+def test_allkeys_lfu_evicts_least_frequently_used(monkeypatch, fake_clock):
+    monkeypatch.setattr(aioredis.random, "random", lambda: 0.0)  # always count an access
+    red = _InMemoryRedis(clock=fake_clock, maxmemory_policy="allkeys-lfu", maxmemory_samples=50)
+    red._set_config("maxmemory", _entry_size(red) * 3)
+    _fill(red, ["k00", "k01", "k02"])
+    for _ in range(3):
+        asyncio.run(red.exists("k01"))
+        asyncio.run(red.exists("k02"))
+    _fill(red, ["k03"])
+    assert set(red._store) == {"k01", "k02", "k03"}
+
+
+def test_volatile_ttl_evicts_soonest_expiring_key_only(fake_clock):
+    red = _InMemoryRedis(clock=fake_clock, maxmemory_policy="volatile-ttl", maxmemory_samples=50)
+    red._set_config("maxmemory", _entry_size(red) * 3)
+    _fill(red, ["k00"])
+    asyncio.run(red.set("k01", "x" * 10, ex=100))
+    asyncio.run(red.set("k02", "x" * 10, ex=10))
+    _fill(red, ["k03"])
+    assert set(red._store) == {"k00", "k01", "k03"}
+    # k01 is the last key with a TTL, so it goes next and then writes fail
+    _fill(red, ["k04"])
+    with pytest.raises(aioredis.ResponseError):
+        _fill(red, ["k05"])
+
+
+def test_blacklist_entries_are_never_evicted():
+    red = _InMemoryRedis(maxmemory_policy="allkeys-lru")
+    red._set_config("maxmemory", red._sizeof("blacklist:jti-00", "1") * 3)
+    keys = [f"blacklist:jti-{i:02d}" for i in range(3)]
+    for key in keys:
+        asyncio.run(red.set(key, "1", ex=60))
+    with pytest.raises(aioredis.ResponseError):
+        asyncio.run(red.set("blacklist:jti-99", "1", ex=60))
+    assert all(asyncio.run(red.exists(key)) for key in keys)
+
+
+def test_config_set_validates_policy():
+    red = _InMemoryRedis()
+    with pytest.raises(aioredis.ResponseError):
+        asyncio.run(red.config_set("maxmemory-policy", "random"))
+    asyncio.run(red.config_set("maxmemory-policy", "allkeys-lfu"))
+    assert asyncio.run(red.config_get("maxmemory-policy")) == {"maxmemory-policy": "allkeys-lfu"}
+
+
+def test_redis_health_endpoint():
+    from fastapi.testclient import TestClient
+    from app.main import app
+
+    r = TestClient(app).get("/health/redis")
+    assert r.status_code == 200
+    assert {"used_memory", "maxmemory", "evicted_keys"} <= set(r.json())
+
+
+def test_multi_key_exists_mget_and_mset(fake_clock):
+    clock = fake_clock
+    red = _InMemoryRedis(clock=clock)
+
+    async def scenario():
+        await red.mset({"a": "1", "b": "2"})
+        await red.set("c", "3", ex=5)
+        assert await red.exists("a", "b", "c", "missing", "a") == 4
+        clock.now = 5
+        assert await red.mget(["a", "c", "missing"]) == ["1", None, None]
+        assert await red.mget("b", "a") == ["2", "1"]
+
+    asyncio.run(scenario())
+
+
+def test_pipeline_runs_queued_commands_in_order():
+    red = _InMemoryRedis()
+
+    async def scenario():
+        async with red.pipeline(transaction=True) as pipe:
+            pipe.set("a", "1", ex=60).set("b", "2").exists("a", "b", "c")
+            assert len(pipe) == 3
+            assert await pipe.execute() == [True, True, 2]
+            assert len(pipe) == 0
+
+    asyncio.run(scenario())
+
+
+def test_pipeline_reports_errors_after_running_everything():
+    red = _InMemoryRedis()
+    red._set_config("maxmemory", red._sizeof("blacklist:a", "1"))
+
+    async def scenario():
+        pipe = red.pipeline()
+        pipe.set("blacklist:a", "1").set("blacklist:b", "1").set("x", "1")
+        results = await pipe.execute(raise_on_error=False)
+        assert results[0] is True
+        assert isinstance(results[1], aioredis.ResponseError)
+        pipe.set("blacklist:c", "1")
+        with pytest.raises(aioredis.ResponseError):
+            await pipe.execute()
+
+    asyncio.run(scenario())
+
+
+def test_set_nx_only_writes_missing_keys(fake_clock):
+    clock = fake_clock
+    red = _InMemoryRedis(clock=clock)
+
+    async def scenario():
+        assert await red.set("k", "first", ex=5, nx=True) is True
+        assert await red.set("k", "second", nx=True) is None
+        assert await red.get("k") == "first"
+        clock.now = 5
+        assert await red.set("k", "third", nx=True) is True
+
+    asyncio.run(scenario())
+
+
+def test_sorted_set_incr_and_expire_commands(fake_clock):
+    clock = fake_clock
+    red = _InMemoryRedis(clock=clock)
+
+    async def scenario():
+        assert await red.zadd("z", {"a": 3, "b": 1, "c": 2}) == 3
+        assert await red.zadd("z", {"a": 0}) == 0
+        assert await red.zrange("z", 0, -1) == ["a", "b", "c"]
+        assert await red.zrange("z", 0, 0, withscores=True) == [("a", 0.0)]
+        assert await red.zremrangebyscore("z", "-inf", 1) == 2
+        assert await red.zcard("z") == 1
+        assert await red.zrem("z", "c", "missing") == 1
+        assert await red.exists("z") == 0 and red.used_memory == 0
+
+        assert await red.incr("n") == 1
+        assert await red.expire("n", 10) == 1
+        assert await red.incr("n", 5) == 6
+        assert await red.ttl("n") == 10
+        assert await red.expire("missing", 10) == 0
+
+        await red.zadd("z", {"a": 1})
+        with pytest.raises(aioredis.ResponseError):
+            await red.get("z")
+        with pytest.raises(aioredis.ResponseError):
+            await red.zcard("n")
+        with pytest.raises(aioredis.ResponseError):
+            await red.incr("z")
+
+    asyncio.run(scenario())
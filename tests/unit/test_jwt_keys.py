@@ -0,0 +1,111 @@
+# Author: Roopesh Kumar Reddy Kaipa
+# Date: 18/10/2026
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+from jose import jwk, jwt
+
+from app.auth import keys
+from app.auth.jwt import create_token, decode_token
+from app.main import app
+from app.models.user import User
+from app.schemas.token import TokenType
+
+
+@pytest.fixture
+def asymmetric(monkeypatch):
+    def use(algorithm, key_set=None):
+        monkeypatch.setattr(keys.settings, "ALGORITHM", algorithm)
+        keys.set_key_set(key_set or keys.KeySet.generate(algorithm))
+        return keys.get_key_set()
+
+    yield use
+    keys.set_key_set(None)
+
+
+@pytest.mark.parametrize("algorithm", ["RS256", "ES256"])
+def test_access_tokens_verify_with_published_jwk(asymmetric, algorithm):
+    key_set = asymmetric(algorithm)
+    token = create_token("user-1", TokenType.ACCESS)
+
+    header = jwt.get_unverified_header(token)
+    assert header["alg"] == algorithm and header["kid"] == key_set.active_kid
+
+    # An edge service only needs the public JWK
+    public = next(k for k in key_set.jwks["keys"] if k["kid"] == header["kid"])
+    assert "d" not in public
+    claims = jwt.decode(token, jwk.construct(public), algorithms=[algorithm])
+    assert claims["sub"] == "user-1"
+    assert asyncio.run(decode_token(token, TokenType.ACCESS))["sub"] == "user-1"
+
+
+def test_refresh_tokens_stay_on_the_shared_secret(asymmetric):
+    asymmetric("RS256")
+    token = create_token("user-1", TokenType.REFRESH)
+    assert jwt.get_unverified_header(token)["alg"] == "HS256"
+    assert asyncio.run(decode_token(token, TokenType.REFRESH))["type"] == "refresh"
+
+
+def test_rotation_keeps_old_tokens_valid(asymmetric, tmp_path):
+    old_pem = keys.generate_private_key("RS256")
+    (tmp_path / "2026-01.pem").write_text(old_pem)
+    asymmetric("RS256", keys.KeySet.from_directory("RS256", str(tmp_path)))
+    old_token = create_token("00000000-0000-0000-0000-000000000001", TokenType.ACCESS)
+
+    (tmp_path / "2026-02.pem").write_text(keys.generate_private_key("RS256"))
+    rotated = asymmetric("RS256", keys.KeySet.from_directory("RS256", str(tmp_path)))
+    assert rotated.active_kid == "2026-02"
+    new_token = create_token("00000000-0000-0000-0000-000000000001", TokenType.ACCESS)
+    assert jwt.get_unverified_header(new_token)["kid"] == "2026-02"
+
+    assert User.verify_token(old_token) is not None
+    assert asyncio.run(decode_token(new_token, TokenType.ACCESS))
+
+
+def test_unknown_kid_is_rejected(asymmetric):
+    asymmetric("ES256")
+    token = create_token("user-1", TokenType.ACCESS)
+    asymmetric("ES256")  # keys replaced, old kid no longer published
+    with pytest.raises(HTTPException) as excinfo:
+        asyncio.run(decode_token(token, TokenType.ACCESS))
+    assert excinfo.value.status_code == 401
+
+
+def test_key_set_validation():
+    with pytest.raises(ValueError):
+        keys.KeySet("HS256", {}, "x")
+    with pytest.raises(ValueError):
+        keys.KeySet("RS256", {}, "missing")
+
+
+def test_asymmetric_algorithm_without_keys_fails_startup(monkeypatch):
+    monkeypatch.setattr(keys.settings, "ALGORITHM", "RS256")
+    monkeypatch.setattr(keys.settings, "JWT_KEYS_DIR", None)
+    keys.set_key_set(None)
+    try:
+        with pytest.raises(ValueError, match="JWT_KEYS_DIR"):
+            with TestClient(app):
+                pass
+
+        monkeypatch.setattr(keys.settings, "JWT_EPHEMERAL_KEYS", True)
+        assert keys.get_key_set().algorithm == "RS256"
+    finally:
+        keys.set_key_set(None)
+
+
+def test_jwks_endpoint_is_cacheable(asymmetric):
+    client = TestClient(app)
+    empty = client.get("/.well-known/jwks.json")
+    assert empty.status_code == 200 and empty.json() == {"keys": []}
+
+    key_set = asymmetric("RS256")
+    r = client.get("/.well-known/jwks.json")
+    assert r.status_code == 200
+    assert r.json() == key_set.jwks
+    assert "max-age=" in r.headers["cache-control"]
+    assert r.headers["etag"] == key_set.etag
+
+    r = client.get("/.well-known/jwks.json", headers={"If-None-Match": key_set.etag})
+    assert r.status_code == 304 and r.content == b""
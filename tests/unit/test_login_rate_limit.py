@@ -0,0 +1,118 @@
+# Author: Roopesh Kumar Reddy Kaipa
+# Date: 18/10/2026
+import asyncio
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException, Request
+from fastapi.testclient import TestClient
+
+from app.auth import rate_limit
+from app.auth import jwt as auth_jwt
+from app.main import app
+
+
+def test_sliding_window_frees_up_as_events_age_out(fake_clock):
+    clock = fake_clock
+    clock.now = 1_000.0
+    limiter = rate_limit.SlidingWindowLimiter(f"test:{uuid4().hex}", limit=3, window=60, clock=clock)
+
+    async def scenario():
+        for step in range(3):
+            assert await limiter.hit("k") is None
+            clock.now += 10
+        # oldest event at t=1000 leaves the window at t=1060
+        assert await limiter.hit("k") == 30
+        clock.now = 1_060
+        assert await limiter.hit("k") is None
+        assert await limiter.check("k") == 10
+        await limiter.reset("k")
+        assert await limiter.check("k") is None
+
+    asyncio.run(scenario())
+
+
+@pytest.fixture
+def tight_limits(monkeypatch):
+    prefix = f"test:{uuid4().hex}"
+    monkeypatch.setattr(rate_limit, "ip_limiter", rate_limit.SlidingWindowLimiter(f"{prefix}:ip", 5, 60))
+    monkeypatch.setattr(rate_limit, "user_limiter", rate_limit.SlidingWindowLimiter(f"{prefix}:user", 2, 60))
+
+
+def _request(host="127.0.0.1"):
+    return Request({"type": "http", "client": (host, 0), "headers": []})
+
+
+def _no_hashing(monkeypatch):
+    async def fail(*args, **kwargs):
+        raise AssertionError("throttled logins must not reach bcrypt")
+
+    monkeypatch.setattr(auth_jwt.password_pool, "verify_and_update", fail)
+
+
+def test_failed_logins_throttle_the_username(monkeypatch, tight_limits):
+    client = TestClient(app)
+    username = f"nobody_{uuid4().hex[:8]}"
+    for _ in range(2):
+        r = client.post("/auth/login", json={"username": username, "password": "WrongPass1!"})
+        assert r.status_code == 401
+
+    # other usernames from the same address are still allowed
+    r = client.post("/auth/login", json={"username": f"other_{uuid4().hex[:8]}", "password": "WrongPass1!"})
+    assert r.status_code == 401
+
+    _no_hashing(monkeypatch)
+    r = client.post("/auth/token", data={"username": username, "password": "WrongPass1!"})
+    assert r.status_code == 429
+    assert int(r.headers["Retry-After"]) >= 1
+
+
+def test_client_address_is_throttled_across_usernames(monkeypatch, tight_limits):
+    client = TestClient(app)
+    for _ in range(5):
+        client.post("/auth/login", json={"username": f"spray_{uuid4().hex[:8]}", "password": "WrongPass1!"})
+
+    _no_hashing(monkeypatch)
+    r = client.post("/auth/login", json={"username": f"spray_{uuid4().hex[:8]}", "password": "WrongPass1!"})
+    assert r.status_code == 429
+    assert "Retry-After" in r.headers
+
+
+def test_concurrent_guesses_are_counted_before_hashing(tight_limits):
+    username = f"burst_{uuid4().hex[:8]}"
+
+    async def attempt(host):
+        try:
+            await rate_limit.enforce_login_limits(_request(host), username)
+        except HTTPException as e:
+            return e.status_code
+        await asyncio.sleep(0.05)  # bcrypt, then a wrong password
+        return 401
+
+    async def burst():
+        return await asyncio.gather(*(attempt(f"10.0.0.{i}") for i in range(6)))
+
+    # only the username's two slots get through, although none has failed yet
+    assert sorted(asyncio.run(burst())) == [401, 401, 429, 429, 429, 429]
+
+
+def test_successful_login_clears_the_username_window(tight_limits):
+    async def scenario():
+        await rate_limit.enforce_login_limits(_request(), "returning")
+        await rate_limit.enforce_login_limits(_request(), "returning")
+        await rate_limit.reset_login_failures("returning")
+        await rate_limit.enforce_login_limits(_request(), "returning")
+
+    asyncio.run(scenario())
+
+
+def test_limits_fail_open_when_redis_errors(monkeypatch, tight_limits):
+    import aioredis
+
+    async def broken(*args, **kwargs):
+        raise aioredis.ResponseError("OOM command not allowed when used memory > 'maxmemory'.")
+
+    monkeypatch.setattr(rate_limit.user_limiter, "hit", broken)
+    asyncio.run(rate_limit.enforce_login_limits(_request(), "someone"))
+    monkeypatch.setattr(rate_limit.user_limiter, "reset", broken)
+    asyncio.run(rate_limit.reset_login_failures("someone"))
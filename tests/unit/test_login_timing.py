@@ -0,0 +1,94 @@
+# Author: Roopesh Kumar Reddy Kaipa
+# Date: 18/10/2026
+import asyncio
+import time
+from uuid import uuid4
+
+from fastapi.testclient import TestClient
+
+from app.auth import hashing
+from app.auth import jwt as auth_jwt
+from app.main import app
+from app.models.user import User
+
+
+class CountingVerify:
+    def __init__(self, original):
+        self.original = original
+        self.hashes = []
+
+    async def __call__(self, plain_password, hashed_password):
+        self.hashes.append(hashed_password)
+        return await self.original(plain_password, hashed_password)
+
+
+def test_unknown_user_costs_one_verify_against_a_cached_dummy(monkeypatch, db_session):
+    counting = CountingVerify(auth_jwt.password_pool.verify_and_update)
+    monkeypatch.setattr(auth_jwt.password_pool, "verify_and_update", counting)
+
+    for _ in range(2):
+        result = asyncio.run(User.authenticate_async(db_session, f"ghost_{uuid4().hex[:8]}", "Whatever1!"))
+        assert result is None
+    assert len(counting.hashes) == 2
+    assert counting.hashes[0] == counting.hashes[1]  # the dummy is made once per process
+    assert counting.hashes[0].startswith("$2b$")
+
+
+def test_dummy_hashes_are_built_at_startup(monkeypatch, db_session):
+    pool = hashing.PasswordHashPool(workers=0, max_queue=4, timeout=5)
+    monkeypatch.setattr(auth_jwt, "password_pool", pool)
+    auth_jwt._dummy_hash.cache_clear()
+
+    with TestClient(app):
+        pass
+    assert auth_jwt._dummy_hash.cache_info().currsize == 1
+    built = pool.completed
+
+    # the first unknown-user login pays for one verify and nothing else
+    assert asyncio.run(User.authenticate_async(db_session, f"ghost_{uuid4().hex[:8]}", "Whatever1!")) is None
+    assert pool.completed == built + 1
+    pool.shutdown()
+
+
+def test_known_user_wrong_password_costs_one_verify(monkeypatch, db_session, test_user):
+    test_user.password = auth_jwt.get_password_hash("RightPass1!")
+    db_session.commit()
+    counting = CountingVerify(auth_jwt.password_pool.verify_and_update)
+    monkeypatch.setattr(auth_jwt.password_pool, "verify_and_update", counting)
+    assert asyncio.run(User.authenticate_async(db_session, test_user.username, "WrongPass1!")) is None
+    assert counting.hashes == [test_user.password]
+
+
+def test_sync_authenticate_verifies_against_dummy(monkeypatch, db_session):
+    calls = []
+    original = auth_jwt.pwd_context.verify
+    monkeypatch.setattr(auth_jwt.pwd_context, "verify", lambda p, h: calls.append(h) or original(p, h))
+    assert User.authenticate(db_session, f"ghost_{uuid4().hex[:8]}", "Whatever1!") is None
+    assert len(calls) == 1
+
+
+def test_latency_estimator_tracks_moving_average():
+    estimator = hashing.LatencyEstimator(alpha=0.5)
+    assert estimator.estimate is None
+    estimator.observe(0.2)
+    estimator.observe(0.4)
+    assert abs(estimator.estimate - 0.3) < 1e-9 and estimator.samples == 2
+
+
+def test_padding_stretches_fast_outcomes(monkeypatch, db_session):
+    async def instant(plain_password, hashed_password):
+        return False, None
+
+    monkeypatch.setattr(auth_jwt.password_pool, "verify_and_update", instant)
+    monkeypatch.setattr(auth_jwt.password_pool, "latency", hashing.LatencyEstimator())
+    auth_jwt.password_pool.latency.observe(0.1)
+    monkeypatch.setattr(auth_jwt.settings, "LOGIN_LATENCY_PADDING", True)
+
+    started = time.perf_counter()
+    asyncio.run(User.authenticate_async(db_session, f"ghost_{uuid4().hex[:8]}", "Whatever1!"))
+    assert time.perf_counter() - started >= 0.1 * auth_jwt.settings.LOGIN_LATENCY_PADDING_FACTOR
+
+    monkeypatch.setattr(auth_jwt.settings, "LOGIN_LATENCY_PADDING", False)
+    started = time.perf_counter()
+    asyncio.run(User.authenticate_async(db_session, f"ghost_{uuid4().hex[:8]}", "Whatever1!"))
+    assert time.perf_counter() - started < 0.1
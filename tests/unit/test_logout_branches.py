@@ -89,3 +89,20 @@ def test_exp_in_future_adds_with_ttl(monkeypatch):
     assert calls[0][0] == "future-jti"
     # TTL should be positive
     assert isinstance(calls[0][1], int) and calls[0][1] > 0
+
+
+def test_blacklist_write_failure_fails_closed(monkeypatch):
+    import aioredis
+
+    async def ret_payload(*args, **kwargs):
+        return {"jti": "my-jti", "exp": datetime.now(timezone.utc).timestamp() + 60}
+
+    async def oom(jti, ttl):
+        raise aioredis.ResponseError("OOM command not allowed when used memory > 'maxmemory'.")
+
+    monkeypatch.setattr("app.main.decode_token", ret_payload)
+    monkeypatch.setattr("app.main.add_to_blacklist", oom)
+
+    resp = client.post("/auth/logout", headers=_auth_header())
+    assert resp.status_code == 503
+    assert "Retry-After" in resp.headers
@@ -1,7 +1,9 @@
 # Author: Roopesh Kumar Reddy Kaipa
 # Date: 24/11/2025
+import asyncio
+
 import pytest
-from fastapi import HTTPException
+from fastapi import HTTPException, Request
 
 from app.main import register, login_json, login_form, create_calculation
 from app.schemas.user import UserCreate, UserLogin
@@ -10,6 +12,10 @@ from app.models.user import User
 from fastapi.security import OAuth2PasswordRequestForm
 
 
+def _request():
+    return Request({"type": "http", "client": ("127.0.0.1", 0), "headers": []})
+
+
 def test_register_and_duplicate_direct_call(db_session):
     uc = UserCreate(
         first_name="A",
@@ -20,12 +26,12 @@ def test_register_and_duplicate_direct_call(db_session):
         confirm_password="ValidPass1!"
     )
 
-    user = register(uc, db=db_session)
+    user = asyncio.run(register(uc, db=db_session))
     assert isinstance(user, User)
 
     # duplicate should raise HTTPException
     with pytest.raises(HTTPException) as excinfo:
-        register(uc, db=db_session)
+        asyncio.run(register(uc, db=db_session))
     assert excinfo.value.status_code == 400
 
 
@@ -45,11 +51,11 @@ def test_login_json_invalid_and_form(db_session):
 
     # invalid password
     with pytest.raises(HTTPException):
-        login_json(UserLogin(username="loginuser", password="wrongpass"), db=db_session)
+        asyncio.run(login_json(_request(), UserLogin(username="loginuser", password="wrongpass"), db=db_session))
 
     # form login success
     form = OAuth2PasswordRequestForm(username="loginuser", password="ValidPass1!", scope="")
-    result = login_form(form_data=form, db=db_session)
+    result = asyncio.run(login_form(_request(), form_data=form, db=db_session))
     assert "access_token" in result
 
 
@@ -71,5 +77,5 @@ def test_create_calculation_bad_inputs_raises(monkeypatch, db_session):
     monkeypatch.setattr("app.main.Calculation.create", fake_create)
     calc = CalculationBase(type="addition", inputs=[1, 2])
     with pytest.raises(HTTPException) as excinfo:
-        create_calculation(calc, current_user=u, db=db_session)
+        asyncio.run(create_calculation(calc, current_user=u, db=db_session))
     assert excinfo.value.status_code == 400
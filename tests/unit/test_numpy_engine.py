@@ -0,0 +1,84 @@
+# Author: Roopesh Kumar Reddy Kaipa
+# Date: 18/10/2026
+import random
+import uuid
+
+import pytest
+
+from app.core.config import settings
+from app.models.calculation import Calculation
+from app.operations import numpy_engine
+
+pytest.importorskip("numpy")
+
+
+@pytest.fixture
+def numpy_engine_on(monkeypatch):
+    monkeypatch.setattr(settings, "CALCULATION_ENGINE", "numpy")
+    monkeypatch.setattr(settings, "NUMPY_ENGINE_MIN_INPUTS", 0)
+
+
+@pytest.mark.parametrize("calc_type", numpy_engine.SUPPORTED_TYPES)
+def test_numpy_matches_python_within_tolerance(monkeypatch, calc_type):
+    rng = random.Random(1234)
+    inputs = [rng.uniform(0.5, 2.0) for _ in range(200)]
+    expected = Calculation.create(calc_type, uuid.uuid4(), inputs).get_result()
+
+    monkeypatch.setattr(settings, "CALCULATION_ENGINE", "numpy")
+    monkeypatch.setattr(settings, "NUMPY_ENGINE_MIN_INPUTS", 64)
+    assert numpy_engine.enabled(len(inputs))
+    got = Calculation.create(calc_type, uuid.uuid4(), inputs).get_result()
+    assert isinstance(got, float)
+    assert numpy_engine.isclose(calc_type, got, expected, inputs)
+
+
+def test_small_inputs_stay_on_python_path(monkeypatch):
+    monkeypatch.setattr(settings, "CALCULATION_ENGINE", "numpy")
+    monkeypatch.setattr(settings, "NUMPY_ENGINE_MIN_INPUTS", 64)
+    assert not numpy_engine.enabled(3)
+    assert numpy_engine.enabled()
+    # Pure-Python integer sum is returned unchanged
+    assert Calculation.create("addition", uuid.uuid4(), [1, 2, 3]).get_result() == 6
+
+
+def test_engine_disabled_by_default():
+    assert settings.CALCULATION_ENGINE == "python"
+    assert not numpy_engine.enabled()
+
+
+def test_evaluate_batch_ragged_rows(numpy_engine_on):
+    rows = [[10, 3, 2], [5, 1], [100, 2, 5, 2]]
+    assert Calculation.evaluate_many("subtraction", rows) == [5, 4, 91]
+    assert Calculation.evaluate_many("division", rows) == pytest.approx([10 / 6, 5, 5])
+    assert Calculation.evaluate_many("multiplication", rows) == [60, 5, 2000]
+    assert Calculation.evaluate_many("addition", rows) == [15, 6, 109]
+    assert Calculation.evaluate_many("addition", []) == []
+
+
+def test_numpy_engine_keeps_validation_rules(numpy_engine_on):
+    with pytest.raises(ValueError, match="Cannot divide by zero"):
+        Calculation.create("division", uuid.uuid4(), [1, 2, 0]).get_result()
+    with pytest.raises(ValueError, match="at least two numbers"):
+        Calculation.create("addition", uuid.uuid4(), [1]).get_result()
+    with pytest.raises(ValueError, match="Row 1: Cannot divide by zero"):
+        Calculation.evaluate_many("division", [[1, 2], [3, 0]])
+    with pytest.raises(ValueError, match="Unsupported"):
+        numpy_engine.evaluate("power", [2, 3])
+
+
+def test_evaluate_many_falls_back_for_power(numpy_engine_on):
+    assert Calculation.evaluate_many("power", [[2, 3], [3, 2]]) == [8, 9]
+
+
+@pytest.mark.parametrize("calc_type, rows", [
+    ("division", [[1e-300, 1e-200, 1e-200], [1e300, 1e200, 1e200], [1e300, 1e-10, 2], [1e-300, 1e10, 2]]),
+    ("multiplication", [[1e200, 1e100, 1e8], [1e-200, 1e-100, 1e-8], [1e300, 1e10, 1e-300], [1e-300, 1e-30]]),
+    ("addition", [[1e308, -1e308, 1.0], [1.7e308, 1.7e308]]),
+    ("subtraction", [[1e308, 1e308, -1e308], [-1.7e308, 1.7e308]]),
+])
+def test_numpy_matches_python_near_float_limits(monkeypatch, calc_type, rows):
+    expected = Calculation.evaluate_many(calc_type, rows)
+    monkeypatch.setattr(settings, "CALCULATION_ENGINE", "numpy")
+    results = Calculation.evaluate_many(calc_type, rows)
+    for row, got, want in zip(rows, results, expected):
+        assert numpy_engine.isclose(calc_type, got, want, row), (row, got, want)
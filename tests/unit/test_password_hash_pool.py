@@ -0,0 +1,91 @@
+# Author: Roopesh Kumar Reddy Kaipa
+# Date: 18/10/2026
+import asyncio
+import time
+
+import pytest
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+
+from app.auth import jwt as auth_jwt
+from app.auth.hashing import PasswordHashPool
+from app.main import app
+
+
+def _slow(seconds):
+    time.sleep(seconds)
+    return seconds
+
+
+def test_process_pool_hash_and_verify_roundtrip():
+    pool = PasswordHashPool(workers=1, max_queue=2, timeout=30)
+    try:
+        hashed = asyncio.run(pool.hash("PoolPass123!"))
+        assert auth_jwt.verify_password("PoolPass123!", hashed)
+        assert asyncio.run(pool.verify("PoolPass123!", hashed)) is True
+        assert asyncio.run(pool.verify("wrong", hashed)) is False
+        assert pool.stats()["completed"] == 3
+    finally:
+        pool.shutdown()
+
+
+def test_pool_rejects_when_queue_is_full():
+    pool = PasswordHashPool(workers=0, max_queue=1, timeout=5)
+
+    async def scenario():
+        first = asyncio.create_task(pool.run(_slow, 0.3))
+        second = asyncio.create_task(pool.run(_slow, 0.01))
+        await asyncio.sleep(0.05)
+        assert pool.queue_depth == 1
+        with pytest.raises(HTTPException) as excinfo:
+            await pool.run(_slow, 0.01)
+        assert excinfo.value.status_code == 503
+        assert "Retry-After" in excinfo.value.headers
+        await asyncio.gather(first, second)
+
+    try:
+        asyncio.run(scenario())
+        stats = pool.stats()
+        assert stats["rejected"] == 1
+        assert stats["in_flight"] == 0
+    finally:
+        pool.shutdown()
+
+
+def test_pool_times_out_slow_calls():
+    pool = PasswordHashPool(workers=0, max_queue=1, timeout=0.05)
+    try:
+        with pytest.raises(HTTPException) as excinfo:
+            asyncio.run(pool.run(_slow, 0.3))
+        assert excinfo.value.status_code == 503
+        assert pool.stats()["timeouts"] == 1
+    finally:
+        pool.shutdown()
+
+
+def test_password_hashing_health_endpoint():
+    client = TestClient(app)
+    r = client.get("/health/password-hashing")
+    assert r.status_code == 200
+    assert {"workers", "queue_depth", "in_flight", "rejected"} <= set(r.json())
+
+
+def test_timed_out_call_holds_its_slot_until_it_finishes():
+    pool = PasswordHashPool(workers=0, max_queue=0, timeout=0.05)
+
+    async def scenario():
+        with pytest.raises(HTTPException):
+            await pool.run(_slow, 0.3)
+        # The call is still running on the worker, so it is still in flight
+        # and a new call is turned away instead of queueing behind it.
+        assert pool.stats()["in_flight"] == 1
+        with pytest.raises(HTTPException) as excinfo:
+            await pool.run(_slow, 0.01)
+        assert "saturated" in excinfo.value.detail
+        await asyncio.sleep(0.35)
+        assert pool.stats()["in_flight"] == 0
+
+    try:
+        asyncio.run(scenario())
+    finally:
+        pool.shutdown()
@@ -10,3 +10,47 @@ def test_add_to_blacklist_and_check():
     jti = str(uuid4())
     asyncio.run(auth_redis.add_to_blacklist(jti, exp=1))
     assert asyncio.run(auth_redis.is_blacklisted(jti)) == 1
+
+
+class _RoundTrips:
+    """Client proxy counting commands sent directly or as a pipeline."""
+
+    def __init__(self, client):
+        self._client = client
+        self.count = 0
+
+    def pipeline(self, *args, **kwargs):
+        pipe = self._client.pipeline(*args, **kwargs)
+        execute = pipe.execute
+
+        async def counted_execute(*a, **kw):
+            self.count += 1
+            return await execute(*a, **kw)
+
+        pipe.execute = counted_execute
+        return pipe
+
+    def __getattr__(self, name):
+        attr = getattr(self._client, name)
+
+        async def counted(*args, **kwargs):
+            self.count += 1
+            return await attr(*args, **kwargs)
+
+        return counted
+
+
+def test_bulk_blacklist_and_check_take_one_round_trip(monkeypatch):
+    client = asyncio.run(auth_redis.get_redis())
+    proxy = _RoundTrips(client)
+    monkeypatch.setattr(auth_redis.get_redis, "redis", proxy)
+
+    jtis = [str(uuid4()) for _ in range(1000)]
+    asyncio.run(auth_redis.add_many_to_blacklist({jti: 60 for jti in jtis}))
+    assert proxy.count == 1
+
+    unknown = str(uuid4())
+    result = asyncio.run(auth_redis.are_blacklisted([jtis[0], unknown, jtis[-1]]))
+    assert result == [True, False, True]
+    assert proxy.count == 2
+    assert asyncio.run(auth_redis.are_blacklisted([])) == []
@@ -0,0 +1,61 @@
+# Author: Roopesh Kumar Reddy Kaipa
+# Date: 18/10/2026
+import asyncio
+from datetime import timedelta
+
+import pytest
+from fastapi import HTTPException
+
+from app.auth import jwt as auth_jwt
+from app.auth.cache import get_token_claims
+from app.auth.redis import add_to_blacklist
+from app.models.user import User
+from app.schemas.token import TokenType
+
+
+def _no_decode(*args, **kwargs):
+    raise AssertionError("cached claims should have been used")
+
+
+def test_repeat_decode_skips_verification(monkeypatch):
+    token = auth_jwt.create_token("user-1", TokenType.ACCESS)
+    first = asyncio.run(auth_jwt.decode_token(token, TokenType.ACCESS))
+
+    monkeypatch.setattr(auth_jwt.jwt, "decode", _no_decode)
+    second = asyncio.run(auth_jwt.decode_token(token, TokenType.ACCESS))
+    assert second == first
+
+
+def test_verify_token_shares_the_cache(monkeypatch, test_user):
+    token = auth_jwt.create_token(test_user.id, TokenType.ACCESS)
+    assert User.verify_token(token) == test_user.id
+    assert get_token_claims(token, TokenType.ACCESS.value) is not None
+
+    monkeypatch.setattr("jose.jwt.decode", _no_decode)
+    assert User.verify_token(token) == test_user.id
+
+
+def test_cache_is_scoped_by_token_type():
+    token = auth_jwt.create_token("user-1", TokenType.REFRESH)
+    asyncio.run(auth_jwt.decode_token(token, TokenType.REFRESH))
+    assert get_token_claims(token, TokenType.ACCESS.value) is None
+    with pytest.raises(HTTPException):
+        asyncio.run(auth_jwt.decode_token(token, TokenType.ACCESS))
+
+
+def test_blacklisting_drops_cached_claims():
+    token = auth_jwt.create_token("user-1", TokenType.ACCESS)
+    payload = asyncio.run(auth_jwt.decode_token(token, TokenType.ACCESS))
+
+    asyncio.run(add_to_blacklist(payload["jti"], 60))
+    assert get_token_claims(token, TokenType.ACCESS.value) is None
+    with pytest.raises(HTTPException) as excinfo:
+        asyncio.run(auth_jwt.decode_token(token, TokenType.ACCESS))
+    assert "revoked" in excinfo.value.detail
+
+
+def test_expired_tokens_are_not_cached():
+    token = auth_jwt.create_token("user-1", TokenType.ACCESS, expires_delta=timedelta(seconds=-5))
+    payload = asyncio.run(auth_jwt.decode_token(token, TokenType.ACCESS, verify_exp=False))
+    assert payload["sub"] == "user-1"
+    assert get_token_claims(token, TokenType.ACCESS.value) is None
@@ -54,3 +54,59 @@ def test_update_calculation_power_inputs_validation_422(test_user):
 
     r = client.put(f"/calculations/{calc_id}", headers=_auth_header(token), json={"type": "power", "inputs": [2,3,4]})
     assert r.status_code == 422
+
+
+@pytest.mark.parametrize("payload", [
+    {"type": "power", "inputs": [-8, 0.5]},
+    {"type": "power"},
+])
+def test_update_calculation_change_type_to_complex_result_is_400(db_session, test_user, payload):
+    # (-8) ** 0.5 is complex and must be refused before the UPDATE is issued
+    calc = Calculation.create(calculation_type='addition', user_id=test_user.id, inputs=[-8, 0.5])
+    calc.result = calc.get_result()
+    db_session.add(calc)
+    db_session.commit()
+
+    client = TestClient(app)
+    token = create_token(test_user.id, TokenType.ACCESS)
+
+    r = client.put(f"/calculations/{calc.id}", headers=_auth_header(token), json=payload)
+    assert r.status_code == 400
+    assert r.json()["detail"] == "Result is not a finite real number."
+    body = client.get(f"/calculations/{calc.id}", headers=_auth_header(token)).json()
+    assert body["type"] == "addition" and body["result"] == -7.5
+
+
+def test_update_calculation_change_type_is_one_update(db_session, test_user):
+    from sqlalchemy import event
+    from sqlalchemy.engine import Engine
+
+    calc = Calculation.create(calculation_type='addition', user_id=test_user.id, inputs=[2, 3])
+    db_session.add(calc)
+    db_session.commit()
+    db_session.refresh(calc)
+    created_at = calc.created_at
+
+    statements = []
+
+    def _record(conn, cursor, statement, *args):
+        statements.append(statement.split()[0].upper())
+
+    client = TestClient(app)
+    token = create_token(test_user.id, TokenType.ACCESS)
+    event.listen(Engine, "before_cursor_execute", _record)
+    try:
+        r = client.put(f"/calculations/{calc.id}", headers=_auth_header(token), json={"type": "power"})
+    finally:
+        event.remove(Engine, "before_cursor_execute", _record)
+    assert r.status_code == 200
+    assert r.json()["result"] == 8
+    assert statements.count("UPDATE") == 1
+    assert "DELETE" not in statements and "INSERT" not in statements
+
+    r = client.get(f"/calculations/{calc.id}", headers=_auth_header(token))
+    assert r.json()["type"] == "power"
+    db_session.expunge_all()
+    reloaded = db_session.get(Calculation, calc.id)
+    assert type(reloaded).__name__ == "Power"
+    assert reloaded.created_at == created_at
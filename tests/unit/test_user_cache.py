@@ -0,0 +1,66 @@
+# Author: Roopesh Kumar Reddy Kaipa
+# Date: 18/10/2026
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+
+from app.auth import jwt as auth_jwt
+from app.auth.cache import TTLCache, user_cache
+from app.models.user import User
+
+
+class ExplodingDB:
+    def query(self, model):
+        raise AssertionError("the cache should have answered")
+
+
+def test_ttl_cache_expiry_and_lru_eviction(fake_clock):
+    clock = fake_clock
+    cache = TTLCache(maxsize=2, ttl=10, clock=clock)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1  # "a" is now most recently used
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1 and cache.get("c") == 3
+
+    clock.now = 10
+    assert cache.get("a") is None
+    assert len(cache) == 1
+
+    cache.set("short", 1, ttl=1)
+    clock.now = 11
+    assert cache.get("short") is None
+    assert cache.hits == 3 and cache.misses == 3
+
+
+def test_ttl_cache_disabled_when_empty():
+    cache = TTLCache(maxsize=0, ttl=10)
+    cache.set("a", 1)
+    assert cache.get("a") is None
+
+
+def test_get_current_user_served_from_cache(db_session, test_user):
+    token = auth_jwt.create_token(test_user.id, auth_jwt.TokenType.ACCESS)
+    first = asyncio.run(auth_jwt.get_current_user(token=token, db=db_session))
+    assert first.id == test_user.id
+
+    cached = asyncio.run(auth_jwt.get_current_user(token=token, db=ExplodingDB()))
+    assert isinstance(cached, User)
+    assert cached.id == test_user.id
+    assert cached.username == test_user.username
+
+
+def test_user_update_invalidates_cache(db_session, test_user):
+    token = auth_jwt.create_token(test_user.id, auth_jwt.TokenType.ACCESS)
+    asyncio.run(auth_jwt.get_current_user(token=token, db=db_session))
+    assert user_cache.get(test_user.id) is not None
+
+    test_user.update(is_active=False)
+    db_session.commit()
+    assert user_cache.get(test_user.id) is None
+
+    with pytest.raises(HTTPException) as excinfo:
+        asyncio.run(auth_jwt.get_current_user(token=token, db=db_session))
+    assert "Inactive user" in str(excinfo.value.detail)